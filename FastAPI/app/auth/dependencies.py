@@ -1,14 +1,18 @@
+from collections.abc import AsyncIterator
+from functools import partial
 from typing import Annotated
 
 from fastapi import Depends
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.repositories import TokenRepository
 from app.auth.services import AuthService
-from app.core.db import DbSessionDep
+from app.core.db import DbSessionDep, SessionFactory, session_manager
 from app.core.exceptions import UnauthorizedError
 from app.core.redis_session import RedisDep
 from app.core.security import TokenDep, get_token_payload
+from app.user.cache import user_cache
 from app.user.models import User
 
 
@@ -32,11 +36,33 @@ async def get_current_user(db: DbSessionDep, token: TokenDep) -> User:
     user_id: int = payload.get("id")
     if username is None or user_id is None:
         raise UnauthorizedError("Token payload missing")
+    # Lets commits on this session route the user's next reads to the primary
+    db.info["user_id"] = user_id
+    cached_user = user_cache.get(user_id)
+    if cached_user is not None:
+        return await db.merge(cached_user, load=False)
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
     if user is None:
         raise UnauthorizedError("User not found")
+    user_cache.set(user)
     return user
 
 
 UserDep = Annotated[User, Depends(get_current_user)]
+
+
+async def get_read_db(user: UserDep) -> AsyncIterator[AsyncSession]:
+    async with session_manager.read_session(user.id) as session:
+        yield session
+
+
+ReadSessionDep = Annotated[AsyncSession, Depends(get_read_db)]
+
+
+def get_read_session_factory(user: UserDep) -> SessionFactory:
+    # Streamed bodies outlive request-scoped sessions and open their own
+    return partial(session_manager.read_session, user.id)
+
+
+ReadSessionFactoryDep = Annotated[SessionFactory, Depends(get_read_session_factory)]
@@ -8,12 +8,57 @@ class TokenRepository:
         self.redis = redis
         self.ttl = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600
 
+    @staticmethod
+    def _token_key(jti: str) -> str:
+        return f"refresh:{jti}"
+
+    @staticmethod
+    def _user_key(user_id: int) -> str:
+        return f"refresh_user:{user_id}"
+
     async def add_refresh_token_to_redis(self, jti: str, user_id: int):
-        ttl = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600
-        await self.redis.set(f"refresh:{jti}", user_id, ex=ttl)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._token_key(jti), user_id, ex=self.ttl)
+            pipe.sadd(self._user_key(user_id), jti)
+            pipe.expire(self._user_key(user_id), self.ttl)
+            await pipe.execute()
 
     async def is_refresh_token_valid(self, jti: str) -> bool:
-        return await self.redis.exists(f"refresh:{jti}") == 1
+        return await self.redis.exists(self._token_key(jti)) == 1
+
+    async def delete_refresh_token_from_redis(
+        self, jti: str, user_id: int | None = None
+    ) -> bool:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._token_key(jti))
+            if user_id is not None:
+                pipe.srem(self._user_key(user_id), jti)
+            deleted, *_ = await pipe.execute()
+        return deleted == 1
+
+    async def rotate_refresh_token(
+        self, old_jti: str, new_jti: str, user_id: int
+    ) -> bool:
+        user_key = self._user_key(user_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.getdel(self._token_key(old_jti))
+            pipe.set(self._token_key(new_jti), user_id, ex=self.ttl)
+            pipe.srem(user_key, old_jti)
+            pipe.sadd(user_key, new_jti)
+            pipe.expire(user_key, self.ttl)
+            old_value, *_ = await pipe.execute()
+        if old_value is None:
+            # The old token was already used or revoked, so the new one is
+            # never handed out and is removed again
+            await self.delete_refresh_token_from_redis(new_jti, user_id)
+            return False
+        return True
 
-    async def delete_refresh_token_from_redis(self, jti: str):
-        await self.redis.delete(f"refresh:{jti}")
+    async def revoke_all_refresh_tokens(self, user_id: int) -> int:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.smembers(self._user_key(user_id))
+            pipe.delete(self._user_key(user_id))
+            jtis, _ = await pipe.execute()
+        if not jtis:
+            return 0
+        return await self.redis.delete(*(self._token_key(jti) for jti in jtis))
@@ -4,7 +4,7 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.auth.dependencies import AuthServiceDep
+from app.auth.dependencies import AuthServiceDep, UserDep
 from app.auth.schemas import RefreshTokenRequest, TokenPair
 from app.core.exceptions import UnauthorizedError
 from app.core.rate_limiting import check_and_record_login_attempt, clear_login_attempts
@@ -109,3 +109,8 @@ async def refresh(
 async def logout(auth_service: AuthServiceDep, refresh_token_in: RefreshTokenRequest):
     # response.delete_cookie(key="refresh_token")
     return await auth_service.logout_user(refresh_token_in.refresh_token)
+
+
+@router.post("/logout-all", status_code=200)
+async def logout_all(auth_service: AuthServiceDep, user: UserDep):
+    await auth_service.logout_user_everywhere(user.id)
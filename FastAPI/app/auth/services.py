@@ -8,7 +8,7 @@ from app.core.security import (
     create_access_token,
     create_refresh_token,
     get_token_payload,
-    verify_password,
+    verify_password_async,
 )
 from app.user.models import User
 from app.user.schemas import UserCreate
@@ -24,7 +24,7 @@ class AuthService:
 
     async def authenticate_user(self, email: str, password: str) -> User:
         user = await self.user_service.repo.get_user_by_email(email)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await verify_password_async(password, user.hashed_password):
             logger.warning("Failed login attempt for email=%s", email)
             raise UnauthorizedError("Invalid credentials")
         return user
@@ -50,17 +50,15 @@ class AuthService:
     async def refresh_tokens(self, refresh_token: str) -> tuple[str, str]:
         payload = get_token_payload(refresh_token)
         jti = payload["jti"]
-        if not await self.token_repo.is_refresh_token_valid(jti):
-            logger.warning("Invalid refresh token jti=%s", jti)
-            raise UnauthorizedError("Invalid refresh token")
         username = payload["sub"]
         user_id = payload["id"]
         if not username or not user_id:
             raise UnauthorizedError("Token payload missing")
-        await self.token_repo.delete_refresh_token_from_redis(jti)
         access_token = create_access_token(username, user_id)
         new_refresh_token, new_jti = create_refresh_token(username, user_id)
-        await self.token_repo.add_refresh_token_to_redis(new_jti, user_id)
+        if not await self.token_repo.rotate_refresh_token(jti, new_jti, user_id):
+            logger.warning("Invalid refresh token jti=%s", jti)
+            raise UnauthorizedError("Invalid refresh token")
         logger.info("Refresh token rotated for user_id=%s", user_id)
         return access_token, new_refresh_token
 
@@ -68,8 +66,15 @@ class AuthService:
         payload = get_token_payload(refresh_token)
         jti = payload.get("jti")
         if jti:
-            deleted = await self.token_repo.delete_refresh_token_from_redis(jti)
+            deleted = await self.token_repo.delete_refresh_token_from_redis(
+                jti, payload.get("id")
+            )
             if deleted:
                 logger.info("User logged out, refresh token jti=%s removed", jti)
             else:
                 logger.warning("Logout attempted with non-existent token jti=%s", jti)
+
+    async def logout_user_everywhere(self, user_id: int) -> int:
+        revoked = await self.token_repo.revoke_all_refresh_tokens(user_id)
+        logger.info("Revoked %s refresh tokens for user_id=%s", revoked, user_id)
+        return revoked
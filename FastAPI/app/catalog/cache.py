@@ -0,0 +1,122 @@
+import asyncio
+import heapq
+import logging
+from collections.abc import Iterable
+
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.catalog.repositories import CatalogProductRepository
+from app.catalog.schemas import CatalogProductRead
+from app.core.db import session_manager
+from app.fridge.models import FoodCategory
+
+logger = logging.getLogger(__name__)
+
+CATALOG_CACHE_CHANNEL = "catalog_cache:invalidate"
+
+
+# The whole catalog is kept in process, it is small and changes rarely
+class CatalogCache:
+    def __init__(self):
+        self._products: dict[int, CatalogProductRead] = {}
+        self._by_name: list[tuple[str, CatalogProductRead]] = []
+        self.loaded = False
+        self.loads = 0
+
+    def replace(self, products: Iterable[CatalogProductRead]) -> None:
+        self._products = {product.id: product for product in products}
+        self._index()
+        self.loaded = True
+        self.loads += 1
+
+    def update(self, products: Iterable[CatalogProductRead]) -> None:
+        for product in products:
+            self._products[product.id] = product
+        self._index()
+
+    def _index(self) -> None:
+        self._by_name = sorted(
+            (product.name.casefold(), product) for product in self._products.values()
+        )
+
+    def get(self, product_id: int) -> CatalogProductRead | None:
+        return self._products.get(product_id)
+
+    def products(
+        self, category: FoodCategory | None = None
+    ) -> list[CatalogProductRead]:
+        return [
+            product
+            for _, product in self._by_name
+            if category is None or product.category == category
+        ]
+
+    def search(self, query: str, limit: int) -> list[CatalogProductRead]:
+        # Same ranking as the fridge product search: prefix, word prefix, substring
+        query = query.casefold()
+        matches = []
+        for name, product in self._by_name:
+            if name.startswith(query):
+                rank = 0
+            elif f" {query}" in name:
+                rank = 1
+            elif query in name:
+                rank = 2
+            else:
+                continue
+            matches.append((rank, len(name), name, product.id))
+        return [self._products[match[-1]] for match in heapq.nsmallest(limit, matches)]
+
+    def clear(self) -> None:
+        self._products.clear()
+        self._by_name.clear()
+        self.loaded = False
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._products), "loads": self.loads}
+
+
+catalog_cache = CatalogCache()
+
+
+async def load_catalog(db: AsyncSession) -> None:
+    products = await CatalogProductRepository(db).get_catalog_products()
+    catalog_cache.replace(CatalogProductRead.model_validate(p) for p in products)
+
+
+async def warm_catalog_cache() -> None:
+    try:
+        async with session_manager.session() as db:
+            await load_catalog(db)
+        logger.info(f"Catalog cache warmed with {catalog_cache.stats()['size']} rows")
+    except Exception as e:
+        # Left cold, the first catalog read loads it
+        catalog_cache.clear()
+        logger.warning(f"Failed to warm catalog cache: {e}")
+
+
+async def publish_catalog_change(redis: Redis | None) -> None:
+    if redis is None:
+        return
+    try:
+        await redis.publish(CATALOG_CACHE_CHANNEL, 1)
+    except Exception as e:
+        logger.warning(f"Failed to publish catalog cache invalidation: {e}")
+
+
+async def listen_for_catalog_invalidations(redis: Redis, retry_seconds: int = 5):
+    while True:
+        try:
+            async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(CATALOG_CACHE_CHANNEL)
+                # Changes may have been missed while disconnected
+                await warm_catalog_cache()
+                async for _ in pubsub.listen():
+                    await warm_catalog_cache()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Catalog cache invalidation listener error: {e}")
+            catalog_cache.clear()
+            await asyncio.sleep(retry_seconds)
@@ -0,0 +1,22 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.auth.dependencies import ReadSessionDep
+from app.catalog.services import CatalogService
+from app.core.db import DbSessionDep
+from app.core.redis_session import RedisDep
+
+
+def get_catalog_service(db: DbSessionDep, redis: RedisDep) -> CatalogService:
+    return CatalogService(db, redis)
+
+
+CatalogServiceDep = Annotated[CatalogService, Depends(get_catalog_service)]
+
+
+def get_read_catalog_service(db: ReadSessionDep) -> CatalogService:
+    return CatalogService(db)
+
+
+ReadCatalogServiceDep = Annotated[CatalogService, Depends(get_read_catalog_service)]
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Float, Integer, String
+from sqlalchemy import Enum as SqlEnum
+
+from app.core.db import Base, UpdatedAtMixin
+from app.fridge.models import FoodCategory
+
+
+class CatalogProduct(UpdatedAtMixin, Base):
+    __tablename__ = "catalog_products"
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String, unique=True, nullable=False)
+    calories_100g = Column(Float, nullable=False, default=0)
+    proteins_100g = Column(Float, nullable=False, default=0)
+    fats_100g = Column(Float, nullable=False, default=0)
+    carbs_100g = Column(Float, nullable=False, default=0)
+    category = Column(
+        SqlEnum(FoodCategory, name="food_category", create_type=False),
+        nullable=False,
+    )
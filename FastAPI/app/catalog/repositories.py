@@ -0,0 +1,39 @@
+from collections.abc import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.catalog.models import CatalogProduct
+from app.core.base_repository import BaseRepository
+
+
+class CatalogProductRepository(BaseRepository[CatalogProduct]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, CatalogProduct)
+
+    async def get_catalog_products(self) -> Sequence[CatalogProduct]:
+        result = await self.db.execute(
+            select(CatalogProduct).order_by(CatalogProduct.id)
+        )
+        return result.scalars().all()
+
+    async def upsert_catalog_products(
+        self, rows: list[dict]
+    ) -> Sequence[CatalogProduct]:
+        if self.db.get_bind().dialect.name == "postgresql":
+            upsert = postgresql.insert
+        else:
+            upsert = sqlite.insert
+        stmt = upsert(CatalogProduct).values(rows)
+        update_keys = rows[0].keys() - {"name"}
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=["name"],
+                set_={key: stmt.excluded[key] for key in (*update_keys, "updated_at")},
+            )
+            .returning(CatalogProduct)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
@@ -0,0 +1,41 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Query, Response
+
+from app.auth.dependencies import UserDep
+from app.catalog.dependencies import ReadCatalogServiceDep
+from app.catalog.schemas import CatalogProductRead
+from app.core.responses import model_list_response
+from app.fridge.models import FoodCategory
+
+router = APIRouter(prefix="/catalog", tags=["catalog"])
+
+
+@router.get("/products", response_model=list[CatalogProductRead])
+async def read_catalog_products(
+    catalog_service: ReadCatalogServiceDep,
+    _: UserDep,
+    category: FoodCategory | None = None,
+) -> Response:
+    return model_list_response(
+        CatalogProductRead, await catalog_service.get_catalog_products(category)
+    )
+
+
+@router.get("/products/search", response_model=list[CatalogProductRead])
+async def search_catalog_products(
+    catalog_service: ReadCatalogServiceDep,
+    _: UserDep,
+    q: Annotated[str, Query(min_length=1, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=50)] = 20,
+) -> Response:
+    return model_list_response(
+        CatalogProductRead, await catalog_service.search_catalog_products(q, limit)
+    )
+
+
+@router.get("/products/{product_id}", response_model=CatalogProductRead)
+async def read_catalog_product(
+    catalog_service: ReadCatalogServiceDep, _: UserDep, product_id: int
+) -> CatalogProductRead:
+    return await catalog_service.get_catalog_product(product_id)
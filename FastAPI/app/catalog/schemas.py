@@ -0,0 +1,24 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.fridge.models import FoodCategory
+
+
+class CatalogProductCreate(BaseModel):
+    name: str = Field(pattern=r"^[a-zA-Z0-9\s\-.]+$")
+    calories_100g: float = Field(default=0, ge=0)
+    proteins_100g: float = Field(default=0, ge=0)
+    fats_100g: float = Field(default=0, ge=0)
+    carbs_100g: float = Field(default=0, ge=0)
+    category: FoodCategory
+
+
+class CatalogProductRead(BaseModel):
+    id: int
+    name: str
+    calories_100g: float
+    proteins_100g: float
+    fats_100g: float
+    carbs_100g: float
+    category: FoodCategory
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,79 @@
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.catalog.cache import catalog_cache, load_catalog, publish_catalog_change
+from app.catalog.repositories import CatalogProductRepository
+from app.catalog.schemas import CatalogProductCreate, CatalogProductRead
+from app.fridge.models import FoodCategory
+from app.fridge.repositories import (
+    FridgeMealRepository,
+    FridgeProductRepository,
+    FridgeRepository,
+)
+
+
+class CatalogService:
+    def __init__(self, db: AsyncSession, redis: Redis | None = None):
+        self.db = db
+        self.repo = CatalogProductRepository(db)
+        self.fridge_repo = FridgeRepository(db)
+        self.product_repo = FridgeProductRepository(db)
+        self.meal_repo = FridgeMealRepository(db)
+        self.redis = redis
+
+    async def _ensure_loaded(self) -> None:
+        if not catalog_cache.loaded:
+            await load_catalog(self.db)
+
+    async def get_catalog_products(
+        self, category: FoodCategory | None = None
+    ) -> list[CatalogProductRead]:
+        await self._ensure_loaded()
+        return catalog_cache.products(category)
+
+    async def search_catalog_products(
+        self, query: str, limit: int = 20
+    ) -> list[CatalogProductRead]:
+        query = query.strip()
+        if not query:
+            return []
+        await self._ensure_loaded()
+        return catalog_cache.search(query, limit)
+
+    async def get_catalog_product(self, product_id: int) -> CatalogProductRead:
+        await self._ensure_loaded()
+        product = catalog_cache.get(product_id)
+        if product is None:
+            # Another worker may have added it before our invalidation arrived
+            product = CatalogProductRead.model_validate(
+                await self.repo.get_by_id(product_id)
+            )
+        return product
+
+    async def upsert_catalog_products(
+        self, data: list[CatalogProductCreate]
+    ) -> list[CatalogProductRead]:
+        if not data:
+            return []
+        # keyed by name, a later entry for the same product wins
+        rows = {item.name: item.model_dump() for item in data}
+        products = [
+            CatalogProductRead.model_validate(product)
+            for product in await self.repo.upsert_catalog_products(list(rows.values()))
+        ]
+        catalog_ids = [product.id for product in products]
+        fridge_ids = await self.product_repo.get_catalog_linked_fridge_ids(catalog_ids)
+        if fridge_ids:
+            # Fridge rows are locked before their products and meals, the same
+            # order as the fridge write paths
+            await self.fridge_repo.bump_versions(fridge_ids)
+            linked = await self.product_repo.touch_catalog_products(
+                catalog_ids, fridge_ids
+            )
+            await self.meal_repo.update_meal_totals_for_products(
+                [row.id for row in linked]
+            )
+        await self.repo.commit_or_conflict()
+        catalog_cache.update(products)
+        await publish_catalog_change(self.redis)
+        return products
@@ -27,13 +27,17 @@ class BaseRepository[T]:
     async def refresh(self, instance: T):
         await self.db.refresh(instance)
 
-    async def refresh_and_return(self, instance: T) -> T:
-        await self.db.refresh(instance)
-        return instance
-
     def add(self, instance: T):
         self.db.add(instance)
 
+    async def save(self, instance: T) -> T:
+        self.db.add(instance)
+        await self.commit_or_conflict()
+        return instance
+
+    async def delete(self, instance: T) -> None:
+        await self.db.delete(instance)
+
     async def commit_or_conflict(self) -> None:
         try:
             await self.db.commit()
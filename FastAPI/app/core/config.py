@@ -17,14 +17,46 @@ else:
 class Settings(BaseSettings):
     ENVIRONMENT: str = "dev"
     DATABASE_URL: str = "sqlite+aiosqlite:///:memory:"
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DATABASE_REPLICA_URLS: str | list[str] = []
+    REPLICA_MAX_LAG_SECONDS: float = 5
+    REPLICA_LAG_CHECK_SECONDS: float = 5
+    READ_YOUR_WRITES_SECONDS: float = 5
     SECRET_KEY: str = "default-key"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    INTERNAL_API_TOKEN: str = ""
     REDIS_URL: str = "redis://localhost:6379"
     DEBUG_LOGS: bool = False
     PROJECT_NAME: str = "FastAPI App"
     ALLOWED_ORIGINS: str | list[str] = ["*"]
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 60
+    LATEST_WEIGHT_CACHE_MAX_SIZE: int = 10000
+    LATEST_WEIGHT_CACHE_TTL_SECONDS: int = 300
+    RATE_LIMIT_REDIS_TIMEOUT_SECONDS: float = 0.05
+    LOCAL_RATE_LIMIT_SYNC_SECONDS: float = 5
+    LOCAL_RATE_LIMIT_SYNC_RATIO: float = 0.5
+    LOCAL_RATE_LIMIT_MAX_KEYS: int = 10000
+    GZIP_MINIMUM_SIZE: int = 1024
+    SYNC_CURSOR_OVERLAP_SECONDS: float = 5
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30
+    SYNC_TOMBSTONE_PRUNE_SECONDS: float = 3600
+    PRODUCT_FILE_CHUNK_SIZE: int = 500
+    PRODUCT_IMPORT_MAX_ERRORS: int = 100
+    PRODUCT_IMPORT_MAX_LINE_LENGTH: int = 65536
+    HISTORY_EXPORT_CHUNK_SIZE: int = 1000
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    PASSWORD_POLICY_CACHE_SIZE: int = 1024
+    PASSWORD_POLICY_CACHE_TTL_SECONDS: int = 60
 
     @field_validator("ALLOWED_ORIGINS", mode="before")
     @classmethod
@@ -35,6 +67,13 @@ class Settings(BaseSettings):
             return v
         raise ValueError(v)
 
+    @field_validator("DATABASE_REPLICA_URLS", mode="before")
+    @classmethod
+    def assemble_replica_urls(cls, v: str | list[str]) -> list[str]:
+        if isinstance(v, str) and not v.startswith("["):
+            return [i.strip() for i in v.split(",") if i.strip()]
+        return v
+
     model_config = {
         "env_file": str(env_file),
         "env_file_encoding": "utf-8",
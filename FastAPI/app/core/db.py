@@ -1,34 +1,165 @@
+import asyncio
+import bisect
 import contextlib
-from collections.abc import AsyncIterator
-from typing import Annotated
+import logging
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from datetime import UTC, datetime
+from typing import Annotated, Any
 
 from fastapi import Depends
+from sqlalchemy import (
+    Column,
+    DateTime,
+    QueuePool,
+    event,
+    func,
+    make_url,
+    text,
+)
 from sqlalchemy.ext.asyncio import (
     AsyncConnection,
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import Settings, settings
+
+logger = logging.getLogger(__name__)
 
-from app.core.config import settings
+PRIMARY_WAL_LSN_QUERY = "SELECT pg_current_wal_lsn()::text"
+
+# Zero when the replica has replayed the primary's WAL position, NULL when its
+# WAL receiver is not streaming (reading pg_stat_wal_receiver.status needs the
+# pg_read_all_stats role)
+REPLICA_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT EXISTS (
+        SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming'
+    ) THEN NULL
+    WHEN pg_last_wal_replay_lsn() >= CAST(:primary_lsn AS pg_lsn) THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
 
 
 class Base(DeclarativeBase):
-    pass
+    __mapper_args__ = {"eager_defaults": True}
 
 
-class DBSessionManager:
+def utc_now() -> datetime:
+    return datetime.now(UTC)
+
+
+class UpdatedAtMixin:
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=utc_now,
+        onupdate=utc_now,
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+class WaitTimeHistogram:
+    BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.total_ms = 0.0
+
+    def observe(self, wait_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, wait_ms)] += 1
+        self.total_ms += wait_ms
+
+    def snapshot(self) -> dict[str, Any]:
+        labels = [f"le_{bucket}" for bucket in self.BUCKETS_MS] + ["inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+            "count": sum(self.counts),
+            "total_ms": round(self.total_ms, 3),
+        }
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_histogram = WaitTimeHistogram()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_histogram.observe((time.perf_counter() - start) * 1000)
+
+
+def engine_options(url: str, config: Settings = settings) -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+    }
+    database_url = make_url(url)
+    # SQLite engines use a static or single-thread pool without size limits
+    if database_url.get_backend_name() != "sqlite":
+        options.update(
+            poolclass=TimedAsyncQueuePool,
+            pool_size=config.DB_POOL_SIZE,
+            max_overflow=config.DB_MAX_OVERFLOW,
+            pool_timeout=config.DB_POOL_TIMEOUT,
+        )
+    if database_url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE
+        }
+    return options
+
+
+class _Replica:
     def __init__(self, host: str, **kwargs):
+        self.engine = create_async_engine(host, **kwargs)
+        self.sessionmaker = async_sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=self.engine,
+        )
+        self.lag = 0.0
+
+
+class DBSessionManager:
+    def __init__(
+        self,
+        host: str,
+        replica_hosts: Sequence[str] = (),
+        max_replica_lag: float = 5,
+        read_your_writes_seconds: float = 5,
+        **kwargs,
+    ):
         self._engine = create_async_engine(host, **kwargs)
         self._sessionmaker = async_sessionmaker(
-            autocommit=False, autoflush=False, bind=self._engine
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=self._engine,
         )
+        self._replicas = [_Replica(replica, **kwargs) for replica in replica_hosts]
+        self._next_replica = 0
+        self.max_replica_lag = max_replica_lag
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self._recent_writes: dict[int, float] = {}
 
     async def close(self):
         await self._engine.dispose()
+        for replica in self._replicas:
+            await replica.engine.dispose()
         self._engine = None
         self._sessionmaker = None
+        self._replicas = []
 
     @contextlib.asynccontextmanager
     async def connect(self) -> AsyncIterator[AsyncConnection]:
@@ -40,8 +171,10 @@ class DBSessionManager:
                 raise
 
     @contextlib.asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
-        session = self._sessionmaker()
+    async def _session(self, sessionmaker) -> AsyncIterator[AsyncSession]:
+        session = sessionmaker()
+        session.info["session_manager"] = self
+        session.info["replica"] = sessionmaker is not self._sessionmaker
         try:
             yield session
         except Exception:
@@ -50,12 +183,117 @@ class DBSessionManager:
         finally:
             await session.close()
 
+    def session(self) -> contextlib.AbstractAsyncContextManager[AsyncSession]:
+        return self._session(self._sessionmaker)
+
+    def read_session(
+        self, user_id: int | None = None
+    ) -> contextlib.AbstractAsyncContextManager[AsyncSession]:
+        return self._session(self._read_sessionmaker(user_id))
+
+    def _read_sessionmaker(self, user_id: int | None):
+        if not self._replicas:
+            return self._sessionmaker
+        if user_id is not None:
+            deadline = self._recent_writes.get(user_id)
+            if deadline is not None and deadline > time.monotonic():
+                return self._sessionmaker
+        healthy = [r for r in self._replicas if r.lag <= self.max_replica_lag]
+        if not healthy:
+            return self._sessionmaker
+        self._next_replica = (self._next_replica + 1) % len(healthy)
+        return healthy[self._next_replica].sessionmaker
+
+    def mark_write(self, user_id: int) -> None:
+        if not self._replicas:
+            return
+        now = time.monotonic()
+        if len(self._recent_writes) > 10000:
+            self._recent_writes = {
+                key: deadline
+                for key, deadline in self._recent_writes.items()
+                if deadline > now
+            }
+        self._recent_writes[user_id] = now + self.read_your_writes_seconds
+
+    async def check_replica_lag(self) -> None:
+        if not self._replicas:
+            return
+        try:
+            async with self._engine.connect() as conn:
+                primary_lsn = await conn.scalar(text(PRIMARY_WAL_LSN_QUERY))
+        except Exception as e:
+            logger.warning(f"Primary WAL position check failed: {e}")
+            for replica in self._replicas:
+                replica.lag = float("inf")
+            return
+        for replica in self._replicas:
+            try:
+                async with replica.engine.connect() as conn:
+                    lag = await conn.scalar(
+                        text(REPLICA_LAG_QUERY), {"primary_lsn": primary_lsn}
+                    )
+            except Exception as e:
+                logger.warning(
+                    f"Replica lag check failed for {replica.engine.url}: {e}"
+                )
+                lag = None
+            # An unknown lag, e.g. a replica cut off from the primary, is unhealthy
+            replica.lag = float("inf") if lag is None else float(lag)
+
+    async def monitor_replica_lag(self, interval_seconds: float) -> None:
+        while True:
+            await self.check_replica_lag()
+            await asyncio.sleep(interval_seconds)
+
     @property
     def engine(self):
         return self._engine
 
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self._replicas)
+
+    def pool_stats(self) -> dict[str, Any]:
+        stats = self._engine_pool_stats(self._engine)
+        if self._replicas:
+            stats["replicas"] = [
+                {**self._engine_pool_stats(replica.engine), "lag": replica.lag}
+                for replica in self._replicas
+            ]
+        return stats
+
+    @staticmethod
+    def _engine_pool_stats(engine: AsyncEngine) -> dict[str, Any]:
+        pool = engine.pool
+        stats: dict[str, Any] = {"pool": type(pool).__name__}
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=max(pool.overflow(), 0),
+            )
+        if isinstance(pool, TimedAsyncQueuePool):
+            stats["wait_ms"] = pool.wait_histogram.snapshot()
+        return stats
 
-session_manager = DBSessionManager(settings.DATABASE_URL)
+
+@event.listens_for(Session, "after_commit")
+def _mark_user_write(session: Session) -> None:
+    manager = session.info.get("session_manager")
+    user_id = session.info.get("user_id")
+    if manager is not None and user_id is not None:
+        manager.mark_write(user_id)
+
+
+session_manager = DBSessionManager(
+    settings.DATABASE_URL,
+    replica_hosts=settings.DATABASE_REPLICA_URLS,
+    max_replica_lag=settings.REPLICA_MAX_LAG_SECONDS,
+    read_your_writes_seconds=settings.READ_YOUR_WRITES_SECONDS,
+    **engine_options(settings.DATABASE_URL),
+)
 
 
 async def get_db():
@@ -64,3 +302,5 @@ async def get_db():
 
 
 DbSessionDep = Annotated[AsyncSession, Depends(get_db)]
+
+SessionFactory = Callable[[], contextlib.AbstractAsyncContextManager[AsyncSession]]
@@ -3,7 +3,14 @@ from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 from starlette.status import HTTP_429_TOO_MANY_REQUESTS
 
-from app.core.exceptions import ConflictError, NotFoundError, UnauthorizedError
+from app.core.exceptions import (
+    BadRequestError,
+    ConflictError,
+    NotFoundError,
+    TooManyRequestsError,
+    UnauthorizedError,
+    UnprocessableEntityError,
+)
 
 
 def register_exception_handlers(app: FastAPI):
@@ -11,6 +18,10 @@ def register_exception_handlers(app: FastAPI):
     async def not_found_exception_handler(request: Request, exc: NotFoundError):
         return JSONResponse(content={"message": str(exc)}, status_code=404)
 
+    @app.exception_handler(BadRequestError)
+    async def bad_request_exception_handler(request: Request, exc: BadRequestError):
+        return JSONResponse(content={"message": str(exc)}, status_code=400)
+
     @app.exception_handler(ConflictError)
     async def conflict_exception_handler(request: Request, exc: ConflictError):
         return JSONResponse(content={"message": str(exc)}, status_code=409)
@@ -19,6 +30,22 @@ def register_exception_handlers(app: FastAPI):
     async def unauthorized_exception_handler(request: Request, exc: UnauthorizedError):
         return JSONResponse(content={"message": str(exc)}, status_code=401)
 
+    @app.exception_handler(UnprocessableEntityError)
+    async def unprocessable_entity_exception_handler(
+        request: Request, exc: UnprocessableEntityError
+    ):
+        return JSONResponse(content={"message": str(exc)}, status_code=422)
+
+    @app.exception_handler(TooManyRequestsError)
+    async def too_many_requests_error_handler(
+        request: Request, exc: TooManyRequestsError
+    ):
+        return JSONResponse(
+            content={"message": str(exc)},
+            status_code=HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": "1"},
+        )
+
     @app.exception_handler(SQLAlchemyError)
     async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
         return JSONResponse(
@@ -2,9 +2,21 @@ class NotFoundError(Exception):
     pass
 
 
+class BadRequestError(Exception):
+    pass
+
+
 class ConflictError(Exception):
     pass
 
 
 class UnauthorizedError(Exception):
     pass
+
+
+class UnprocessableEntityError(Exception):
+    pass
+
+
+class TooManyRequestsError(Exception):
+    pass
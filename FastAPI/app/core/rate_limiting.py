@@ -1,49 +1,207 @@
+import asyncio
 import logging
+import time
+import uuid
+from collections import deque
+from math import ceil
 
-from fastapi import HTTPException, Request
+from fastapi import HTTPException, Request, Response, status
+from fastapi_limiter import FastAPILimiter
 from fastapi_limiter.depends import RateLimiter
 from redis.asyncio import Redis
+from redis.exceptions import RedisError
 
 from app.core.config import settings
+from app.core.redis_session import RedisDep
 
 logger = logging.getLogger(__name__)
 
 
-async def check_and_record_login_attempt(
-    username: str, redis: Redis, max_attempts: int = 5, window_seconds: int = 600
-):
-    key = f"login_attempt:{username}"
+class LocalSlidingWindow:
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._attempts: dict[str, deque[float]] = {}
+
+    def hit(self, key: str, max_attempts: int, window_seconds: int) -> tuple[int, int]:
+        now = time.monotonic()
+        if key not in self._attempts and len(self._attempts) >= self.max_keys:
+            self._attempts = {
+                k: v
+                for k, v in self._attempts.items()
+                if v and v[-1] > now - window_seconds
+            }
+        attempts = self._attempts.setdefault(key, deque())
+        while attempts and attempts[0] <= now - window_seconds:
+            attempts.popleft()
+        if len(attempts) >= max_attempts:
+            return len(attempts) + 1, ceil(attempts[0] + window_seconds - now)
+        attempts.append(now)
+        return len(attempts), 0
+
+    def clear(self, key: str) -> None:
+        self._attempts.pop(key, None)
+
+
+class AttemptLimiter:
+    def __init__(
+        self,
+        prefix: str,
+        max_attempts: int,
+        window_seconds: int,
+        redis_timeout: float = settings.RATE_LIMIT_REDIS_TIMEOUT_SECONDS,
+    ):
+        self.prefix = prefix
+        self.max_attempts = max_attempts
+        self.window_seconds = window_seconds
+        self.redis_timeout = redis_timeout
+        self.local = LocalSlidingWindow()
+
+    def _key(self, identifier: str) -> str:
+        return f"{self.prefix}:{identifier}"
 
-    try:
-        current = await redis.get(key)
+    async def _redis_hit(self, key: str, redis: Redis) -> tuple[int, int]:
+        # A sorted set of attempt times gives a sliding window, so a burst
+        # across a fixed window boundary cannot double the limit
+        now = time.time()
+        member = uuid.uuid4().hex
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.zremrangebyscore(key, "-inf", now - self.window_seconds)
+            pipe.zadd(key, {member: now})
+            pipe.zcard(key)
+            pipe.zrange(key, 0, 0, withscores=True)
+            pipe.expire(key, self.window_seconds)
+            _, _, attempts, oldest, _ = await pipe.execute()
+        if attempts <= self.max_attempts:
+            return attempts, 0
+        # Blocked attempts are dropped, so they neither extend the lockout nor
+        # grow the set past the limit
+        await redis.zrem(key, member)
+        return attempts, ceil(oldest[0][1] + self.window_seconds - now)
 
-        if current and int(current) >= max_attempts:
-            ttl = await redis.ttl(key)
-            minutes = max(1, ttl // 60)
+    async def hit(self, identifier: str, redis: Redis) -> None:
+        key = self._key(identifier)
+        try:
+            attempts, retry_after = await asyncio.wait_for(
+                self._redis_hit(key, redis), self.redis_timeout
+            )
+        except Exception as e:
+            logger.error(f"Redis error in rate limiting for {identifier}: {e}")
+            attempts, retry_after = self.local.hit(
+                key, self.max_attempts, self.window_seconds
+            )
+        if attempts > self.max_attempts:
+            minutes = max(1, ceil(retry_after / 60))
             raise HTTPException(
                 status_code=429,
                 detail=f"Too many attempts. Retry in {minutes} minutes.",
             )
-        attempts = await redis.incr(key)
 
-        if attempts == 1:
-            await redis.expire(key, window_seconds)
+    async def clear(self, identifier: str, redis: Redis) -> None:
+        key = self._key(identifier)
+        self.local.clear(key)
+        try:
+            await redis.delete(key)
+        except Exception as e:
+            logger.warning(f"Failed to clear login attempts for {identifier}: {e}")
+
+    async def __call__(self, request: Request, redis: RedisDep) -> None:
+        client = request.client.host if request.client else "unknown"
+        await self.hit(f"{request.url.path}:{client}", redis)
+
+
+login_attempt_limiter = AttemptLimiter(
+    "login_attempt", max_attempts=5, window_seconds=600
+)
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Redis error in rate limiting for {username}: {e}")
+
+async def check_and_record_login_attempt(username: str, redis: Redis):
+    await login_attempt_limiter.hit(username, redis)
 
 
 async def clear_login_attempts(
     username: str,
     redis: Redis,
 ):
-    key = f"login_attempt:{username}"
-    try:
-        await redis.delete(key)
-    except Exception as e:
-        logger.warning(f"Failed to clear login attempts for {username}: {e}")
+    await login_attempt_limiter.clear(username, redis)
+
+
+class LocalTokenBucket:
+    def __init__(self, capacity: int, refill_per_second: float, now: float):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.tokens = float(capacity)
+        self.updated_at = now
+        self.synced_at = now
+
+    def refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+        self.updated_at = now
+
+    def take(self, now: float) -> int:
+        self.refill(now)
+        if self.tokens < 1:
+            return ceil((1 - self.tokens) / self.refill_per_second * 1000)
+        self.tokens -= 1
+        return 0
+
+
+class LocalRateLimiter(RateLimiter):
+    def __init__(
+        self,
+        times: int,
+        seconds: int,
+        sync_seconds: float = settings.LOCAL_RATE_LIMIT_SYNC_SECONDS,
+        sync_ratio: float = settings.LOCAL_RATE_LIMIT_SYNC_RATIO,
+        max_keys: int = settings.LOCAL_RATE_LIMIT_MAX_KEYS,
+        **kwargs,
+    ):
+        super().__init__(times=times, seconds=seconds, **kwargs)
+        self.sync_seconds = sync_seconds
+        self.sync_tokens = times * sync_ratio
+        self.max_keys = max_keys
+        self._buckets: dict[str, LocalTokenBucket] = {}
+
+    def _bucket(self, key: str, now: float) -> LocalTokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                for existing in self._buckets.values():
+                    existing.refill(now)
+                self._buckets = {
+                    k: b for k, b in self._buckets.items() if b.tokens < b.capacity
+                }
+            bucket = LocalTokenBucket(
+                self.times, self.times * 1000 / self.milliseconds, now
+            )
+            # new buckets sync immediately so other workers' hits are seen
+            bucket.synced_at = now - self.sync_seconds
+            self._buckets[key] = bucket
+        return bucket
+
+    async def __call__(self, request: Request, response: Response):
+        identifier = self.identifier or FastAPILimiter.identifier
+        callback = self.callback or FastAPILimiter.http_callback
+        now = time.monotonic()
+        bucket = self._bucket(await identifier(request), now)
+        pexpire = bucket.take(now)
+        if pexpire:
+            return await callback(request, response, pexpire)
+        if (
+            bucket.tokens > self.sync_tokens
+            and now - bucket.synced_at < self.sync_seconds
+        ):
+            return None
+        bucket.synced_at = now
+        try:
+            return await super().__call__(request, response)
+        except HTTPException as e:
+            if e.status_code == status.HTTP_429_TOO_MANY_REQUESTS:
+                bucket.tokens = 0
+            raise
+        except RedisError as e:
+            logger.error(f"Redis error in rate limiter, using local bucket: {e}")
+            return None
 
 
 def rate_limiter(times: int, seconds: int):
@@ -54,4 +212,4 @@ def rate_limiter(times: int, seconds: int):
                 return 0
 
         return MockLimiter()
-    return RateLimiter(times=times, seconds=seconds)
+    return LocalRateLimiter(times=times, seconds=seconds)
@@ -0,0 +1,46 @@
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
+
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+@cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def model_list_response(
+    model: type[BaseModel], rows: Iterable[Any], headers: dict[str, str] | None = None
+) -> Response:
+    # validate and dump to bytes in one pass, skipping response_model's
+    # intermediate python objects and json.dumps
+    adapter = _list_adapter(model)
+    body = adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def etag_headers(etag: str) -> dict[str, str]:
+    # clients may keep the body but must revalidate before reusing it
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def not_modified_response(request: Request, etag: str) -> Response | None:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    # If-None-Match uses the weak comparison, the W/ prefix is ignored
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if "*" not in tags and etag.removeprefix("W/") not in tags:
+        return None
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag)
+    )
@@ -0,0 +1,42 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from app.catalog.cache import catalog_cache
+from app.catalog.dependencies import CatalogServiceDep
+from app.catalog.schemas import CatalogProductCreate, CatalogProductRead
+from app.core.db import session_manager
+from app.core.security import token_payload_cache, verify_internal_token
+from app.measurements.cache import latest_weight_cache
+from app.user.cache import user_cache
+from app.user.password_policy import password_policy
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(verify_internal_token)],
+)
+
+
+@router.get("/cache-stats")
+async def read_cache_stats() -> dict[str, dict[str, float]]:
+    return {
+        "users": user_cache.stats(),
+        "tokens": token_payload_cache.stats(),
+        "password_policy": password_policy.stats(),
+        "catalog": catalog_cache.stats(),
+        "latest_weight": latest_weight_cache.stats(),
+    }
+
+
+@router.get("/pool-stats")
+async def read_pool_stats() -> dict[str, Any]:
+    return session_manager.pool_stats()
+
+
+@router.put("/catalog/products", response_model=list[CatalogProductRead])
+async def upsert_catalog_products(
+    catalog_service: CatalogServiceDep, products_in: list[CatalogProductCreate]
+) -> list[CatalogProductRead]:
+    return await catalog_service.upsert_catalog_products(products_in)
@@ -1,4 +1,11 @@
+import asyncio
+import hashlib
+import hmac
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
 
@@ -6,11 +13,11 @@ import argon2
 from argon2 import PasswordHasher
 from argon2.exceptions import InvalidHashError, VerificationError, VerifyMismatchError
 from fastapi import Depends
-from fastapi.security import OAuth2PasswordBearer
+from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
 from jose import JWTError, jwt
 
 from app.core.config import settings
-from app.core.exceptions import UnauthorizedError
+from app.core.exceptions import TooManyRequestsError, UnauthorizedError
 
 argon2_context = PasswordHasher(
     time_cost=3,
@@ -22,9 +29,60 @@ argon2_context = PasswordHasher(
 )
 
 
+class PasswordHashingExecutor:
+    def __init__(self, max_workers: int, max_pending: int):
+        self._max_workers = max_workers
+        self._capacity = max_workers + max_pending
+        self._executor: ThreadPoolExecutor | None = None
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    async def run[R](self, func: Callable[..., R], *args) -> R:
+        if self._in_flight >= self._capacity:
+            raise TooManyRequestsError("Server is busy, please try again later")
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+password_hashing_executor = PasswordHashingExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+)
+
+
 oauth2_bearer = OAuth2PasswordBearer(tokenUrl="auth/token")
 TokenDep = Annotated[str, Depends(oauth2_bearer)]
 
+internal_token_header = APIKeyHeader(name="X-Internal-Token", auto_error=False)
+
+
+def verify_internal_token(
+    token: Annotated[str | None, Depends(internal_token_header)],
+) -> None:
+    # An empty INTERNAL_API_TOKEN leaves the internal endpoints closed
+    expected = settings.INTERNAL_API_TOKEN
+    if not expected or not token or not hmac.compare_digest(token, expected):
+        raise UnauthorizedError("Invalid internal token")
+
 
 def get_hashed_password(password: str) -> str:
     return argon2_context.hash(password)
@@ -38,6 +96,16 @@ def verify_password(password: str, hashed_password: str) -> bool:
         return False
 
 
+async def hash_password(password: str) -> str:
+    return await password_hashing_executor.run(get_hashed_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    return await password_hashing_executor.run(
+        verify_password, password, hashed_password
+    )
+
+
 def create_access_token(username: str, user_id: int) -> str:
     expires_delta = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     expires = datetime.now(UTC) + expires_delta
@@ -54,8 +122,59 @@ def create_refresh_token(username: str, user_id: int) -> tuple[str, str]:
     return token, jti
 
 
-def get_token_payload(token: str) -> dict:
+class TokenPayloadCache:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict | None:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(entry[1])
+
+    def set(self, token: str, payload: dict) -> None:
+        expires = payload.get("exp")
+        if not isinstance(expires, int | float):
+            return
+        key = self._key(token)
+        self._entries[key] = (expires, dict(payload))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+token_payload_cache = TokenPayloadCache(max_size=settings.TOKEN_CACHE_MAX_SIZE)
+
+
+def decode_token(token: str) -> dict:
     try:
         return jwt.decode(token, settings.SECRET_KEY, algorithms=settings.ALGORITHM)
     except JWTError:
         raise UnauthorizedError("Invalid or expired token") from None
+
+
+def get_token_payload(token: str) -> dict:
+    payload = token_payload_cache.get(token)
+    if payload is None:
+        payload = decode_token(token)
+        token_payload_cache.set(token, payload)
+    return payload
@@ -1,9 +1,9 @@
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import inspect, select
 
-from app.auth.dependencies import UserDep
+from app.auth.dependencies import ReadSessionDep, UserDep
 from app.core.db import DbSessionDep
 from app.core.exceptions import NotFoundError
 from app.fridge.models import Fridge
@@ -17,7 +17,17 @@ def get_fridge_service(db: DbSessionDep) -> FridgeService:
 FridgeServiceDep = Annotated[FridgeService, Depends(get_fridge_service)]
 
 
+def get_read_fridge_service(db: ReadSessionDep) -> FridgeService:
+    return FridgeService(db)
+
+
+ReadFridgeServiceDep = Annotated[FridgeService, Depends(get_read_fridge_service)]
+
+
 async def get_fridge(db: DbSessionDep, user: UserDep) -> Fridge:
+    # User.fridge is joined-loaded by get_current_user and kept by the user cache
+    if "fridge" not in inspect(user).unloaded and user.fridge is not None:
+        return user.fridge
     result = await db.execute(select(Fridge).where(Fridge.user_id == user.id))
     fridge = result.scalar_one_or_none()
     if fridge is None:
@@ -1,18 +1,25 @@
 from enum import Enum
 
 from sqlalchemy import (
+    DDL,
     Boolean,
+    CheckConstraint,
     Column,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
+    event,
+    func,
+    select,
 )
 from sqlalchemy import Enum as SqlEnum
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
-from app.core.db import Base
+from app.core.db import Base, UpdatedAtMixin
 
 
 class FoodCategory(str, Enum):
@@ -33,6 +40,7 @@ class Fridge(Base):
     user_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False
     )
+    version = Column(Integer, nullable=False, default=0, server_default="0")
 
     user = relationship("User", back_populates="fridge")
     fridge_meals = relationship(
@@ -43,7 +51,43 @@ class Fridge(Base):
     )
 
 
-class FridgeMeal(Base):
+def _override_default(context) -> float | None:
+    # Products outside the catalog keep the zero default
+    if context.get_current_parameters().get("catalog_product_id") is None:
+        return 0
+    return None
+
+
+def _catalog_value(column: str) -> hybrid_property:
+    # A NULL override falls back to the linked catalog product
+    override = f"{column}_override"
+
+    def get(self):
+        value = getattr(self, override)
+        if value is None and self.catalog_product is not None:
+            return getattr(self.catalog_product, column)
+        return value
+
+    def set(self, value):
+        setattr(self, override, value)
+
+    def expression(cls):
+        from app.catalog.models import CatalogProduct
+
+        return func.coalesce(
+            getattr(cls, override),
+            select(getattr(CatalogProduct, column))
+            .where(CatalogProduct.id == cls.catalog_product_id)
+            .scalar_subquery(),
+        )
+
+    def update_expression(cls, value):
+        return [(getattr(cls, override), value)]
+
+    return hybrid_property(get, set, expr=expression, update_expr=update_expression)
+
+
+class FridgeMeal(UpdatedAtMixin, Base):
     __tablename__ = "fridge_meals"
     id = Column(Integer, primary_key=True, index=True)
     fridge_id = Column(
@@ -54,8 +98,15 @@ class FridgeMeal(Base):
     )
     name = Column(String, index=True, nullable=False)
     is_favourite = Column(Boolean, index=True, nullable=False, default=False)
+    calories = Column(Float, nullable=False, default=0, server_default="0")
+    proteins = Column(Float, nullable=False, default=0, server_default="0")
+    fats = Column(Float, nullable=False, default=0, server_default="0")
+    carbs = Column(Float, nullable=False, default=0, server_default="0")
+    weight = Column(Float, nullable=False, default=0, server_default="0")
+    products_count = Column(Integer, nullable=False, default=0, server_default="0")
     __table_args__ = (
         UniqueConstraint("fridge_id", "name", name="un_fridge_meal_name"),
+        Index("ix_fridge_meals_fridge_id_updated_at", "fridge_id", "updated_at"),
     )
 
     fridge = relationship("Fridge", back_populates="fridge_meals")
@@ -66,7 +117,7 @@ class FridgeMeal(Base):
     )
 
 
-class FridgeProduct(Base):
+class FridgeProduct(UpdatedAtMixin, Base):
     __tablename__ = "fridge_products"
     id = Column(Integer, primary_key=True, index=True)
     fridge_id = Column(
@@ -75,18 +126,40 @@ class FridgeProduct(Base):
         index=True,
         nullable=False,
     )
+    catalog_product_id = Column(
+        Integer, ForeignKey("catalog_products.id"), index=True, nullable=True
+    )
     product_name = Column(String, index=True, nullable=False)
-    calories_100g = Column(Float, nullable=False, default=0)
-    proteins_100g = Column(Float, nullable=False, default=0)
-    fats_100g = Column(Float, nullable=False, default=0)
-    carbs_100g = Column(Float, nullable=False, default=0)
+    calories_100g_override = Column("calories_100g", Float, default=_override_default)
+    proteins_100g_override = Column("proteins_100g", Float, default=_override_default)
+    fats_100g_override = Column("fats_100g", Float, default=_override_default)
+    carbs_100g_override = Column("carbs_100g", Float, default=_override_default)
+    calories_100g = _catalog_value("calories_100g")
+    proteins_100g = _catalog_value("proteins_100g")
+    fats_100g = _catalog_value("fats_100g")
+    carbs_100g = _catalog_value("carbs_100g")
     category = Column(SqlEnum(FoodCategory, index=True, name="food_category"))
     is_favourite = Column(Boolean, index=True, nullable=False, default=False)
     __table_args__ = (
         UniqueConstraint("fridge_id", "product_name", name="un_fridge_product_name"),
+        CheckConstraint(
+            "catalog_product_id IS NOT NULL OR (calories_100g IS NOT NULL "
+            "AND proteins_100g IS NOT NULL AND fats_100g IS NOT NULL "
+            "AND carbs_100g IS NOT NULL)",
+            name="ck_fridge_product_values",
+        ),
+        Index("ix_fridge_products_fridge_id_updated_at", "fridge_id", "updated_at"),
+        Index(
+            "ix_fridge_products_product_name_trgm",
+            "product_name",
+            postgresql_using="gin",
+            postgresql_ops={"product_name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
 
     fridge = relationship("Fridge", back_populates="fridge_products")
+    # Catalog rows are tiny and shared, joining them keeps product reads one query
+    catalog_product = relationship("CatalogProduct", lazy="joined")
     fridge_meal_ingredient = relationship(
         "FridgeMealIngredient",
         back_populates="fridge_product",
@@ -94,7 +167,14 @@ class FridgeProduct(Base):
     )
 
 
-class FridgeMealIngredient(Base):
+event.listen(
+    FridgeProduct.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+
+class FridgeMealIngredient(UpdatedAtMixin, Base):
     __tablename__ = "fridge_meal_ingredients"
     id = Column(Integer, primary_key=True, index=True)
     weight = Column(Float, nullable=False)
@@ -107,6 +187,13 @@ class FridgeMealIngredient(Base):
     fridge_product_id = Column(
         Integer, ForeignKey("fridge_products.id", ondelete="CASCADE"), nullable=False
     )
+    __table_args__ = (
+        Index(
+            "ix_fridge_meal_ingredients_fridge_meal_id_updated_at",
+            "fridge_meal_id",
+            "updated_at",
+        ),
+    )
 
     fridge_meal = relationship("FridgeMeal", back_populates="ingredients")
     fridge_product = relationship(
@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+
+from app.fridge.models import FridgeProduct
+from app.fridge.schemas import FridgeProductCreate
+from app.utils.enums import FileFormat
+
+PRODUCT_FIELDS = list(FridgeProductCreate.model_fields)
+
+
+async def read_product_records(
+    lines: AsyncIterator[str], file_format: FileFormat
+) -> AsyncIterator[tuple[int, dict | str]]:
+    """Yield (line number, record) pairs, or an error message for unreadable lines.
+
+    CSV input needs a header row and one record per line.
+    """
+    header = None
+    line_no = 0
+    async for line in lines:
+        line_no += 1
+        if not line.strip():
+            continue
+        if file_format == FileFormat.JSONL:
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_no, f"Invalid JSON: {e}"
+                continue
+            if not isinstance(record, dict):
+                yield line_no, "Expected a JSON object"
+                continue
+            yield line_no, record
+            continue
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield line_no, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        row = zip(header, values, strict=True)
+        yield line_no, {name: value for name, value in row if value}
+
+
+def _product_row(product: FridgeProduct) -> dict:
+    row = {field: getattr(product, field) for field in PRODUCT_FIELDS}
+    row["category"] = product.category.value if product.category else None
+    return row
+
+
+def format_products(products: Sequence[FridgeProduct], file_format: FileFormat) -> str:
+    rows = [_product_row(product) for product in products]
+    if file_format == FileFormat.JSONL:
+        return "".join(json.dumps(row) + "\n" for row in rows)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, PRODUCT_FIELDS, lineterminator="\n")
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def format_header(file_format: FileFormat) -> str:
+    if file_format == FileFormat.JSONL:
+        return ""
+    return ",".join(PRODUCT_FIELDS) + "\n"
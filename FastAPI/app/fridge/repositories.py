@@ -1,18 +1,115 @@
-from collections.abc import Sequence
-
-from sqlalchemy import Row, func, literal, select
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from collections.abc import Collection, Sequence
+
+from sqlalchemy import (
+    Float,
+    Row,
+    case,
+    delete,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.core.base_repository import BaseRepository
+from app.core.db import utc_now
 from app.core.exceptions import NotFoundError
 from app.fridge.models import (
+    Fridge,
     FridgeMeal,
     FridgeMealIngredient,
     FridgeProduct,
 )
-from app.utils.enums import NutrientType
+from app.sync.models import SyncTombstone
+from app.utils.enums import NutrientType, nutrient_type_list
+
+
+def _update_meal_totals_stmt(*criteria):
+    def ingredient_total(expr):
+        return (
+            select(func.coalesce(expr, 0))
+            .select_from(FridgeMealIngredient)
+            .outerjoin(
+                FridgeProduct,
+                FridgeMealIngredient.fridge_product_id == FridgeProduct.id,
+            )
+            .where(FridgeMealIngredient.fridge_meal_id == FridgeMeal.id)
+            .scalar_subquery()
+        )
+
+    def calc_macro(column_name):
+        return ingredient_total(
+            func.sum(
+                (getattr(FridgeProduct, column_name) * FridgeMealIngredient.weight)
+                / 100
+            )
+        )
+
+    return (
+        update(FridgeMeal)
+        .where(*criteria)
+        .values(
+            calories=calc_macro("calories_100g"),
+            proteins=calc_macro("proteins_100g"),
+            fats=calc_macro("fats_100g"),
+            carbs=calc_macro("carbs_100g"),
+            products_count=ingredient_total(func.count(FridgeMealIngredient.id)),
+            weight=ingredient_total(func.sum(FridgeMealIngredient.weight)),
+        )
+        .returning(FridgeMeal)
+        .execution_options(synchronize_session="fetch")
+    )
+
+
+def _ingredient_criteria(fridge_id: int, meal_id: int, ingredient_id: int):
+    return (
+        FridgeMealIngredient.id == ingredient_id,
+        FridgeMealIngredient.fridge_meal_id == meal_id,
+        FridgeMealIngredient.fridge_meal_id.in_(
+            select(FridgeMeal.id).where(
+                FridgeMeal.id == meal_id, FridgeMeal.fridge_id == fridge_id
+            )
+        ),
+    )
+
+
+class FridgeRepository(BaseRepository[Fridge]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, Fridge)
+
+    async def bump_version(self, fridge_id: int) -> None:
+        await self.bump_versions([fridge_id])
+
+    async def bump_versions(self, fridge_ids: Collection[int]) -> None:
+        if len(fridge_ids) > 1:
+            # Take the row locks in id order so multi-fridge writes cannot
+            # deadlock each other
+            await self.db.execute(
+                select(Fridge.id)
+                .where(Fridge.id.in_(fridge_ids))
+                .order_by(Fridge.id)
+                .with_for_update()
+            )
+        await self.db.execute(
+            update(Fridge)
+            .where(Fridge.id.in_(fridge_ids))
+            .values(version=Fridge.version + 1)
+        )
+
+    async def get_version(self, fridge_id: int) -> int:
+        result = await self.db.execute(
+            select(Fridge.version).where(Fridge.id == fridge_id)
+        )
+        version = result.scalar_one_or_none()
+        if version is None:
+            raise NotFoundError("Fridge not found")
+        return version
 
 
 class FridgeProductRepository(BaseRepository[FridgeProduct]):
@@ -24,6 +121,88 @@ class FridgeProductRepository(BaseRepository[FridgeProduct]):
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
+    async def get_fridge_product_page(
+        self, fridge_id: int, after_id: int, limit: int
+    ) -> Sequence[FridgeProduct]:
+        stmt = (
+            select(FridgeProduct)
+            .where(FridgeProduct.fridge_id == fridge_id, FridgeProduct.id > after_id)
+            .order_by(FridgeProduct.id)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+    async def upsert_fridge_products(self, rows: list[dict]) -> Sequence[FridgeProduct]:
+        if self.db.get_bind().dialect.name == "postgresql":
+            upsert = postgresql.insert
+        else:
+            upsert = sqlite.insert
+        stmt = upsert(FridgeProduct).values(rows)
+        update_keys = rows[0].keys() - {"fridge_id", "product_name"}
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=["fridge_id", "product_name"],
+                set_={key: stmt.excluded[key] for key in (*update_keys, "updated_at")},
+            )
+            .returning(FridgeProduct)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+    async def get_catalog_linked_fridge_ids(
+        self, catalog_product_ids: Collection[int]
+    ) -> set[int]:
+        result = await self.db.execute(
+            select(FridgeProduct.fridge_id)
+            .where(FridgeProduct.catalog_product_id.in_(catalog_product_ids))
+            .distinct()
+        )
+        return set(result.scalars().all())
+
+    async def touch_catalog_products(
+        self, catalog_product_ids: Collection[int], fridge_ids: Collection[int]
+    ) -> Sequence[Row]:
+        # Linked products change with their catalog row, sync clients refetch them
+        result = await self.db.execute(
+            update(FridgeProduct)
+            .where(
+                FridgeProduct.catalog_product_id.in_(catalog_product_ids),
+                FridgeProduct.fridge_id.in_(fridge_ids),
+            )
+            .values(updated_at=utc_now())
+            .returning(FridgeProduct.id, FridgeProduct.fridge_id)
+        )
+        return result.all()
+
+    async def search_fridge_products(
+        self, fridge_id: int, query: str, limit: int
+    ) -> Sequence[FridgeProduct]:
+        name = FridgeProduct.product_name
+        rank = case(
+            (name.istartswith(query, autoescape=True), 0),
+            (name.icontains(f" {query}", autoescape=True), 1),
+            (name.icontains(query, autoescape=True), 2),
+            else_=3,
+        )
+        match = name.icontains(query, autoescape=True)
+        order_by = [rank]
+        if self.db.get_bind().dialect.name == "postgresql":
+            # pg_trgm word similarity tolerates typos, served by the trigram index
+            match = or_(match, literal(query).op("<%")(name))
+            # Only the fuzzy tier is ordered by similarity, within the others
+            # shorter names come first as on SQLite
+            order_by.append(case((rank == 3, -func.word_similarity(query, name))))
+        stmt = (
+            select(FridgeProduct)
+            .where(FridgeProduct.fridge_id == fridge_id, match)
+            .order_by(*order_by, func.length(name), name)
+            .limit(limit)
+        )
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
     async def get_fridge_product(
         self, fridge_id: int, product_id: int
     ) -> FridgeProduct:
@@ -37,12 +216,33 @@ class FridgeProductRepository(BaseRepository[FridgeProduct]):
             raise NotFoundError("Fridge product not found")
         return product
 
+    async def get_fridge_products_by_ids(
+        self, fridge_id: int, product_ids: set[int]
+    ) -> Sequence[FridgeProduct]:
+        result = await self.db.execute(
+            select(FridgeProduct).where(
+                FridgeProduct.fridge_id == fridge_id, FridgeProduct.id.in_(product_ids)
+            )
+        )
+        return result.scalars().all()
+
     async def delete_fridge_product(
         self, fridge_id: int, object_id: int
     ) -> FridgeProduct:
         product = await self.get_fridge_product(fridge_id, object_id)
+        result = await self.db.execute(
+            select(FridgeMealIngredient.fridge_meal_id).where(
+                FridgeMealIngredient.fridge_product_id == object_id
+            )
+        )
+        meal_ids = set(result.scalars().all())
         await self.db.delete(product)
         try:
+            await self.db.flush()
+            if meal_ids:
+                await self.db.execute(
+                    _update_meal_totals_stmt(FridgeMeal.id.in_(meal_ids))
+                )
             await self.db.commit()
         except SQLAlchemyError:
             await self.db.rollback()
@@ -57,43 +257,32 @@ class FridgeMealRepository(BaseRepository[FridgeMeal]):
     def add_all_ingredients(self, ingredients):
         self.db.add_all(ingredients)
 
-    async def get_fridge_meal_list(self, fridge_id: int):
-        def calc_macro(column_name):
-            return func.coalesce(
-                func.sum(
-                    (getattr(FridgeProduct, column_name) * FridgeMealIngredient.weight)
-                    / 100
-                ),
-                0,
-            )
+    async def get_fridge_meal_list(self, fridge_id: int) -> Sequence[FridgeMeal]:
+        result = await self.db.execute(
+            select(FridgeMeal).where(FridgeMeal.fridge_id == fridge_id)
+        )
+        return result.scalars().all()
 
-        stmt = (
-            select(
-                FridgeMeal.id,
-                FridgeMeal.name,
-                FridgeMeal.is_favourite,
-                calc_macro("calories_100g").label("calories"),
-                calc_macro("proteins_100g").label("proteins"),
-                calc_macro("fats_100g").label("fats"),
-                calc_macro("carbs_100g").label("carbs"),
-                func.count(FridgeMealIngredient.id).label("products_count"),
-                func.coalesce(func.sum(FridgeMealIngredient.weight), 0).label("weight"),
-            )
-            .select_from(FridgeMeal)
-            .outerjoin(
-                FridgeMealIngredient,
-                FridgeMeal.id == FridgeMealIngredient.fridge_meal_id,
-            )
-            .outerjoin(
-                FridgeProduct,
-                FridgeMealIngredient.fridge_product_id == FridgeProduct.id,
-            )
-            .where(FridgeMeal.fridge_id == fridge_id)
-            .group_by(FridgeMeal.id)
+    async def update_meal_totals(self, meal_id: int) -> None:
+        # Loading the RETURNING rows repopulates the meal if it is in the session
+        result = await self.db.execute(
+            _update_meal_totals_stmt(FridgeMeal.id == meal_id)
         )
+        result.scalars().all()
 
-        result = await self.db.execute(stmt)
-        return result.all()
+    async def update_meal_totals_for_product(self, product_id: int) -> None:
+        await self.update_meal_totals_for_products([product_id])
+
+    async def update_meal_totals_for_products(self, product_ids: Sequence[int]) -> None:
+        await self.db.execute(
+            _update_meal_totals_stmt(
+                FridgeMeal.id.in_(
+                    select(FridgeMealIngredient.fridge_meal_id).where(
+                        FridgeMealIngredient.fridge_product_id.in_(product_ids)
+                    )
+                )
+            )
+        )
 
     async def get_fridge_meal_entity(self, fridge_id: int, meal_id: int) -> FridgeMeal:
         stmt = (
@@ -112,43 +301,28 @@ class FridgeMealRepository(BaseRepository[FridgeMeal]):
             raise NotFoundError("Meal not found")
         return meal
 
-    async def get_fridge_meal(self, fridge_id: int, meal_id: int) -> Row:
-        def calc_macro(column_name):
-            return func.coalesce(
-                func.sum(
-                    (getattr(FridgeProduct, column_name) * FridgeMealIngredient.weight)
-                    / 100
-                ),
-                0,
-            )
-
+    async def get_fridge_meal_entities(
+        self, fridge_id: int, meal_ids: set[int]
+    ) -> Sequence[FridgeMeal]:
         stmt = (
-            select(
-                FridgeMeal.id,
-                FridgeMeal.name,
-                FridgeMeal.is_favourite,
-                calc_macro("calories_100g").label("calories"),
-                calc_macro("proteins_100g").label("proteins"),
-                calc_macro("fats_100g").label("fats"),
-                calc_macro("carbs_100g").label("carbs"),
-                func.count(FridgeMealIngredient.id).label("products_count"),
-                func.coalesce(func.sum(FridgeMealIngredient.weight), 0).label("weight"),
-            )
-            .select_from(FridgeMeal)
-            .outerjoin(
-                FridgeMealIngredient,
-                FridgeMeal.id == FridgeMealIngredient.fridge_meal_id,
-            )
-            .outerjoin(
-                FridgeProduct,
-                FridgeMealIngredient.fridge_product_id == FridgeProduct.id,
+            select(FridgeMeal)
+            .options(
+                selectinload(FridgeMeal.ingredients).selectinload(
+                    FridgeMealIngredient.fridge_product
+                )
             )
-            .where(FridgeMeal.fridge_id == fridge_id, FridgeMeal.id == meal_id)
-            .group_by(FridgeMeal.id)
+            .where(FridgeMeal.fridge_id == fridge_id, FridgeMeal.id.in_(meal_ids))
         )
-
         result = await self.db.execute(stmt)
-        meal = result.first()
+        return result.scalars().all()
+
+    async def get_fridge_meal(self, fridge_id: int, meal_id: int) -> FridgeMeal:
+        result = await self.db.execute(
+            select(FridgeMeal).where(
+                FridgeMeal.fridge_id == fridge_id, FridgeMeal.id == meal_id
+            )
+        )
+        meal = result.scalar_one_or_none()
         if meal is None:
             raise NotFoundError("Meal not found")
         return meal
@@ -166,23 +340,14 @@ class FridgeMealRepository(BaseRepository[FridgeMeal]):
     async def get_fridge_meal_nutrient_sum(
         self, fridge_id: int, meal_id: int, nutrient_type: NutrientType
     ) -> float:
-        stmt = (
-            select(
-                func.sum(
-                    (
-                        getattr(FridgeProduct, nutrient_type.value + "_100g")
-                        * FridgeMealIngredient.weight
-                    )
-                    / 100
-                )
+        result = await self.db.execute(
+            select(getattr(FridgeMeal, nutrient_type.value)).where(
+                FridgeMeal.fridge_id == fridge_id, FridgeMeal.id == meal_id
             )
-            .select_from(FridgeMealIngredient)
-            .join(FridgeProduct)
-            .join(FridgeMeal)
-            .where(FridgeMeal.fridge_id == fridge_id, FridgeMeal.id == meal_id)
         )
-        result = await self.db.execute(stmt)
-        value = result.scalar() or 0.0
+        value = result.scalar_one_or_none()
+        if value is None:
+            raise NotFoundError("Meal not found")
         if nutrient_type == NutrientType.CALORIES:
             return round(value, 0)
         else:
@@ -191,38 +356,19 @@ class FridgeMealRepository(BaseRepository[FridgeMeal]):
     async def get_fridge_meal_macro(
         self, fridge_id: int, meal_id: int
     ) -> dict[str, float]:
-        fields = [
-            NutrientType.CALORIES,
-            NutrientType.PROTEINS,
-            NutrientType.FATS,
-            NutrientType.CARBS,
-        ]
-        stmt = (
-            select(
-                *[
-                    func.sum(
-                        (
-                            getattr(FridgeProduct, field.value + "_100g")
-                            * FridgeMealIngredient.weight
-                        )
-                        / 100
-                    ).label(field.value)
-                    for field in fields
-                ]
-            )
-            .select_from(FridgeMealIngredient)
-            .join(FridgeProduct)
-            .join(FridgeMeal)
-            .where(FridgeMeal.fridge_id == fridge_id, FridgeMeal.id == meal_id)
-        )
+        stmt = select(
+            *[getattr(FridgeMeal, field.value) for field in nutrient_type_list]
+        ).where(FridgeMeal.fridge_id == fridge_id, FridgeMeal.id == meal_id)
         result = await self.db.execute(stmt)
         row = result.one_or_none()
+        if row is None:
+            raise NotFoundError("Meal not found")
         return {
             field.value: round(
-                getattr(row, field.value) or 0.0,
+                getattr(row, field.value),
                 0 if field == NutrientType.CALORIES else 1,
             )
-            for field in fields
+            for field in nutrient_type_list
         }
 
     async def get_fridge_meal_weight(
@@ -236,18 +382,30 @@ class FridgeMealRepository(BaseRepository[FridgeMeal]):
         result = await self.db.execute(stmt)
         return result.scalar() or 0.0
 
-    async def add_meal_ingredient(self, ingredient: FridgeMealIngredient):
-        self.db.add(ingredient)
-        try:
-            await self.db.commit()
-        except IntegrityError:
-            await self.db.rollback()
-            raise NotFoundError("Ingredient not found") from None
-        except SQLAlchemyError:
-            await self.db.rollback()
-            raise
-        await self.db.refresh(ingredient)
-        return ingredient
+    async def add_meal_ingredient(
+        self, fridge_id: int, meal_id: int, weight: float, fridge_product_id: int
+    ) -> int:
+        # Meal and product must both belong to the fridge, otherwise nothing is
+        # inserted
+        stmt = (
+            insert(FridgeMealIngredient)
+            .from_select(
+                ["weight", "fridge_meal_id", "fridge_product_id"],
+                select(literal(weight, Float), FridgeMeal.id, FridgeProduct.id)
+                .join(FridgeProduct, FridgeProduct.fridge_id == FridgeMeal.fridge_id)
+                .where(
+                    FridgeMeal.fridge_id == fridge_id,
+                    FridgeMeal.id == meal_id,
+                    FridgeProduct.id == fridge_product_id,
+                ),
+            )
+            .returning(FridgeMealIngredient.id)
+        )
+        result = await self.db.execute(stmt)
+        ingredient_id = result.scalar_one_or_none()
+        if ingredient_id is None:
+            raise NotFoundError("Meal or product not found")
+        return ingredient_id
 
     async def get_fridge_meal_ingredients(
         self, fridge_id: int, meal_id: int
@@ -264,8 +422,12 @@ class FridgeMealRepository(BaseRepository[FridgeMeal]):
                     / literal(100)
                 ).label("calories"),
             )
-            .join(FridgeMeal, FridgeMealIngredient.fridge_meal_id == FridgeMeal.id)
-            .join(
+            .select_from(FridgeMeal)
+            .outerjoin(
+                FridgeMealIngredient,
+                FridgeMealIngredient.fridge_meal_id == FridgeMeal.id,
+            )
+            .outerjoin(
                 FridgeProduct,
                 FridgeMealIngredient.fridge_product_id == FridgeProduct.id,
             )
@@ -273,28 +435,11 @@ class FridgeMealRepository(BaseRepository[FridgeMeal]):
         )
 
         result = await self.db.execute(stmt)
-
-        return result.all()
-
-    async def get_fridge_meal_ingredient_entity(
-        self, fridge_id: int, meal_id: int, ingredient_id: int
-    ):
-        stmt = (
-            select(FridgeMealIngredient)
-            .join(FridgeMeal, FridgeMealIngredient.fridge_meal_id == FridgeMeal.id)
-            .where(
-                FridgeMeal.fridge_id == fridge_id,
-                FridgeMeal.id == meal_id,
-                FridgeMealIngredient.id == ingredient_id,
-            )
-        )
-        result = await self.db.execute(stmt)
-
-        ingredient = result.scalar_one_or_none()
-
-        if ingredient is None:
-            raise NotFoundError("Ingredient not found")
-        return ingredient
+        rows = result.all()
+        if not rows:
+            raise NotFoundError("Meal not found")
+        # A meal without ingredients yields a single row of NULLs
+        return [row for row in rows if row.id is not None]
 
     async def get_fridge_meal_ingredient(
         self, fridge_id: int, meal_id: int, ingredient_id: int
@@ -330,18 +475,42 @@ class FridgeMealRepository(BaseRepository[FridgeMeal]):
             raise NotFoundError("Ingredient not found")
         return ingredient
 
-    async def refresh_and_return_ingredient(self, ingredient) -> FridgeMealIngredient:
-        await self.db.refresh(ingredient)
+    async def update_meal_ingredient(
+        self, fridge_id: int, meal_id: int, ingredient_id: int, values: dict
+    ) -> FridgeMealIngredient:
+        stmt = (
+            update(FridgeMealIngredient)
+            .where(*_ingredient_criteria(fridge_id, meal_id, ingredient_id))
+            .values(**values)
+            .returning(FridgeMealIngredient)
+        )
+        result = await self.db.execute(stmt)
+        ingredient = result.scalar_one_or_none()
+        if ingredient is None:
+            raise NotFoundError("Ingredient not found")
         return ingredient
 
     async def delete_ingredient(
         self, fridge_id: int, meal_id: int, ingredient_id: int
     ) -> FridgeMealIngredient:
-        ingredient = await self.get_fridge_meal_ingredient_entity(
-            fridge_id, meal_id, ingredient_id
+        stmt = (
+            delete(FridgeMealIngredient)
+            .where(*_ingredient_criteria(fridge_id, meal_id, ingredient_id))
+            .returning(FridgeMealIngredient)
         )
-        await self.db.delete(ingredient)
         try:
+            result = await self.db.execute(stmt)
+            ingredient = result.scalar_one_or_none()
+            if ingredient is None:
+                raise NotFoundError("Ingredient not found")
+            self.db.add(
+                SyncTombstone(
+                    entity=FridgeMealIngredient.__tablename__,
+                    entity_id=ingredient_id,
+                    fridge_id=fridge_id,
+                )
+            )
+            await self.update_meal_totals(meal_id)
             await self.db.commit()
         except SQLAlchemyError:
             await self.db.rollback()
@@ -1,8 +1,12 @@
-from collections.abc import Sequence
+from typing import Annotated
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
-from app.fridge.dependencies import FridgeDep, FridgeServiceDep
+from app.auth.dependencies import ReadSessionFactoryDep
+from app.core.config import settings
+from app.core.responses import etag_headers, model_list_response, not_modified_response
+from app.fridge.dependencies import FridgeDep, FridgeServiceDep, ReadFridgeServiceDep
 from app.fridge.models import (
     FridgeMeal,
     FridgeMealIngredient,
@@ -18,10 +22,14 @@ from app.fridge.schemas import (
     FridgeMealUpdate,
     FridgeMealWithIngredientsCreate,
     FridgeProductCreate,
+    FridgeProductFromCatalogCreate,
     FridgeProductRead,
     FridgeProductUpdate,
+    ProductImportReport,
 )
-from app.utils.enums import NutrientType
+from app.fridge.services import export_fridge_products
+from app.utils.enums import FileFormat, NutrientType
+from app.utils.streaming import MEDIA_TYPES, iter_lines
 
 router = APIRouter(prefix="/fridge", tags=["fridge"])
 
@@ -35,17 +43,78 @@ async def add_fridge_product(
     return await fridge_service.create_fridge_product(fridge.id, product_in)
 
 
+@router.post("/products/from-catalog", response_model=FridgeProductRead)
+async def add_fridge_product_from_catalog(
+    fridge_service: FridgeServiceDep,
+    fridge: FridgeDep,
+    product_in: FridgeProductFromCatalogCreate,
+) -> FridgeProduct:
+    return await fridge_service.create_fridge_product_from_catalog(
+        fridge.id, product_in
+    )
+
+
 @router.get("/products", response_model=list[FridgeProductRead])
 async def read_fridge_products(
+    request: Request,
+    fridge_service: ReadFridgeServiceDep,
+    fridge: FridgeDep,
+) -> Response:
+    etag = await fridge_service.get_catalog_etag(fridge.id, "products")
+    if response := not_modified_response(request, etag):
+        return response
+    return model_list_response(
+        FridgeProductRead,
+        await fridge_service.get_fridge_products(fridge.id),
+        headers=etag_headers(etag),
+    )
+
+
+@router.post("/products/import", response_model=ProductImportReport)
+async def import_fridge_products(
+    request: Request,
     fridge_service: FridgeServiceDep,
     fridge: FridgeDep,
-) -> Sequence[FridgeProduct]:
-    return await fridge_service.get_fridge_products(fridge.id)
+    format: FileFormat = FileFormat.CSV,
+) -> ProductImportReport:
+    return await fridge_service.import_fridge_products(
+        fridge.id,
+        iter_lines(request.stream(), settings.PRODUCT_IMPORT_MAX_LINE_LENGTH),
+        format,
+    )
+
+
+@router.get("/products/export")
+async def export_fridge_products_file(
+    session_factory: ReadSessionFactoryDep,
+    fridge: FridgeDep,
+    format: FileFormat = FileFormat.CSV,
+) -> StreamingResponse:
+    return StreamingResponse(
+        export_fridge_products(session_factory, fridge.id, format),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="products.{format.value}"'
+        },
+    )
+
+
+@router.get("/products/search", response_model=list[FridgeProductRead])
+async def search_fridge_products(
+    fridge_service: ReadFridgeServiceDep,
+    fridge: FridgeDep,
+    q: Annotated[str, Query(min_length=1, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=50)] = 20,
+) -> Response:
+    return model_list_response(
+        FridgeProductRead,
+        await fridge_service.search_fridge_products(fridge.id, q, limit),
+    )
 
 
 @router.get("/products/{product_id}", response_model=FridgeProductRead)
 async def read_fridge_product(
-    fridge_service: FridgeServiceDep, fridge: FridgeDep, product_id: int
+    fridge_service: ReadFridgeServiceDep, fridge: FridgeDep, product_id: int
 ) -> FridgeProduct:
     return await fridge_service.get_fridge_product(fridge.id, product_id)
 
@@ -88,15 +157,23 @@ async def add_fridge_meal_with_ingredients(
 
 @router.get("/meals", response_model=list[FridgeMealRead])
 async def read_fridge_meals(
-    fridge_service: FridgeServiceDep,
+    request: Request,
+    fridge_service: ReadFridgeServiceDep,
     fridge: FridgeDep,
-) -> Sequence[FridgeMeal]:
-    return await fridge_service.get_fridge_meals(fridge.id)
+) -> Response:
+    etag = await fridge_service.get_catalog_etag(fridge.id, "meals")
+    if response := not_modified_response(request, etag):
+        return response
+    return model_list_response(
+        FridgeMealRead,
+        await fridge_service.get_fridge_meals(fridge.id),
+        headers=etag_headers(etag),
+    )
 
 
 @router.get("/meals/{meal_id}", response_model=FridgeMealRead)
 async def read_fridge_meal(
-    fridge_service: FridgeServiceDep, fridge: FridgeDep, meal_id: int
+    fridge_service: ReadFridgeServiceDep, fridge: FridgeDep, meal_id: int
 ):
     return await fridge_service.get_fridge_meal(fridge.id, meal_id)
 
@@ -120,7 +197,7 @@ async def delete_fridge_meal(
 
 @router.get("/meals/{meal_id}/nutrients/{nutrient_type}", response_model=float)
 async def read_fridge_meal_nutrient_sum(
-    fridge_service: FridgeServiceDep,
+    fridge_service: ReadFridgeServiceDep,
     fridge: FridgeDep,
     meal_id: int,
     nutrient_type: NutrientType,
@@ -132,7 +209,7 @@ async def read_fridge_meal_nutrient_sum(
 
 @router.get("/meals/{meal_id}/macros", response_model=dict[str, float])
 async def read_fridge_meal_macro(
-    fridge_service: FridgeServiceDep, fridge: FridgeDep, meal_id: int
+    fridge_service: ReadFridgeServiceDep, fridge: FridgeDep, meal_id: int
 ) -> dict[str, float]:
     return await fridge_service.get_fridge_meal_macro(fridge.id, meal_id)
 
@@ -157,7 +234,7 @@ async def add_fridge_meal_ingredient(
     response_model=list[FridgeMealIngredientRead],
 )
 async def read_fridge_meal_ingredients(
-    fridge_service: FridgeServiceDep, fridge: FridgeDep, meal_id: int
+    fridge_service: ReadFridgeServiceDep, fridge: FridgeDep, meal_id: int
 ):
     return await fridge_service.get_fridge_meal_ingredients(fridge.id, meal_id)
 
@@ -167,7 +244,7 @@ async def read_fridge_meal_ingredients(
     response_model=FridgeMealIngredientRead,
 )
 async def read_fridge_meal_ingredient(
-    fridge_service: FridgeServiceDep,
+    fridge_service: ReadFridgeServiceDep,
     fridge: FridgeDep,
     meal_id: int,
     ingredient_id: int,
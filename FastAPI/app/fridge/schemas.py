@@ -14,8 +14,20 @@ class FridgeProductCreate(BaseModel):
     is_favourite: bool = False
 
 
+class FridgeProductFromCatalogCreate(BaseModel):
+    catalog_product_id: int
+    product_name: str | None = Field(default=None, pattern=r"^[a-zA-Z0-9\s\-.]+$")
+    # Left unset, values follow the catalog product
+    calories_100g: float | None = Field(default=None, ge=0)
+    proteins_100g: float | None = Field(default=None, ge=0)
+    fats_100g: float | None = Field(default=None, ge=0)
+    carbs_100g: float | None = Field(default=None, ge=0)
+    is_favourite: bool = False
+
+
 class FridgeProductRead(BaseModel):
     id: int
+    catalog_product_id: int | None = None
     product_name: str
     calories_100g: float
     proteins_100g: float
@@ -37,6 +49,17 @@ class FridgeProductUpdate(BaseModel):
     is_favourite: bool | None = None
 
 
+class ProductImportError(BaseModel):
+    line: int
+    error: str
+
+
+class ProductImportReport(BaseModel):
+    imported: int = 0
+    failed: int = 0
+    errors: list[ProductImportError] = []
+
+
 # Fridge meal ingredient
 class FridgeMealIngredientCreate(BaseModel):
     weight: float = Field(gt=0)
@@ -1,17 +1,30 @@
 import logging
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 
+from pydantic import ValidationError
 from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.catalog.repositories import CatalogProductRepository
+from app.core.config import settings
+from app.core.db import SessionFactory
 from app.core.exceptions import ConflictError
 from app.fridge.models import (
     FridgeMeal,
     FridgeMealIngredient,
     FridgeProduct,
 )
-from app.fridge.repositories import FridgeMealRepository, FridgeProductRepository
+from app.fridge.product_files import (
+    format_header,
+    format_products,
+    read_product_records,
+)
+from app.fridge.repositories import (
+    FridgeMealRepository,
+    FridgeProductRepository,
+    FridgeRepository,
+)
 from app.fridge.schemas import (
     FridgeMealCreate,
     FridgeMealIngredientCreate,
@@ -19,9 +32,12 @@ from app.fridge.schemas import (
     FridgeMealUpdate,
     FridgeMealWithIngredientsCreate,
     FridgeProductCreate,
+    FridgeProductFromCatalogCreate,
     FridgeProductUpdate,
+    ProductImportError,
+    ProductImportReport,
 )
-from app.utils.enums import NutrientType
+from app.utils.enums import FileFormat, NutrientType
 
 logger = logging.getLogger(__name__)
 
@@ -29,8 +45,15 @@ logger = logging.getLogger(__name__)
 # Fridge products
 class FridgeService:
     def __init__(self, db: AsyncSession):
+        self.fridge_repo = FridgeRepository(db)
         self.meal_repo = FridgeMealRepository(db)
         self.product_repo = FridgeProductRepository(db)
+        self.catalog_repo = CatalogProductRepository(db)
+
+    async def get_catalog_etag(self, fridge_id: int, catalog: str) -> str:
+        version = await self.fridge_repo.get_version(fridge_id)
+        # Weak, because the same tag covers the plain and the gzip-encoded body
+        return f'W/"{catalog}-{fridge_id}-{version}"'
 
     async def create_fridge_product(
         self, fridge_id: int, data: FridgeProductCreate
@@ -38,16 +61,84 @@ class FridgeService:
         product = FridgeProduct(
             **data.model_dump(exclude_unset=True), fridge_id=fridge_id
         )
-        self.product_repo.add(product)
+        await self.fridge_repo.bump_version(fridge_id)
         try:
-            await self.product_repo.commit_or_conflict()
+            return await self.product_repo.save(product)
         except IntegrityError:
             logger.warning(
                 f"Duplicate product attempt: "
                 f"name='{data.product_name}', fridge_id={fridge_id}"
             )
             raise ConflictError("Product already exists") from None
-        return await self.product_repo.refresh_and_return(product)
+
+    async def create_fridge_product_from_catalog(
+        self, fridge_id: int, data: FridgeProductFromCatalogCreate
+    ) -> FridgeProduct:
+        catalog_product = await self.catalog_repo.get_by_id(data.catalog_product_id)
+        product = FridgeProduct(
+            **data.model_dump(exclude={"product_name"}, exclude_none=True),
+            product_name=data.product_name or catalog_product.name,
+            category=catalog_product.category,
+            catalog_product=catalog_product,
+            fridge_id=fridge_id,
+        )
+        await self.fridge_repo.bump_version(fridge_id)
+        try:
+            return await self.product_repo.save(product)
+        except IntegrityError:
+            logger.warning(
+                f"Duplicate product attempt: "
+                f"name='{product.product_name}', fridge_id={fridge_id}"
+            )
+            raise ConflictError("Product already exists") from None
+
+    async def import_fridge_products(
+        self,
+        fridge_id: int,
+        lines: AsyncIterator[str],
+        file_format: FileFormat,
+    ) -> ProductImportReport:
+        report = ProductImportReport()
+        # keyed by name, a later line for the same product wins
+        chunk: dict[str, dict] = {}
+
+        def add_error(line_no: int, error: str) -> None:
+            report.failed += 1
+            if len(report.errors) < settings.PRODUCT_IMPORT_MAX_ERRORS:
+                report.errors.append(ProductImportError(line=line_no, error=error))
+
+        async for line_no, record in read_product_records(lines, file_format):
+            if isinstance(record, str):
+                add_error(line_no, record)
+                continue
+            try:
+                product = FridgeProductCreate.model_validate(record)
+            except ValidationError as e:
+                add_error(line_no, _format_validation_error(e))
+                continue
+            chunk[product.product_name] = {
+                **product.model_dump(),
+                "fridge_id": fridge_id,
+            }
+            if len(chunk) >= settings.PRODUCT_FILE_CHUNK_SIZE:
+                await self._upsert_products(fridge_id, list(chunk.values()), report)
+                chunk.clear()
+        if chunk:
+            await self._upsert_products(fridge_id, list(chunk.values()), report)
+        if report.imported:
+            await self.product_repo.commit_or_conflict()
+        return report
+
+    async def _upsert_products(
+        self, fridge_id: int, rows: list[dict], report: ProductImportReport
+    ) -> None:
+        if not report.imported:
+            await self.fridge_repo.bump_version(fridge_id)
+        products = await self.product_repo.upsert_fridge_products(rows)
+        await self.meal_repo.update_meal_totals_for_products(
+            [product.id for product in products]
+        )
+        report.imported += len(products)
 
     async def get_fridge_products(
         self,
@@ -55,6 +146,14 @@ class FridgeService:
     ) -> Sequence[FridgeProduct]:
         return await self.product_repo.get_fridge_product_list(fridge_id)
 
+    async def search_fridge_products(
+        self, fridge_id: int, query: str, limit: int = 20
+    ) -> Sequence[FridgeProduct]:
+        query = query.strip()
+        if not query:
+            return []
+        return await self.product_repo.search_fridge_products(fridge_id, query, limit)
+
     async def get_fridge_product(
         self, fridge_id: int, product_id: int
     ) -> FridgeProduct:
@@ -64,38 +163,46 @@ class FridgeService:
         self, fridge_id: int, product_id: int, data: FridgeProductUpdate
     ) -> FridgeProduct:
         product = await self.product_repo.get_fridge_product(fridge_id, product_id)
-        for field, value in data.model_dump(exclude_unset=True).items():
+        # Writes lock the fridge row first, before any product or meal row,
+        # so that concurrent writes to one fridge cannot deadlock
+        await self.fridge_repo.bump_version(fridge_id)
+        update_data = data.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
             setattr(product, field, value)
         try:
+            await self.product_repo.flush()
+            if any(field.endswith("_100g") for field in update_data):
+                await self.meal_repo.update_meal_totals_for_product(product_id)
             await self.product_repo.commit_or_conflict()
         except IntegrityError:
+            await self.product_repo.rollback()
             raise ConflictError("Product already exists") from None
-        return await self.product_repo.refresh_and_return(product)
+        return product
 
     async def delete_fridge_product(
         self, fridge_id: int, product_id: int
     ) -> FridgeProduct:
+        await self.fridge_repo.bump_version(fridge_id)
         return await self.product_repo.delete_fridge_product(fridge_id, product_id)
 
     # Fridge meals
 
-    async def create_fridge_meal(self, fridge_id: int, data: FridgeMealCreate) -> Row:
+    async def create_fridge_meal(
+        self, fridge_id: int, data: FridgeMealCreate
+    ) -> FridgeMeal:
         meal = FridgeMeal(**data.model_dump(exclude_unset=True), fridge_id=fridge_id)
-        self.meal_repo.add(meal)
+        await self.fridge_repo.bump_version(fridge_id)
         try:
-            await self.meal_repo.commit_or_conflict()
+            return await self.meal_repo.save(meal)
         except IntegrityError:
             logger.warning(
                 f"Duplicate meal attempt: name='{data.name}', fridge_id={fridge_id}"
             )
             raise ConflictError("Meal already exists") from None
-        await self.meal_repo.refresh(meal)
-
-        return await self.get_fridge_meal(fridge_id, meal.id)
 
     async def create_fridge_meal_with_ingredients(
         self, fridge_id: int, data: FridgeMealWithIngredientsCreate
-    ) -> Row:
+    ) -> FridgeMeal:
         meal = FridgeMeal(
             name=data.name, is_favourite=data.is_favourite, fridge_id=fridge_id
         )
@@ -106,43 +213,47 @@ class FridgeService:
                     fridge_product_id=ingredient.fridge_product_id,
                 )
             )
+        await self.fridge_repo.bump_version(fridge_id)
         self.meal_repo.add(meal)
         try:
+            await self.meal_repo.flush()
+            await self.meal_repo.update_meal_totals(meal.id)
             await self.meal_repo.commit_or_conflict()
         except IntegrityError:
+            await self.meal_repo.rollback()
             logger.warning(
                 f"Duplicate meal attempt: name='{data.name}', fridge_id={fridge_id}"
             )
             raise ConflictError("Meal already exists") from None
-        await self.meal_repo.refresh(meal)
-
-        return await self.get_fridge_meal(fridge_id, meal.id)
+        return meal
 
     async def get_fridge_meals(self, fridge_id: int) -> Sequence[FridgeMeal]:
         return await self.meal_repo.get_fridge_meal_list(fridge_id)
 
-    async def get_fridge_meal(self, fridge_id: int, meal_id: int) -> Row:
+    async def get_fridge_meal(self, fridge_id: int, meal_id: int) -> FridgeMeal:
         return await self.meal_repo.get_fridge_meal(fridge_id, meal_id)
 
     async def update_fridge_meal(
         self, fridge_id: int, meal_id: int, data: FridgeMealUpdate
-    ) -> Row:
+    ) -> FridgeMeal:
         meal = await self.meal_repo.get_fridge_meal_entity(fridge_id, meal_id)
+        await self.fridge_repo.bump_version(fridge_id)
         for field, value in data.model_dump(exclude_unset=True).items():
             setattr(meal, field, value)
         try:
             await self.meal_repo.commit_or_conflict()
         except IntegrityError:
+            await self.meal_repo.rollback()
             raise ConflictError("Meal already exists") from None
-        return await self.get_fridge_meal(fridge_id, meal_id)
+        return meal
 
     async def delete_fridge_meal(self, fridge_id: int, meal_id: int) -> FridgeMeal:
+        await self.fridge_repo.bump_version(fridge_id)
         return await self.meal_repo.delete_fridge_meal(fridge_id, meal_id)
 
     async def get_fridge_meal_nutrient_sum(
         self, fridge_id: int, meal_id: int, nutrient_type: NutrientType
     ) -> float:
-        await self.meal_repo.get_fridge_meal(fridge_id, meal_id)
         return await self.meal_repo.get_fridge_meal_nutrient_sum(
             fridge_id, meal_id, nutrient_type
         )
@@ -150,28 +261,29 @@ class FridgeService:
     async def get_fridge_meal_macro(
         self, fridge_id: int, meal_id: int
     ) -> dict[str, float]:
-        await self.meal_repo.get_fridge_meal(fridge_id, meal_id)
         return await self.meal_repo.get_fridge_meal_macro(fridge_id, meal_id)
 
     # Fridge meal ingredients
 
     async def add_fridge_meal_ingredient(
         self, fridge_id: int, meal_id: int, data: FridgeMealIngredientCreate
-    ):
-        await self.meal_repo.get_fridge_meal(fridge_id, meal_id)
-        ingredient = FridgeMealIngredient(**data.model_dump(), fridge_meal_id=meal_id)
+    ) -> Row:
+        await self.fridge_repo.bump_version(fridge_id)
         try:
-            ingredient = await self.meal_repo.add_meal_ingredient(ingredient)
-            return await self.meal_repo.get_fridge_meal_ingredient(
-                fridge_id, meal_id, ingredient.id
+            ingredient_id = await self.meal_repo.add_meal_ingredient(
+                fridge_id, meal_id, data.weight, data.fridge_product_id
             )
+            await self.meal_repo.update_meal_totals(meal_id)
+            await self.meal_repo.commit_or_conflict()
         except IntegrityError:
             raise ConflictError("Ingredient already exists") from None
+        return await self.meal_repo.get_fridge_meal_ingredient(
+            fridge_id, meal_id, ingredient_id
+        )
 
     async def get_fridge_meal_ingredients(
         self, fridge_id: int, meal_id: int
     ) -> Sequence[Row]:
-        await self.meal_repo.get_fridge_meal(fridge_id, meal_id)
         return await self.meal_repo.get_fridge_meal_ingredients(fridge_id, meal_id)
 
     async def get_fridge_meal_ingredient(
@@ -188,21 +300,41 @@ class FridgeService:
         ingredient_id: int,
         data: FridgeMealIngredientUpdate,
     ) -> FridgeMealIngredient:
-        await self.meal_repo.get_fridge_meal(fridge_id, meal_id)
-        ingredient = await self.meal_repo.get_fridge_meal_ingredient_entity(
-            fridge_id, meal_id, ingredient_id
-        )
-        for field, value in data.model_dump(exclude_unset=True).items():
-            setattr(ingredient, field, value)
-
+        await self.fridge_repo.bump_version(fridge_id)
         try:
+            ingredient = await self.meal_repo.update_meal_ingredient(
+                fridge_id, meal_id, ingredient_id, data.model_dump(exclude_unset=True)
+            )
+            await self.meal_repo.update_meal_totals(meal_id)
             await self.meal_repo.commit_or_conflict()
         except IntegrityError:
+            await self.meal_repo.rollback()
             raise ConflictError("Meal ingredient already exists") from None
-        return await self.meal_repo.refresh_and_return_ingredient(ingredient)
+        return ingredient
 
     async def delete_fridge_meal_ingredient(
         self, fridge_id: int, meal_id: int, ingredient_id: int
     ) -> FridgeMealIngredient:
-        await self.meal_repo.get_fridge_meal(fridge_id, meal_id)
+        await self.fridge_repo.bump_version(fridge_id)
         return await self.meal_repo.delete_ingredient(fridge_id, meal_id, ingredient_id)
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'record'}: {e['msg']}"
+        for e in error.errors()
+    )
+
+
+async def export_fridge_products(
+    session_factory: SessionFactory, fridge_id: int, file_format: FileFormat
+) -> AsyncIterator[str]:
+    yield format_header(file_format)
+    async with session_factory() as db:
+        repo = FridgeProductRepository(db)
+        after_id = 0
+        while products := await repo.get_fridge_product_page(
+            fridge_id, after_id, settings.PRODUCT_FILE_CHUNK_SIZE
+        ):
+            yield format_products(products, file_format)
+            after_id = products[-1].id
@@ -1,20 +1,31 @@
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi_limiter import FastAPILimiter
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 
 from app.auth.routers import router as auth_router
+from app.catalog.cache import listen_for_catalog_invalidations, warm_catalog_cache
+from app.catalog.routers import router as catalog_router
 from app.core.config import settings
 from app.core.db import session_manager
 from app.core.exception_handler import register_exception_handlers
 from app.core.logging_config import setup_logging
 from app.core.redis_session import close_redis_session, get_redis_client
+from app.core.responses import FastJSONResponse
+from app.core.routers import router as internal_router
+from app.core.security import password_hashing_executor
 from app.fridge.routers import router as fridge_router
 from app.meal.routers import router as meal_router
+from app.measurements.cache import listen_for_latest_weight_invalidations
 from app.measurements.routers import measurements_router, weights_router
+from app.sync.routers import router as sync_router
+from app.sync.services import prune_tombstones_periodically
+from app.user.cache import listen_for_user_invalidations
 from app.user.routers import router as user_router
 
 
@@ -23,22 +34,48 @@ async def lifespan(app: FastAPI):
     logger.info("Application lifespan started")
     await FastAPILimiter.init(get_redis_client())
     logger.info("Rate limiter is initialized")
+    await warm_catalog_cache()
+    background_tasks = [
+        asyncio.create_task(listen_for_user_invalidations(get_redis_client())),
+        asyncio.create_task(listen_for_catalog_invalidations(get_redis_client())),
+        asyncio.create_task(listen_for_latest_weight_invalidations(get_redis_client())),
+        asyncio.create_task(
+            prune_tombstones_periodically(settings.SYNC_TOMBSTONE_PRUNE_SECONDS)
+        ),
+    ]
+    if session_manager.has_replicas:
+        background_tasks.append(
+            asyncio.create_task(
+                session_manager.monitor_replica_lag(settings.REPLICA_LAG_CHECK_SECONDS)
+            )
+        )
     try:
         yield
     finally:
+        for task in background_tasks:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
         if session_manager._engine:
             logger.info("Closing database session manager")
             await session_manager.close()
         logger.info("Closing Redis session")
         await FastAPILimiter.close()
         await close_redis_session()
+        password_hashing_executor.shutdown()
         logger.info("Application lifespan finished")
 
 
-app = FastAPI(lifespan=lifespan, title=settings.PROJECT_NAME, docs_url="/docs")
+app = FastAPI(
+    lifespan=lifespan,
+    title=settings.PROJECT_NAME,
+    docs_url="/docs",
+    default_response_class=FastJSONResponse,
+)
 register_exception_handlers(app)
 
 
+app.add_middleware(GZipMiddleware, minimum_size=settings.GZIP_MINIMUM_SIZE)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # change in production
@@ -53,9 +90,12 @@ logger = logging.getLogger(__name__)
 app.include_router(user_router)
 app.include_router(meal_router)
 app.include_router(fridge_router)
+app.include_router(catalog_router)
 app.include_router(auth_router)
 app.include_router(measurements_router)
 app.include_router(weights_router)
+app.include_router(sync_router)
+app.include_router(internal_router)
 
 
 def get_app():
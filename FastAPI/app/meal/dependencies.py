@@ -2,6 +2,7 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from app.auth.dependencies import ReadSessionDep
 from app.core.db import DbSessionDep
 from app.meal.services import MealService
 
@@ -11,3 +12,10 @@ def get_meal_service(db: DbSessionDep) -> MealService:
 
 
 MealServiceDep = Annotated[MealService, Depends(get_meal_service)]
+
+
+def get_read_meal_service(db: ReadSessionDep) -> MealService:
+    return MealService(db)
+
+
+ReadMealServiceDep = Annotated[MealService, Depends(get_read_meal_service)]
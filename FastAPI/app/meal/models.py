@@ -5,13 +5,15 @@ from sqlalchemy import (
     Date,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    PrimaryKeyConstraint,
     String,
 )
 from sqlalchemy import Enum as SqlEnum
 from sqlalchemy.orm import relationship
 
-from app.core.db import Base
+from app.core.db import Base, UpdatedAtMixin
 
 
 class MealType(str, Enum):
@@ -22,19 +24,44 @@ class MealType(str, Enum):
     SUPPER = "supper"
 
 
-class MealLog(Base):
+class MealLog(UpdatedAtMixin, Base):
     __tablename__ = "meal_logs"
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
-    date = Column(Date, index=True, nullable=False)
-    type = Column(SqlEnum(MealType, name="meal_type"), index=True, nullable=False)
+    date = Column(Date, nullable=False)
+    type = Column(SqlEnum(MealType, name="meal_type"), nullable=False)
     weight = Column(Float, nullable=False)
-    name = Column(String, index=True, nullable=False)
+    name = Column(String, nullable=False)
     calories = Column(Float, nullable=False, default=0)
     proteins = Column(Float, nullable=False, default=0)
     fats = Column(Float, nullable=False, default=0)
     carbs = Column(Float, nullable=False, default=0)
 
     user = relationship("User", back_populates="meal_logs")
+
+    __table_args__ = (
+        Index("ix_meal_logs_user_id_date_id", "user_id", "date", "id"),
+        Index("ix_meal_logs_user_id_updated_at", "user_id", "updated_at"),
+    )
+
+
+class DailyNutritionTotal(Base):
+    __tablename__ = "daily_nutrition_totals"
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    date = Column(Date, nullable=False)
+    type = Column(SqlEnum(MealType, name="meal_type"), nullable=False)
+    weight = Column(Float, nullable=False, default=0)
+    calories = Column(Float, nullable=False, default=0)
+    proteins = Column(Float, nullable=False, default=0)
+    fats = Column(Float, nullable=False, default=0)
+    carbs = Column(Float, nullable=False, default=0)
+    logs_count = Column(Integer, nullable=False, default=0)
+    __table_args__ = (
+        PrimaryKeyConstraint(
+            "user_id", "date", "type", name="daily_nutrition_totals_pkey"
+        ),
+    )
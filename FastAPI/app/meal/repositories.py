@@ -1,10 +1,12 @@
+from collections.abc import Sequence
 from datetime import date
 
-from sqlalchemy import select
+from sqlalchemy import Row, insert, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.base_repository import UserScopedRepository
-from app.meal.models import MealLog
+from app.meal.models import DailyNutritionTotal, MealLog, MealType
 
 
 class MealRepository(UserScopedRepository[MealLog]):
@@ -14,9 +16,88 @@ class MealRepository(UserScopedRepository[MealLog]):
     def add_all_products(self, meal_logs: list[MealLog]):
         self.db.add_all(meal_logs)
 
+    async def insert_meal_logs(self, values: list[dict]) -> Sequence[Row]:
+        # Neither the id order nor the RETURNING order is guaranteed to follow
+        # the input, and large batches are split across several statements
+        result = await self.db.execute(
+            insert(MealLog).returning(
+                *MealLog.__table__.columns, sort_by_parameter_order=True
+            ),
+            values,
+        )
+        return result.all()
+
     async def get_meal_logs(self, user_id: int, meal_date: date):
         stmt = select(MealLog).where(
             MealLog.user_id == user_id, MealLog.date == meal_date
         )
         result = await self.db.execute(stmt)
         return result.scalars().all()
+
+    async def get_meal_logs_range(
+        self,
+        user_id: int,
+        date_from: date,
+        date_to: date,
+        limit: int,
+        meal_type: MealType | None = None,
+        after: tuple[date, int] | None = None,
+    ) -> Sequence[MealLog]:
+        stmt = select(MealLog).where(
+            MealLog.user_id == user_id,
+            MealLog.date >= date_from,
+            MealLog.date <= date_to,
+        )
+        if meal_type is not None:
+            stmt = stmt.where(MealLog.type == meal_type)
+        if after is not None:
+            stmt = stmt.where(tuple_(MealLog.date, MealLog.id) > after)
+        stmt = stmt.order_by(MealLog.date, MealLog.id).limit(limit)
+        result = await self.db.execute(stmt)
+        return result.scalars().all()
+
+
+class DailyNutritionTotalRepository(UserScopedRepository[DailyNutritionTotal]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, DailyNutritionTotal)
+
+    async def add_to_totals(
+        self, user_id: int, log_date: date, meal_type: MealType, **delta: float
+    ) -> None:
+        await self.add_many_to_totals(
+            [{"user_id": user_id, "date": log_date, "type": meal_type, **delta}]
+        )
+
+    async def add_many_to_totals(self, rows: list[dict]) -> None:
+        # The upsert locks rows in VALUES order, a fixed key order keeps
+        # concurrent writes for one user from deadlocking
+        rows = sorted(rows, key=lambda row: (row["user_id"], row["date"], row["type"]))
+        if self.db.get_bind().dialect.name == "postgresql":
+            upsert = postgresql.insert
+        else:
+            upsert = sqlite.insert
+        stmt = upsert(DailyNutritionTotal).values(rows)
+        delta_keys = rows[0].keys() - {"user_id", "date", "type"}
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id", "date", "type"],
+            set_={
+                key: getattr(DailyNutritionTotal, key) + stmt.excluded[key]
+                for key in delta_keys
+            },
+        )
+        await self.db.execute(stmt)
+
+    async def get_totals(
+        self, user_id: int, date_from: date, date_to: date
+    ) -> Sequence[DailyNutritionTotal]:
+        result = await self.db.execute(
+            select(DailyNutritionTotal)
+            .where(
+                DailyNutritionTotal.user_id == user_id,
+                DailyNutritionTotal.date >= date_from,
+                DailyNutritionTotal.date <= date_to,
+                DailyNutritionTotal.logs_count > 0,
+            )
+            .order_by(DailyNutritionTotal.date, DailyNutritionTotal.type)
+        )
+        return result.scalars().all()
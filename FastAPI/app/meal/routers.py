@@ -1,15 +1,20 @@
 from collections.abc import Sequence
 from datetime import date
+from typing import Annotated
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Response
 
 from app.auth.dependencies import UserDep
+from app.core.responses import model_list_response
 from app.fridge.dependencies import FridgeDep
-from app.meal.dependencies import MealServiceDep
-from app.meal.models import MealLog
+from app.meal.dependencies import MealServiceDep, ReadMealServiceDep
+from app.meal.models import MealLog, MealType
 from app.meal.schemas import (
+    DailyNutritionSummary,
+    MealLogBulkCreate,
     MealLogFromMealCreate,
     MealLogFromProductCreate,
+    MealLogPage,
     MealLogQuickCreate,
     MealLogRead,
 )
@@ -48,16 +53,59 @@ async def add_meal_log_from_fridge_meal(
     )
 
 
+@router.post("/bulk", response_model=Sequence[MealLogRead])
+async def add_meal_logs_bulk(
+    meal_service: MealServiceDep,
+    user: UserDep,
+    fridge: FridgeDep,
+    logs_in: MealLogBulkCreate,
+):
+    return await meal_service.create_meal_logs_bulk(user.id, fridge.id, data=logs_in)
+
+
+@router.get("", response_model=MealLogPage)
+async def read_meal_logs_range(
+    meal_service: ReadMealServiceDep,
+    user: UserDep,
+    date_from: date,
+    date_to: date,
+    type: MealType | None = None,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+) -> MealLogPage:
+    return await meal_service.get_meal_logs_range(
+        user.id, date_from, date_to, type, cursor, limit
+    )
+
+
+@router.get("/summary", response_model=list[DailyNutritionSummary])
+async def read_daily_summaries(
+    meal_service: ReadMealServiceDep, user: UserDep, date_from: date, date_to: date
+) -> list[DailyNutritionSummary]:
+    return await meal_service.get_daily_summaries(user.id, date_from, date_to)
+
+
 @router.get("/{log_id}", response_model=MealLogRead)
 async def read_meal_log_by_id(
-    meal_service: MealServiceDep, user: UserDep, log_id: int
+    meal_service: ReadMealServiceDep, user: UserDep, log_id: int
 ) -> MealLog:
     return await meal_service.get_meal_log_by_id(user.id, meal_id=log_id)
 
 
 @router.get("/{log_date}/meal-logs", response_model=Sequence[MealLogRead])
-async def read_meal_logs(meal_service: MealServiceDep, user: UserDep, log_date: date):
-    return await meal_service.get_meal_logs(user.id, meal_date=log_date)
+async def read_meal_logs(
+    meal_service: ReadMealServiceDep, user: UserDep, log_date: date
+) -> Response:
+    return model_list_response(
+        MealLogRead, await meal_service.get_meal_logs(user.id, meal_date=log_date)
+    )
+
+
+@router.get("/{log_date}/summary", response_model=DailyNutritionSummary)
+async def read_daily_summary(
+    meal_service: ReadMealServiceDep, user: UserDep, log_date: date
+) -> DailyNutritionSummary:
+    return await meal_service.get_daily_summary(user.id, log_date)
 
 
 @router.put("/{log_id}/name", response_model=MealLogRead)
@@ -28,8 +28,17 @@ class MealLogFromMealCreate(MealLogCreateBase):
     fridge_meal_id: int
 
 
+class MealLogBulkCreate(BaseModel):
+    quick: list[MealLogQuickCreate] = Field(default_factory=list, max_length=500)
+    from_product: list[MealLogFromProductCreate] = Field(
+        default_factory=list, max_length=500
+    )
+    from_meal: list[MealLogFromMealCreate] = Field(default_factory=list, max_length=100)
+
+
 class MealLogRead(BaseModel):
     id: int
+    date: dt.date
     name: str
     type: MealType
     weight: float
@@ -41,6 +50,33 @@ class MealLogRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class MealLogPage(BaseModel):
+    items: list[MealLogRead]
+    next_cursor: str | None = None
+
+
+class MealTypeNutritionSummary(BaseModel):
+    type: MealType
+    weight: float
+    calories: float
+    proteins: float
+    fats: float
+    carbs: float
+    logs_count: int
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class DailyNutritionSummary(BaseModel):
+    date: dt.date
+    weight: float = 0
+    calories: float = 0
+    proteins: float = 0
+    fats: float = 0
+    carbs: float = 0
+    meals: list[MealTypeNutritionSummary] = Field(default_factory=list)
+
+
 class MealLogUpdate(BaseModel):
     name: str
     weight: float
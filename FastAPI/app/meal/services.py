@@ -1,16 +1,28 @@
 import datetime
 from collections.abc import Sequence
 
+from sqlalchemy import Row
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.exceptions import ConflictError, NotFoundError
+from app.fridge.models import FridgeMeal, FridgeProduct
 from app.fridge.repositories import FridgeMealRepository, FridgeProductRepository
-from app.meal.models import MealLog
-from app.meal.repositories import MealRepository
+from app.meal.models import MealLog, MealType
+from app.meal.repositories import DailyNutritionTotalRepository, MealRepository
 from app.meal.schemas import (
+    DailyNutritionSummary,
+    MealLogBulkCreate,
+    MealLogFromMealCreate,
     MealLogFromProductCreate,
+    MealLogPage,
     MealLogQuickCreate,
     MealLogRead,
+    MealTypeNutritionSummary,
 )
+from app.utils.pagination import decode_cursor, encode_cursor
+
+NUTRITION_FIELDS = ("weight", "calories", "proteins", "fats", "carbs")
 
 # Meal
 
@@ -18,16 +30,80 @@ from app.meal.schemas import (
 class MealService:
     def __init__(self, db: AsyncSession):
         self.repo = MealRepository(db)
+        self.totals_repo = DailyNutritionTotalRepository(db)
         self.fridge_product_repo = FridgeProductRepository(db)
         self.fridge_meal_repo = FridgeMealRepository(db)
 
+    async def _add_logs_to_daily_totals(
+        self, logs: Sequence[MealLog | Row], sign: int = 1
+    ) -> None:
+        totals: dict[tuple, dict[str, float]] = {}
+        for log in logs:
+            key = (log.user_id, log.date, log.type)
+            delta = totals.setdefault(
+                key, dict.fromkeys((*NUTRITION_FIELDS, "logs_count"), 0)
+            )
+            delta["logs_count"] += sign
+            for field in NUTRITION_FIELDS:
+                delta[field] += sign * (getattr(log, field) or 0)
+        await self.totals_repo.add_many_to_totals(
+            [
+                {"user_id": user_id, "date": log_date, "type": meal_type, **delta}
+                for (user_id, log_date, meal_type), delta in totals.items()
+            ]
+        )
+
+    @staticmethod
+    def _log_values_from_product(
+        user_id: int,
+        product: FridgeProduct,
+        log_date: datetime.date,
+        meal_type: MealType,
+        weight: float,
+    ) -> dict:
+        ratio = weight / 100.0
+        return {
+            "user_id": user_id,
+            "date": log_date,
+            "type": meal_type,
+            "weight": weight,
+            "name": product.product_name,
+            "calories": round(product.calories_100g * ratio, 0),
+            "proteins": round(product.proteins_100g * ratio, 1),
+            "fats": round(product.fats_100g * ratio, 1),
+            "carbs": round(product.carbs_100g * ratio, 1),
+        }
+
+    def _log_values_from_fridge_meal(
+        self, user_id: int, meal: FridgeMeal, data: MealLogFromMealCreate
+    ) -> list[dict]:
+        meal_weight = sum(i.weight for i in meal.ingredients)
+        scale_factor = data.weight / meal_weight
+        return [
+            self._log_values_from_product(
+                user_id,
+                ingredient.fridge_product,
+                data.date,
+                data.type,
+                round(ingredient.weight * scale_factor, 1),
+            )
+            for ingredient in meal.ingredients
+        ]
+
+    async def _insert_meal_logs(self, values: list[dict]) -> Sequence[Row]:
+        if not values:
+            return []
+        logs = await self.repo.insert_meal_logs(values)
+        await self._add_logs_to_daily_totals(logs)
+        await self.repo.commit_or_conflict()
+        return logs
+
     async def create_meal_log_quick(
         self, user_id: int, data: MealLogQuickCreate
     ) -> MealLog:
         meal = MealLog(**data.model_dump(exclude_unset=True), user_id=user_id)
-        self.repo.add(meal)
-        await self.repo.commit_or_conflict()
-        return await self.repo.refresh_and_return(meal)
+        await self._add_logs_to_daily_totals([meal])
+        return await self.repo.save(meal)
 
     async def create_meal_log_from_fridge_product(
         self, user_id, fridge_id: int, data: MealLogFromProductCreate
@@ -35,55 +111,64 @@ class MealService:
         product = await self.fridge_product_repo.get_fridge_product(
             fridge_id, data.fridge_product_id
         )
-
-        ratio = data.weight / 100.0
         log = MealLog(
-            user_id=user_id,
-            date=data.date,
-            type=data.type,
-            weight=data.weight,
-            name=product.product_name,
-            calories=round(product.calories_100g * ratio, 0),
-            proteins=round(product.proteins_100g * ratio, 1),
-            fats=round(product.fats_100g * ratio, 1),
-            carbs=round(product.carbs_100g * ratio, 1),
+            **self._log_values_from_product(
+                user_id, product, data.date, data.type, data.weight
+            )
         )
-        self.repo.add(log)
-        await self.repo.commit_or_conflict()
-        return await self.repo.refresh_and_return(log)
+        await self._add_logs_to_daily_totals([log])
+        return await self.repo.save(log)
 
     async def create_meal_logs_from_fridge_meal(
-        self, user_id, fridge_id: int, data: MealLogFromProductCreate
-    ) -> Sequence[MealLog]:
+        self, user_id, fridge_id: int, data: MealLogFromMealCreate
+    ) -> Sequence[Row]:
         meal = await self.fridge_meal_repo.get_fridge_meal_entity(
             fridge_id, data.fridge_meal_id
         )
+        return await self._insert_meal_logs(
+            self._log_values_from_fridge_meal(user_id, meal, data)
+        )
 
-        meal_weight = sum(i.weight for i in meal.ingredients)
-        scale_factor = data.weight / meal_weight
-        logs = []
-        for ingredient in meal.ingredients:
-            product = ingredient.fridge_product
-            scaled_weight = ingredient.weight * scale_factor
-            ratio = scaled_weight / 100.0
-            logs.append(
-                MealLog(
-                    user_id=user_id,
-                    date=data.date,
-                    type=data.type,
-                    weight=round(scaled_weight, 1),
-                    name=product.product_name,
-                    calories=round(product.calories_100g * ratio, 0),
-                    proteins=round(product.proteins_100g * ratio, 1),
-                    fats=round(product.fats_100g * ratio, 1),
-                    carbs=round(product.carbs_100g * ratio, 1),
+    async def create_meal_logs_bulk(
+        self, user_id: int, fridge_id: int, data: MealLogBulkCreate
+    ) -> Sequence[Row]:
+        product_ids = {entry.fridge_product_id for entry in data.from_product}
+        meal_ids = {entry.fridge_meal_id for entry in data.from_meal}
+        products = {}
+        if product_ids:
+            found = await self.fridge_product_repo.get_fridge_products_by_ids(
+                fridge_id, product_ids
+            )
+            products = {product.id: product for product in found}
+            if products.keys() != product_ids:
+                raise NotFoundError("Fridge product not found")
+        meals = {}
+        if meal_ids:
+            found = await self.fridge_meal_repo.get_fridge_meal_entities(
+                fridge_id, meal_ids
+            )
+            meals = {meal.id: meal for meal in found}
+            if meals.keys() != meal_ids:
+                raise NotFoundError("Meal not found")
+
+        values = [{**entry.model_dump(), "user_id": user_id} for entry in data.quick]
+        for entry in data.from_product:
+            values.append(
+                self._log_values_from_product(
+                    user_id,
+                    products[entry.fridge_product_id],
+                    entry.date,
+                    entry.type,
+                    entry.weight,
                 )
             )
-        self.repo.add_all_products(logs)
-        await self.repo.commit_or_conflict()
-        for log in logs:
-            await self.repo.refresh(log)
-        return logs
+        for entry in data.from_meal:
+            values.extend(
+                self._log_values_from_fridge_meal(
+                    user_id, meals[entry.fridge_meal_id], entry
+                )
+            )
+        return await self._insert_meal_logs(values)
 
     async def get_meal_log_by_id(self, user_id: int, meal_id: int) -> MealLog:
         return await self.repo.get_by_id_for_user(user_id, meal_id)
@@ -93,24 +178,84 @@ class MealService:
     ) -> Sequence[MealLogRead]:
         return await self.repo.get_meal_logs(user_id, meal_date)
 
+    async def get_meal_logs_range(
+        self,
+        user_id: int,
+        date_from: datetime.date,
+        date_to: datetime.date,
+        meal_type: MealType | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> MealLogPage:
+        after = decode_cursor(cursor) if cursor is not None else None
+        logs = await self.repo.get_meal_logs_range(
+            user_id, date_from, date_to, limit + 1, meal_type, after
+        )
+        next_cursor = None
+        if len(logs) > limit:
+            logs = logs[:limit]
+            next_cursor = encode_cursor(logs[-1].date, logs[-1].id)
+        return MealLogPage(
+            items=[MealLogRead.model_validate(log) for log in logs],
+            next_cursor=next_cursor,
+        )
+
     async def update_meal_log_name(self, user_id, log_id: int, new_name: str):
         log = await self.repo.get_by_id_for_user(user_id, log_id)
         log.name = new_name
         await self.repo.commit_or_conflict()
-        await self.repo.refresh(log)
         return log
 
     async def update_meal_log_weight(self, user_id, log_id: int, new_weight: float):
         log = await self.repo.get_by_id_for_user(user_id, log_id)
+        previous = {field: getattr(log, field) for field in NUTRITION_FIELDS}
         ratio = new_weight / log.weight
         log.weight = new_weight
         log.calories *= ratio
         log.proteins *= ratio
         log.fats *= ratio
         log.carbs *= ratio
+        await self.totals_repo.add_to_totals(
+            user_id,
+            log.date,
+            log.type,
+            **{
+                field: getattr(log, field) - previous[field]
+                for field in NUTRITION_FIELDS
+            },
+        )
         await self.repo.commit_or_conflict()
-        await self.repo.refresh(log)
         return log
 
     async def delete_meal_log(self, user_id: int, meal_id: int) -> MealLog:
-        return await self.repo.delete_by_id_for_user(user_id, meal_id)
+        log = await self.repo.get_by_id_for_user(user_id, meal_id)
+        await self.repo.delete(log)
+        await self._add_logs_to_daily_totals([log], sign=-1)
+        try:
+            await self.repo.commit_or_conflict()
+        except IntegrityError:
+            raise ConflictError("Could not delete MealLog") from None
+        return log
+
+    async def get_daily_summaries(
+        self, user_id: int, date_from: datetime.date, date_to: datetime.date
+    ) -> list[DailyNutritionSummary]:
+        totals = await self.totals_repo.get_totals(user_id, date_from, date_to)
+        summaries: dict[datetime.date, DailyNutritionSummary] = {}
+        for total in totals:
+            summary = summaries.setdefault(
+                total.date, DailyNutritionSummary(date=total.date)
+            )
+            meal_summary = MealTypeNutritionSummary.model_validate(total)
+            for field in NUTRITION_FIELDS:
+                value = round(getattr(total, field), 1)
+                setattr(meal_summary, field, value)
+                setattr(summary, field, round(getattr(summary, field) + value, 1))
+            summary.meals.append(meal_summary)
+        return list(summaries.values())
+
+    async def get_daily_summary(
+        self, user_id: int, summary_date: datetime.date
+    ) -> DailyNutritionSummary:
+        summaries = await self.get_daily_summaries(user_id, summary_date, summary_date)
+        return summaries[0] if summaries else DailyNutritionSummary(date=summary_date)
@@ -0,0 +1,99 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.measurements.schemas import WeightRead
+
+logger = logging.getLogger(__name__)
+
+LATEST_WEIGHT_CHANNEL = "latest_weight:invalidate"
+
+MISSING = object()
+
+
+class LatestWeightCache:
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[int, tuple[float, WeightRead | None]] = OrderedDict()
+        self.invalidations = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> WeightRead | None | object:
+        """Return the cached latest weight, None for users without one, or MISSING."""
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return MISSING
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        return entry[1]
+
+    def set(
+        self,
+        user_id: int,
+        weight: WeightRead | None,
+        seen: int,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        # A write that landed while the weight was being read makes it stale
+        if seen != self.invalidations:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[user_id] = (time.monotonic() + ttl, weight)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        self.invalidations += 1
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self.invalidations += 1
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+latest_weight_cache = LatestWeightCache(
+    max_size=settings.LATEST_WEIGHT_CACHE_MAX_SIZE,
+    ttl_seconds=settings.LATEST_WEIGHT_CACHE_TTL_SECONDS,
+)
+
+
+async def invalidate_latest_weight(user_id: int, redis: Redis | None = None) -> None:
+    latest_weight_cache.invalidate(user_id)
+    if redis is None:
+        return
+    try:
+        await redis.publish(LATEST_WEIGHT_CHANNEL, user_id)
+    except Exception as e:
+        logger.warning(
+            f"Failed to publish latest weight invalidation for {user_id}: {e}"
+        )
+
+
+async def listen_for_latest_weight_invalidations(redis: Redis, retry_seconds: int = 5):
+    while True:
+        try:
+            async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(LATEST_WEIGHT_CHANNEL)
+                # Invalidations may have been missed while disconnected
+                latest_weight_cache.clear()
+                async for message in pubsub.listen():
+                    latest_weight_cache.invalidate(int(message["data"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Latest weight invalidation listener error: {e}")
+            latest_weight_cache.clear()
+            await asyncio.sleep(retry_seconds)
@@ -2,21 +2,39 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from app.auth.dependencies import ReadSessionDep
 from app.core.db import DbSessionDep
+from app.core.redis_session import RedisDep
 from app.measurements.services import MeasurementsService, WeightService
 
 
-def get_weight_service(db: DbSessionDep):
-    return WeightService(db)
+def get_weight_service(db: DbSessionDep, redis: RedisDep):
+    return WeightService(db, redis)
 
 
 WeightServiceDep = Annotated[WeightService, Depends(get_weight_service)]
 
 
-def get_measurements_service(db: DbSessionDep):
-    return MeasurementsService(db)
+def get_read_weight_service(db: ReadSessionDep):
+    return WeightService(db)
+
+
+ReadWeightServiceDep = Annotated[WeightService, Depends(get_read_weight_service)]
+
+
+def get_measurements_service(db: DbSessionDep, redis: RedisDep):
+    return MeasurementsService(db, redis)
 
 
 MeasurementsServiceDep = Annotated[
     MeasurementsService, Depends(get_measurements_service)
 ]
+
+
+def get_read_measurements_service(db: ReadSessionDep):
+    return MeasurementsService(db)
+
+
+ReadMeasurementsServiceDep = Annotated[
+    MeasurementsService, Depends(get_read_measurements_service)
+]
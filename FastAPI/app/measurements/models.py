@@ -1,12 +1,20 @@
 from datetime import date
 
-from sqlalchemy import Column, Date, Float, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import (
+    Column,
+    Date,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import relationship
 
-from app.core.db import Base
+from app.core.db import Base, UpdatedAtMixin
 
 
-class Weight(Base):
+class Weight(UpdatedAtMixin, Base):
     __tablename__ = "weights"
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(
@@ -14,13 +22,22 @@ class Weight(Base):
     )
     date = Column(Date, default=date.today, index=True, nullable=False)
     weight = Column(Float, nullable=False)
-    __table_args__ = (UniqueConstraint("user_id", "date", name="weight_user_date_uc"),)
+    __table_args__ = (
+        UniqueConstraint("user_id", "date", name="weight_user_date_uc"),
+        Index("ix_weights_user_id_updated_at", "user_id", "updated_at"),
+    )
 
     user = relationship("User", back_populates="weights")
     measurements = relationship("Measurement", back_populates="weight")
 
 
-class Measurement(Base):
+# Lets the (date, id) keyset comparison be the index condition of history pages
+Index(
+    "ix_weights_user_id_date_id", Weight.user_id, Weight.date.desc(), Weight.id.desc()
+)
+
+
+class Measurement(UpdatedAtMixin, Base):
     __tablename__ = "measurements"
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(
@@ -39,7 +56,16 @@ class Measurement(Base):
     calves = Column(Float)
     __table_args__ = (
         UniqueConstraint("user_id", "date", name="measurement_user_date_uc"),
+        Index("ix_measurements_user_id_updated_at", "user_id", "updated_at"),
     )
 
     user = relationship("User", back_populates="measurements")
     weight = relationship("Weight", back_populates="measurements", lazy="joined")
+
+
+Index(
+    "ix_measurements_user_id_date_id",
+    Measurement.user_id,
+    Measurement.date.desc(),
+    Measurement.id.desc(),
+)
@@ -1,6 +1,7 @@
 from collections.abc import Sequence
+from datetime import date
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -12,36 +13,38 @@ class MeasurementRepository(UserScopedRepository[Measurement]):
     def __init__(self, db: AsyncSession):
         super().__init__(db, Measurement)
 
-    async def get_latest_measurements(self, user_id: int) -> Measurement:
+    async def get_recent_measurements(
+        self, user_id: int, count: int
+    ) -> Sequence[Measurement]:
         result = await self.db.execute(
             select(Measurement)
             .options(selectinload(Measurement.weight))
             .where(Measurement.user_id == user_id)
-            .order_by(Measurement.date.desc())
+            .order_by(Measurement.date.desc(), Measurement.id.desc())
+            .limit(count)
         )
-        return result.scalars().first()
+        return result.scalars().all()
 
-    async def get_previous_measurements(self, user_id: int) -> Measurement:
-        result = await self.db.execute(
-            select(Measurement)
-            .options(selectinload(Measurement.weight))
-            .where(Measurement.user_id == user_id)
-            .order_by(Measurement.date.desc())
-            .offset(1)
-            .limit(1)
-        )
-        return result.scalars().first()
+    async def get_latest_measurements(self, user_id: int) -> Measurement | None:
+        measurements = await self.get_recent_measurements(user_id, 1)
+        return measurements[0] if measurements else None
+
+    async def get_previous_measurements(self, user_id: int) -> Measurement | None:
+        measurements = await self.get_recent_measurements(user_id, 2)
+        return measurements[1] if len(measurements) > 1 else None
 
     async def get_measurements_list(
-        self, user_id: int, offset: int, limit: int
+        self, user_id: int, limit: int, before: tuple[date, int] | None = None
     ) -> Sequence[Measurement]:
-        result = await self.db.execute(
+        stmt = (
             select(Measurement)
             .options(selectinload(Measurement.weight))
             .where(Measurement.user_id == user_id)
-            .order_by(Measurement.date.desc())
-            .offset(offset)
-            .limit(limit)
+        )
+        if before is not None:
+            stmt = stmt.where(tuple_(Measurement.date, Measurement.id) < before)
+        result = await self.db.execute(
+            stmt.order_by(Measurement.date.desc(), Measurement.id.desc()).limit(limit)
         )
         return result.scalars().all()
 
@@ -64,30 +67,30 @@ class WeightRepository(UserScopedRepository[Weight]):
         )
         return result.scalar_one_or_none()
 
-    async def get_current_weight(self, user_id: int) -> Weight | None:
-        result = await self.db.execute(
-            select(Weight).where(Weight.user_id == user_id).order_by(Weight.date.desc())
-        )
-        return result.scalars().first()
-
-    async def get_previous_weight(self, user_id: int) -> Weight | None:
+    async def get_recent_weights(self, user_id: int, count: int) -> Sequence[Weight]:
         result = await self.db.execute(
             select(Weight)
             .where(Weight.user_id == user_id)
-            .order_by(Weight.date.desc())
-            .offset(1)
-            .limit(1)
+            .order_by(Weight.date.desc(), Weight.id.desc())
+            .limit(count)
         )
-        return result.scalars().first()
+        return result.scalars().all()
+
+    async def get_current_weight(self, user_id: int) -> Weight | None:
+        weights = await self.get_recent_weights(user_id, 1)
+        return weights[0] if weights else None
+
+    async def get_previous_weight(self, user_id: int) -> Weight | None:
+        weights = await self.get_recent_weights(user_id, 2)
+        return weights[1] if len(weights) > 1 else None
 
     async def get_weights(
-        self, user_id, offset: int, limit: int
-    ) -> Sequence[Weight | None]:
+        self, user_id: int, limit: int, before: tuple[date, int] | None = None
+    ) -> Sequence[Weight]:
+        stmt = select(Weight).where(Weight.user_id == user_id)
+        if before is not None:
+            stmt = stmt.where(tuple_(Weight.date, Weight.id) < before)
         result = await self.db.execute(
-            select(Weight)
-            .where(Weight.user_id == user_id)
-            .order_by(Weight.date.desc())
-            .offset(offset)
-            .limit(limit)
+            stmt.order_by(Weight.date.desc(), Weight.id.desc()).limit(limit)
         )
         return result.scalars().all()
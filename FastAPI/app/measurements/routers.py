@@ -1,14 +1,22 @@
-from collections.abc import Sequence
+from typing import Annotated
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Response
 
 from app.auth.dependencies import UserDep
-from app.measurements.dependencies import MeasurementsServiceDep, WeightServiceDep
+from app.core.responses import model_list_response
+from app.measurements.dependencies import (
+    MeasurementsServiceDep,
+    ReadMeasurementsServiceDep,
+    ReadWeightServiceDep,
+    WeightServiceDep,
+)
 from app.measurements.models import Measurement, Weight
 from app.measurements.schemas import (
     MeasurementsCreate,
+    MeasurementsPage,
     MeasurementsRead,
     WeightCreate,
+    WeightPage,
     WeightRead,
 )
 
@@ -27,30 +35,47 @@ async def add_measurements(
 
 @measurements_router.get("/latest", response_model=MeasurementsRead | None)
 async def read_latest_measurements(
-    measurements_service: MeasurementsServiceDep, user: UserDep
+    measurements_service: ReadMeasurementsServiceDep, user: UserDep
 ) -> Measurement:
     return await measurements_service.get_latest_measurements(user.id)
 
 
 @measurements_router.get("/previous", response_model=MeasurementsRead | None)
 async def read_previous_measurements(
-    measurements_service: MeasurementsServiceDep, user: UserDep
+    measurements_service: ReadMeasurementsServiceDep, user: UserDep
 ) -> Measurement:
     return await measurements_service.get_previous_measurements(user.id)
 
 
+@measurements_router.get("/trend-head", response_model=list[MeasurementsRead])
+async def read_measurements_trend_head(
+    measurements_service: ReadMeasurementsServiceDep,
+    user: UserDep,
+    limit: Annotated[int, Query(ge=1, le=30)] = 2,
+) -> Response:
+    return model_list_response(
+        MeasurementsRead,
+        await measurements_service.get_recent_measurements(user.id, limit),
+    )
+
+
 @measurements_router.get("/{measurements_id}", response_model=MeasurementsRead)
 async def read_measurements(
-    measurements_service: MeasurementsServiceDep, user: UserDep, measurements_id: int
+    measurements_service: ReadMeasurementsServiceDep,
+    user: UserDep,
+    measurements_id: int,
 ) -> Measurement:
     return await measurements_service.get_measurements(user.id, measurements_id)
 
 
-@measurements_router.get("", response_model=list[MeasurementsRead])
+@measurements_router.get("", response_model=MeasurementsPage)
 async def read_measurements_list(
-    measurements_service: MeasurementsServiceDep, user: UserDep
-) -> Sequence[Measurement]:
-    return await measurements_service.get_measurements_list(user.id)
+    measurements_service: ReadMeasurementsServiceDep,
+    user: UserDep,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+) -> MeasurementsPage:
+    return await measurements_service.get_measurements_list(user.id, cursor, limit)
 
 
 @measurements_router.delete("/{measurements_id}", response_model=MeasurementsRead)
@@ -69,30 +94,44 @@ async def add_weight(
 
 @weights_router.get("/current", response_model=WeightRead | None)
 async def read_current_weight(
-    weight_service: WeightServiceDep, user: UserDep
-) -> Weight:
+    weight_service: ReadWeightServiceDep, user: UserDep
+) -> WeightRead | None:
     return await weight_service.get_current_weight(user.id)
 
 
 @weights_router.get("/previous", response_model=WeightRead | None)
 async def read_previous_weight(
-    weight_service: WeightServiceDep, user: UserDep
+    weight_service: ReadWeightServiceDep, user: UserDep
 ) -> Weight:
     return await weight_service.get_previous_weight(user.id)
 
 
+@weights_router.get("/trend-head", response_model=list[WeightRead])
+async def read_weight_trend_head(
+    weight_service: ReadWeightServiceDep,
+    user: UserDep,
+    limit: Annotated[int, Query(ge=1, le=30)] = 2,
+) -> Response:
+    return model_list_response(
+        WeightRead, await weight_service.get_recent_weights(user.id, limit)
+    )
+
+
 @weights_router.get("/{weight_id}", response_model=WeightRead)
 async def read_user_weight(
-    weight_service: WeightServiceDep, user: UserDep, weight_id: int
+    weight_service: ReadWeightServiceDep, user: UserDep, weight_id: int
 ) -> Weight | None:
     return await weight_service.get_user_weight(user.id, weight_id)
 
 
-@weights_router.get("", response_model=list[WeightRead])
+@weights_router.get("", response_model=WeightPage)
 async def read_user_weights(
-    weight_service: WeightServiceDep, user: UserDep
-) -> Sequence[Weight]:
-    return await weight_service.get_user_weights(user.id)
+    weight_service: ReadWeightServiceDep,
+    user: UserDep,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=500)] = 50,
+) -> WeightPage:
+    return await weight_service.get_user_weights(user.id, cursor, limit)
 
 
 @weights_router.delete("/{weight_id}", response_model=WeightRead)
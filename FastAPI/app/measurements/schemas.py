@@ -16,6 +16,11 @@ class WeightRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class WeightPage(BaseModel):
+    items: list[WeightRead]
+    next_cursor: str | None = None
+
+
 class MeasurementsCreate(BaseModel):
     date: dt.date = Field(default_factory=dt.date.today)
     weight: WeightCreate | None = Field(default=None)
@@ -58,3 +63,8 @@ class MeasurementsRead(BaseModel):
     calves: float | None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class MeasurementsPage(BaseModel):
+    items: list[MeasurementsRead]
+    next_cursor: str | None = None
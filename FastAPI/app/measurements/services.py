@@ -1,22 +1,37 @@
 import logging
 from collections.abc import Sequence
 
+from redis.asyncio import Redis
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.exceptions import ConflictError
+from app.measurements.cache import (
+    MISSING,
+    invalidate_latest_weight,
+    latest_weight_cache,
+)
 from app.measurements.models import Measurement, Weight
 from app.measurements.repositories import MeasurementRepository, WeightRepository
-from app.measurements.schemas import MeasurementsCreate, WeightCreate
+from app.measurements.schemas import (
+    MeasurementsCreate,
+    MeasurementsPage,
+    MeasurementsRead,
+    WeightCreate,
+    WeightPage,
+    WeightRead,
+)
+from app.utils.pagination import decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
 
 class MeasurementsService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis: Redis | None = None):
         self.repo = MeasurementRepository(db)
         self.weight_repo = WeightRepository(db)
-        self.weight_service = WeightService(db)
+        self.weight_service = WeightService(db, redis)
 
     async def create_measurements(
         self, user_id: int, data: MeasurementsCreate
@@ -33,13 +48,13 @@ class MeasurementsService:
             measurement = Measurement(
                 user_id=user_id,
                 date=data.date,
-                weight_id=weight_in.id if weight_in else None,
+                weight=weight_in,
                 **data.model_dump(exclude={"weight", "date"}),
             )
             self.repo.add(measurement)
         else:
             if weight_in:
-                measurement.weight_id = weight_in.id
+                measurement.weight = weight_in
             update_data = data.model_dump(
                 exclude={"weight", "date"}, exclude_unset=True
             )
@@ -47,7 +62,9 @@ class MeasurementsService:
                 setattr(measurement, key, value)
 
         await self.repo.commit_or_conflict()
-        return await self.repo.refresh_and_return(measurement)
+        if weight_in is not None:
+            await self.weight_service.refresh_current_weight(user_id)
+        return measurement
 
     async def get_measurements(self, user_id: int, measurement_id: int) -> Measurement:
         return await self.repo.get_by_id_for_user(user_id, measurement_id)
@@ -55,13 +72,27 @@ class MeasurementsService:
     async def get_latest_measurements(self, user_id: int) -> Measurement:
         return await self.repo.get_latest_measurements(user_id)
 
+    async def get_recent_measurements(
+        self, user_id: int, count: int = 2
+    ) -> Sequence[Measurement]:
+        return await self.repo.get_recent_measurements(user_id, count)
+
     async def get_previous_measurements(self, user_id: int) -> Measurement:
         return await self.repo.get_previous_measurements(user_id)
 
     async def get_measurements_list(
-        self, user_id: int, offset: int = 0, limit: int = 10
-    ) -> Sequence[Measurement]:
-        return await self.repo.get_measurements_list(user_id, offset, limit)
+        self, user_id: int, cursor: str | None = None, limit: int = 50
+    ) -> MeasurementsPage:
+        before = decode_cursor(cursor) if cursor is not None else None
+        measurements = await self.repo.get_measurements_list(user_id, limit + 1, before)
+        next_cursor = None
+        if len(measurements) > limit:
+            measurements = measurements[:limit]
+            next_cursor = encode_cursor(measurements[-1].date, measurements[-1].id)
+        return MeasurementsPage(
+            items=[MeasurementsRead.model_validate(m) for m in measurements],
+            next_cursor=next_cursor,
+        )
 
     async def delete_measurements(
         self, user_id: int, measurements_id: int
@@ -70,9 +101,10 @@ class MeasurementsService:
 
 
 class WeightService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis: Redis | None = None):
         self.db = db
         self.repo = WeightRepository(db)
+        self.redis = redis
 
     async def get_and_update_or_create_weight(
         self, user_id: int, data: WeightCreate
@@ -96,10 +128,35 @@ class WeightService:
             raise ConflictError(
                 f"Weight with date:{data.date} already exists"
             ) from None
-        return await self.repo.refresh_and_return(weight)
+        await self.refresh_current_weight(user_id)
+        return weight
 
-    async def get_current_weight(self, user_id: int) -> Weight | None:
-        return await self.repo.get_current_weight(user_id)
+    async def _load_current_weight(self, user_id: int) -> WeightRead | None:
+        seen = latest_weight_cache.invalidations
+        weight = await self.repo.get_current_weight(user_id)
+        current = WeightRead.model_validate(weight) if weight else None
+        # A lagging replica may still return a weight that another worker has
+        # already invalidated, so its answer is only kept for the lag bound
+        ttl = settings.REPLICA_MAX_LAG_SECONDS if self.db.info.get("replica") else None
+        latest_weight_cache.set(user_id, current, seen, ttl)
+        return current
+
+    async def refresh_current_weight(self, user_id: int) -> None:
+        # Writes run on the primary, so the writing worker refills its cache at
+        # once, other workers drop their entry
+        await invalidate_latest_weight(user_id, self.redis)
+        await self._load_current_weight(user_id)
+
+    async def get_current_weight(self, user_id: int) -> WeightRead | None:
+        cached = latest_weight_cache.get(user_id)
+        if cached is not MISSING:
+            return cached
+        return await self._load_current_weight(user_id)
+
+    async def get_recent_weights(
+        self, user_id: int, count: int = 2
+    ) -> Sequence[Weight]:
+        return await self.repo.get_recent_weights(user_id, count)
 
     async def get_previous_weight(self, user_id: int) -> Weight | None:
         return await self.repo.get_previous_weight(user_id)
@@ -108,9 +165,20 @@ class WeightService:
         return await self.repo.get_by_id_for_user(user_id, weight_id)
 
     async def get_user_weights(
-        self, user_id: int, offset: int = 0, limit: int = 10
-    ) -> Sequence[Weight | None]:
-        return await self.repo.get_weights(user_id, offset, limit)
+        self, user_id: int, cursor: str | None = None, limit: int = 50
+    ) -> WeightPage:
+        before = decode_cursor(cursor) if cursor is not None else None
+        weights = await self.repo.get_weights(user_id, limit + 1, before)
+        next_cursor = None
+        if len(weights) > limit:
+            weights = weights[:limit]
+            next_cursor = encode_cursor(weights[-1].date, weights[-1].id)
+        return WeightPage(
+            items=[WeightRead.model_validate(weight) for weight in weights],
+            next_cursor=next_cursor,
+        )
 
     async def delete_weight(self, user_id: int, weight_id: int) -> Weight:
-        return await self.repo.delete_by_id_for_user(user_id, weight_id)
+        weight = await self.repo.delete_by_id_for_user(user_id, weight_id)
+        await self.refresh_current_weight(user_id)
+        return weight
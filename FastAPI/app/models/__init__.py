@@ -1,6 +1,8 @@
+from app.catalog.models import CatalogProduct
 from app.fridge.models import Fridge, FridgeMeal, FridgeMealIngredient, FridgeProduct
-from app.meal.models import MealLog
+from app.meal.models import DailyNutritionTotal, MealLog
 from app.measurements.models import Measurement, Weight
+from app.sync.models import SyncTombstone
 from app.user.models import User
 
 __all__ = [
@@ -11,5 +13,8 @@ __all__ = [
     "FridgeMeal",
     "FridgeProduct",
     "FridgeMealIngredient",
+    "CatalogProduct",
     "MealLog",
+    "DailyNutritionTotal",
+    "SyncTombstone",
 ]
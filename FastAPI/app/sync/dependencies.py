@@ -0,0 +1,13 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from app.core.db import DbSessionDep
+from app.sync.services import SyncService
+
+
+def get_sync_service(db: DbSessionDep) -> SyncService:
+    return SyncService(db)
+
+
+SyncServiceDep = Annotated[SyncService, Depends(get_sync_service)]
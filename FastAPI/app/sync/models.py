@@ -0,0 +1,52 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, event
+from sqlalchemy.orm import Session
+
+from app.core.db import Base, utc_now
+from app.fridge.models import Fridge, FridgeMeal, FridgeProduct
+from app.meal.models import MealLog
+from app.measurements.models import Measurement, Weight
+from app.user.models import User
+
+
+class SyncTombstone(Base):
+    __tablename__ = "sync_tombstones"
+    id = Column(Integer, primary_key=True)
+    entity = Column(String, nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    fridge_id = Column(Integer, ForeignKey("fridges.id", ondelete="CASCADE"))
+    deleted_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+    __table_args__ = (
+        Index("ix_sync_tombstones_user_id_deleted_at", "user_id", "deleted_at"),
+        Index("ix_sync_tombstones_fridge_id_deleted_at", "fridge_id", "deleted_at"),
+    )
+
+
+USER_SCOPED_MODELS = (MealLog, Weight, Measurement)
+FRIDGE_SCOPED_MODELS = (FridgeProduct, FridgeMeal)
+
+
+@event.listens_for(Session, "before_flush")
+def _record_tombstones(session: Session, flush_context, instances) -> None:
+    # Ingredients deleted by cascade are not recorded, clients drop them together
+    # with their meal or product. Rows deleted along with their owner need no
+    # tombstone either.
+    deleted_users = {obj.id for obj in session.deleted if isinstance(obj, User)}
+    deleted_fridges = {obj.id for obj in session.deleted if isinstance(obj, Fridge)}
+    for obj in list(session.deleted):
+        if isinstance(obj, USER_SCOPED_MODELS):
+            if obj.user_id not in deleted_users:
+                session.add(
+                    SyncTombstone(
+                        entity=obj.__tablename__, entity_id=obj.id, user_id=obj.user_id
+                    )
+                )
+        elif isinstance(obj, FRIDGE_SCOPED_MODELS):
+            if obj.fridge_id not in deleted_fridges:
+                session.add(
+                    SyncTombstone(
+                        entity=obj.__tablename__,
+                        entity_id=obj.id,
+                        fridge_id=obj.fridge_id,
+                    )
+                )
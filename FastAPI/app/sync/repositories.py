@@ -0,0 +1,58 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import Row, delete, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.base_repository import BaseRepository
+from app.fridge.models import FridgeMeal, FridgeMealIngredient
+from app.sync.models import SyncTombstone
+
+
+class SyncRepository(BaseRepository[SyncTombstone]):
+    def __init__(self, db: AsyncSession):
+        super().__init__(db, SyncTombstone)
+
+    async def get_changed(
+        self, model, scope_column, scope_id: int, since: datetime | None
+    ) -> Sequence:
+        stmt = select(model).where(scope_column == scope_id)
+        if since is not None:
+            stmt = stmt.where(model.updated_at > since)
+        result = await self.db.execute(stmt.order_by(model.id))
+        return result.scalars().all()
+
+    async def get_changed_ingredients(
+        self, fridge_id: int, since: datetime | None
+    ) -> Sequence[FridgeMealIngredient]:
+        stmt = (
+            select(FridgeMealIngredient)
+            .join(FridgeMeal, FridgeMealIngredient.fridge_meal_id == FridgeMeal.id)
+            .where(FridgeMeal.fridge_id == fridge_id)
+        )
+        if since is not None:
+            stmt = stmt.where(FridgeMealIngredient.updated_at > since)
+        result = await self.db.execute(stmt.order_by(FridgeMealIngredient.id))
+        return result.scalars().all()
+
+    async def get_tombstones(
+        self, user_id: int, fridge_id: int, since: datetime
+    ) -> Sequence[Row]:
+        result = await self.db.execute(
+            select(SyncTombstone.entity, SyncTombstone.entity_id)
+            .where(
+                or_(
+                    SyncTombstone.user_id == user_id,
+                    SyncTombstone.fridge_id == fridge_id,
+                ),
+                SyncTombstone.deleted_at > since,
+            )
+            .order_by(SyncTombstone.id)
+        )
+        return result.all()
+
+    async def prune_tombstones(self, before: datetime) -> int:
+        result = await self.db.execute(
+            delete(SyncTombstone).where(SyncTombstone.deleted_at < before)
+        )
+        return result.rowcount
@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+
+from app.auth.dependencies import UserDep
+from app.fridge.dependencies import FridgeDep
+from app.sync.dependencies import SyncServiceDep
+from app.sync.schemas import SyncChanges
+
+router = APIRouter(prefix="/sync", tags=["sync"])
+
+
+# Served from the primary, a lagging replica could hide rows behind the cursor
+@router.get("", response_model=SyncChanges)
+async def read_sync_changes(
+    sync_service: SyncServiceDep,
+    user: UserDep,
+    fridge: FridgeDep,
+    cursor: str | None = None,
+) -> SyncChanges:
+    return await sync_service.get_changes(user.id, fridge.id, cursor)
@@ -0,0 +1,27 @@
+from pydantic import BaseModel, ConfigDict
+
+from app.fridge.schemas import (
+    FridgeMealIngredientSimpleRead,
+    FridgeMealRead,
+    FridgeProductRead,
+)
+from app.meal.schemas import MealLogRead
+from app.measurements.schemas import MeasurementsRead, WeightRead
+
+
+class FridgeMealIngredientSyncRead(FridgeMealIngredientSimpleRead):
+    fridge_meal_id: int
+
+
+class SyncChanges(BaseModel):
+    cursor: str
+    full: bool
+    fridge_products: list[FridgeProductRead] = []
+    fridge_meals: list[FridgeMealRead] = []
+    fridge_meal_ingredients: list[FridgeMealIngredientSyncRead] = []
+    meal_logs: list[MealLogRead] = []
+    weights: list[WeightRead] = []
+    measurements: list[MeasurementsRead] = []
+    deleted: dict[str, list[int]] = {}
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,86 @@
+import asyncio
+import logging
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db import session_manager, utc_now
+from app.fridge.models import FridgeMeal, FridgeProduct
+from app.meal.models import MealLog
+from app.measurements.models import Measurement, Weight
+from app.sync.repositories import SyncRepository
+from app.sync.schemas import SyncChanges
+from app.utils.pagination import decode_sync_cursor, encode_sync_cursor
+
+logger = logging.getLogger(__name__)
+
+
+class SyncService:
+    def __init__(self, db: AsyncSession):
+        self.repo = SyncRepository(db)
+
+    async def get_changes(
+        self, user_id: int, fridge_id: int, cursor: str | None = None
+    ) -> SyncChanges:
+        now = utc_now()
+        since = decode_sync_cursor(cursor) if cursor is not None else None
+        retention = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+        if since is not None and since < now - retention:
+            # tombstones this old may be pruned, so only a full snapshot is safe
+            since = None
+
+        changes = {
+            "fridge_products": await self.repo.get_changed(
+                FridgeProduct, FridgeProduct.fridge_id, fridge_id, since
+            ),
+            "fridge_meals": await self.repo.get_changed(
+                FridgeMeal, FridgeMeal.fridge_id, fridge_id, since
+            ),
+            "fridge_meal_ingredients": await self.repo.get_changed_ingredients(
+                fridge_id, since
+            ),
+            "meal_logs": await self.repo.get_changed(
+                MealLog, MealLog.user_id, user_id, since
+            ),
+            "weights": await self.repo.get_changed(
+                Weight, Weight.user_id, user_id, since
+            ),
+            "measurements": await self.repo.get_changed(
+                Measurement, Measurement.user_id, user_id, since
+            ),
+        }
+        deleted: dict[str, list[int]] = {}
+        if since is not None:
+            for entity, entity_id in await self.repo.get_tombstones(
+                user_id, fridge_id, since
+            ):
+                deleted.setdefault(entity, []).append(entity_id)
+
+        # Rows stamped by transactions still in flight may commit with an older
+        # updated_at, the overlap re-sends them on the next sync
+        overlap = timedelta(seconds=settings.SYNC_CURSOR_OVERLAP_SECONDS)
+        return SyncChanges.model_validate(
+            {
+                "cursor": encode_sync_cursor(now - overlap),
+                "full": since is None,
+                "deleted": deleted,
+                **changes,
+            }
+        )
+
+
+async def prune_tombstones_periodically(interval_seconds: float) -> None:
+    retention = timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    while True:
+        try:
+            async with session_manager.session() as db:
+                pruned = await SyncRepository(db).prune_tombstones(
+                    utc_now() - retention
+                )
+                await db.commit()
+            if pruned:
+                logger.info(f"Pruned {pruned} sync tombstones")
+        except Exception as e:
+            logger.warning(f"Sync tombstone pruning failed: {e}")
+        await asyncio.sleep(interval_seconds)
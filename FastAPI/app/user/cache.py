@@ -0,0 +1,102 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from redis.asyncio import Redis
+from sqlalchemy import inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.fridge.models import Fridge
+from app.user.models import User
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_CHANNEL = "user_cache:invalidate"
+
+
+class UserCache:
+    def __init__(self, max_size: int, ttl_seconds: int):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[int, tuple[float, dict[str, Any], int | None]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int) -> User | None:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        _, values, fridge_id = entry
+        user = User(**values)
+        if fridge_id is not None:
+            user.fridge = Fridge(id=fridge_id, user_id=user_id)
+            make_transient_to_detached(user.fridge)
+        make_transient_to_detached(user)
+        return user
+
+    def set(self, user: User) -> None:
+        values = {
+            attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs
+        }
+        fridge = None
+        if "fridge" not in inspect(user).unloaded:
+            fridge = user.fridge
+        self._entries[user.id] = (
+            time.monotonic() + self.ttl_seconds,
+            values,
+            fridge.id if fridge is not None else None,
+        )
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+user_cache = UserCache(
+    max_size=settings.USER_CACHE_MAX_SIZE, ttl_seconds=settings.USER_CACHE_TTL_SECONDS
+)
+
+
+async def invalidate_cached_user(user_id: int, redis: Redis | None = None) -> None:
+    user_cache.invalidate(user_id)
+    if redis is None:
+        return
+    try:
+        await redis.publish(USER_CACHE_CHANNEL, user_id)
+    except Exception as e:
+        logger.warning(f"Failed to publish user cache invalidation for {user_id}: {e}")
+
+
+async def listen_for_user_invalidations(redis: Redis, retry_seconds: int = 5):
+    while True:
+        try:
+            async with redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(USER_CACHE_CHANNEL)
+                # Invalidations may have been missed while disconnected
+                user_cache.clear()
+                async for message in pubsub.listen():
+                    user_cache.invalidate(int(message["data"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"User cache invalidation listener error: {e}")
+            user_cache.clear()
+            await asyncio.sleep(retry_seconds)
@@ -2,12 +2,21 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from app.auth.dependencies import ReadSessionDep
 from app.core.db import DbSessionDep
+from app.core.redis_session import RedisDep
 from app.user.services import UserService
 
 
-def get_user_service(db: DbSessionDep) -> UserService:
-    return UserService(db)
+def get_user_service(db: DbSessionDep, redis: RedisDep) -> UserService:
+    return UserService(db, redis)
 
 
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
+
+
+def get_read_user_service(db: ReadSessionDep) -> UserService:
+    return UserService(db)
+
+
+ReadUserServiceDep = Annotated[UserService, Depends(get_read_user_service)]
@@ -0,0 +1,75 @@
+import csv
+import datetime
+import io
+import json
+from collections.abc import AsyncIterator, Sequence
+from enum import Enum
+
+from sqlalchemy import Row, select
+
+from app.core.config import settings
+from app.core.db import SessionFactory
+from app.meal.models import MealLog
+from app.measurements.models import Measurement, Weight
+from app.utils.enums import FileFormat
+
+HISTORY_RECORDS = {"meal_log": MealLog, "weight": Weight, "measurement": Measurement}
+
+
+def _plain(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+def _record_fields(model) -> list[str]:
+    return [column.key for column in model.__table__.columns if column.key != "user_id"]
+
+
+def format_history_header(fields: list[str], file_format: FileFormat) -> str:
+    if file_format == FileFormat.JSONL:
+        return ""
+    return ",".join(["record", *fields]) + "\n"
+
+
+def _history_row(record: str, row: Row) -> dict:
+    return {
+        "record": record,
+        **{field: _plain(value) for field, value in row._mapping.items()},
+    }
+
+
+def format_history_rows(
+    record: str, fields: list[str], rows: Sequence[Row], file_format: FileFormat
+) -> str:
+    history_rows = [_history_row(record, row) for row in rows]
+    if file_format == FileFormat.JSONL:
+        return "".join(json.dumps(row) + "\n" for row in history_rows)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, ["record", *fields], lineterminator="\n")
+    writer.writerows(history_rows)
+    return buffer.getvalue()
+
+
+async def export_user_history(
+    session_factory: SessionFactory, user_id: int, file_format: FileFormat
+) -> AsyncIterator[str]:
+    """Stream meal logs, weights and measurements, one section per record type.
+
+    CSV sections start with their own header row, its first column is "record".
+    """
+    async with session_factory() as db:
+        for record, model in HISTORY_RECORDS.items():
+            fields = _record_fields(model)
+            yield format_history_header(fields, file_format)
+            # A server-side cursor keeps memory flat however long the history is
+            result = await db.stream(
+                select(*(model.__table__.c[field] for field in fields))
+                .where(model.user_id == user_id)
+                .order_by(model.date, model.id)
+                .execution_options(yield_per=settings.HISTORY_EXPORT_CHUNK_SIZE)
+            )
+            async for rows in result.partitions():
+                yield format_history_rows(record, fields, rows, file_format)
@@ -0,0 +1,75 @@
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+from app.core.exceptions import UnprocessableEntityError
+from app.core.security import PasswordHashingExecutor, password_hashing_executor
+from app.user.schemas import validate_password_strength
+
+logger = logging.getLogger(__name__)
+
+# Matches the max_length of password fields in app/user/schemas.py
+MAX_SCORED_LENGTH = 64
+
+
+def _password_policy_error(password: str) -> str | None:
+    try:
+        validate_password_strength(password)
+    except ValueError as e:
+        return str(e)
+    return None
+
+
+class PasswordPolicyService:
+    def __init__(
+        self, executor: PasswordHashingExecutor, max_size: int, ttl_seconds: int
+    ):
+        self.executor = executor
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # Keyed by digest so plaintext passwords are not kept in memory
+        self._results: OrderedDict[bytes, tuple[float, str | None]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    async def check(self, password: str) -> None:
+        password = password[:MAX_SCORED_LENGTH]
+        key = hashlib.sha256(password.encode()).digest()
+        entry = self._results.get(key)
+        if entry is not None and entry[0] >= time.monotonic():
+            self.hits += 1
+            error = entry[1]
+        else:
+            self.misses += 1
+            start = time.perf_counter()
+            error = await self.executor.run(_password_policy_error, password)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+            logger.debug("Password strength scored in %.1f ms", elapsed_ms)
+            self._results[key] = (time.monotonic() + self.ttl_seconds, error)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+        if error is not None:
+            raise UnprocessableEntityError(error)
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "size": len(self._results),
+            "hits": self.hits,
+            "misses": self.misses,
+            "avg_ms": round(self.total_ms / self.misses, 3) if self.misses else 0,
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+password_policy = PasswordPolicyService(
+    password_hashing_executor,
+    max_size=settings.PASSWORD_POLICY_CACHE_SIZE,
+    ttl_seconds=settings.PASSWORD_POLICY_CACHE_TTL_SECONDS,
+)
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, Response, status
+from fastapi.responses import StreamingResponse
 
-from app.auth.dependencies import UserDep
+from app.auth.dependencies import ReadSessionFactoryDep, UserDep
 from app.core.rate_limiting import rate_limiter as RateLimiter
-from app.user.dependencies import UserServiceDep
+from app.user.dependencies import ReadUserServiceDep, UserServiceDep
+from app.user.history_export import export_user_history
 from app.user.models import User
 from app.user.schemas import (
     DeleteUserData,
@@ -11,15 +13,32 @@ from app.user.schemas import (
     UserUpdateEmail,
     UserUpdatePassword,
 )
+from app.utils.enums import FileFormat
+from app.utils.streaming import MEDIA_TYPES
 
 router = APIRouter(prefix="/user", tags=["user"])
 
 
 @router.get("/me", response_model=UserRead)
-async def read_current_user(user_service: UserServiceDep, user: UserDep) -> User:
+async def read_current_user(user_service: ReadUserServiceDep, user: UserDep) -> User:
     return await user_service.get_current_user(user)
 
 
+@router.get("/me/export")
+async def export_user_history_file(
+    session_factory: ReadSessionFactoryDep,
+    user: UserDep,
+    format: FileFormat = FileFormat.CSV,
+) -> StreamingResponse:
+    return StreamingResponse(
+        export_user_history(session_factory, user.id, format),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="history.{format.value}"'
+        },
+    )
+
+
 @router.put("/me", response_model=UserRead)
 async def update_user_profile(
     user_service: UserServiceDep, user: UserDep, data: UserUpdate
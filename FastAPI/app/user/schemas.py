@@ -3,7 +3,6 @@ from pydantic import (
     ConfigDict,
     EmailStr,
     Field,
-    field_validator,
     model_validator,
 )
 from zxcvbn import zxcvbn
@@ -48,11 +47,6 @@ class UserCreate(BaseModel):
     activity_level: float | None = Field(default=None, ge=1, le=5)
     target_weekly_gain: float = Field(default=0, ge=-1, le=1)
 
-    @field_validator("password")
-    @classmethod
-    def check_password_strength(cls, value: str):
-        return validate_password_strength(value)
-
     @model_validator(mode="after")
     def check_passwords_match(self):
         validate_passwords_match(self.password, self.confirm_password)
@@ -105,11 +99,6 @@ class UserUpdatePassword(BaseModel):
     new_password: str = Field(min_length=8, max_length=64)
     repeat_password: str = Field(min_length=8, max_length=64)
 
-    @field_validator("new_password")
-    @classmethod
-    def check_password_strength(cls, value: str):
-        return validate_password_strength(value)
-
     @model_validator(mode="after")
     def check_passwords_match(self):
         validate_passwords_match(self.new_password, self.repeat_password)
@@ -1,13 +1,16 @@
 import logging
 
+from redis.asyncio import Redis
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.exceptions import ConflictError, NotFoundError, UnauthorizedError
-from app.core.security import get_hashed_password, verify_password
+from app.core.security import hash_password, verify_password_async
 from app.fridge.models import Fridge
-from app.measurements.repositories import WeightRepository
+from app.measurements.services import WeightService
+from app.user.cache import invalidate_cached_user
 from app.user.models import User
+from app.user.password_policy import password_policy
 from app.user.repositories import UserRepository
 from app.user.schemas import (
     DeleteUserData,
@@ -26,11 +29,13 @@ logger = logging.getLogger(__name__)
 
 
 class UserService:
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, redis: Redis | None = None):
         self.repo = UserRepository(db)
-        self.weight_repo = WeightRepository(db)
+        self.weight_service = WeightService(db)
+        self.redis = redis
 
     async def create_user(self, data: UserCreate) -> User:
+        await password_policy.check(data.password)
         if await self.repo.get_user_by_email(data.email):
             logger.warning("Attempt to register with existing email=%s", data.email)
             raise ConflictError("Email already registered")
@@ -41,17 +46,11 @@ class UserService:
             raise ConflictError("Username already registered")
         user_instance = User(
             **data.model_dump(exclude={"password", "confirm_password"}),
-            hashed_password=get_hashed_password(data.password),
+            hashed_password=await hash_password(data.password),
+            fridge=Fridge(),
         )
-
-        self.repo.add(user_instance)
-        await self.repo.flush()
-
-        fridge_instance = Fridge(user_id=user_instance.id)
-        self.repo.add(fridge_instance)
         try:
-            await self.repo.commit_or_conflict()
-            await self.repo.refresh(user_instance)
+            await self.repo.save(user_instance)
             logger.info(
                 "User created successfully id=%s email=%s",
                 user_instance.id,
@@ -62,7 +61,7 @@ class UserService:
         return user_instance
 
     async def get_current_user(self, user: User) -> UserRead:
-        weight_in = await self.weight_repo.get_current_weight(user.id)
+        weight_in = await self.weight_service.get_current_weight(user.id)
         current_weight = weight_in.weight if weight_in else None
         user_dto = UserRead.model_validate(user)
         user_dto.current_weight = current_weight
@@ -79,7 +78,8 @@ class UserService:
         except IntegrityError:
             logger.warning("Conflict while updating user id=%s", user_id)
             raise ConflictError("User already exists") from None
-        return await self.repo.refresh_and_return(user_instance)
+        await invalidate_cached_user(user_id, self.redis)
+        return user_instance
 
     async def change_user_email(self, user_id: int, data: UserUpdateEmail) -> User:
         user = await self.repo.get_by_id(user_id)
@@ -94,27 +94,30 @@ class UserService:
                 "Attempt to change email to already registered value=%s", data.new_email
             )
             raise ConflictError("Email already registered") from None
-        return await self.repo.refresh_and_return(user)
+        await invalidate_cached_user(user_id, self.redis)
+        return user
 
     async def change_user_password(
         self, user_id: int, data: UserUpdatePassword
     ) -> User:
+        await password_policy.check(data.new_password)
         user = await self.repo.get_by_id(user_id)
-        if not verify_password(data.old_password, user.hashed_password):
+        if not await verify_password_async(data.old_password, user.hashed_password):
             logger.warning(
                 "Failed password change attempt: wrong old password for user_id=%s",
                 user_id,
             )
             raise UnauthorizedError("Old password is incorrect")
-        user.hashed_password = get_hashed_password(data.new_password)
+        user.hashed_password = await hash_password(data.new_password)
         await self.repo.commit_or_conflict()
         logger.info("Password updated successfully for user_id=%s", user_id)
-        return await self.repo.refresh_and_return(user)
+        await invalidate_cached_user(user_id, self.redis)
+        return user
 
     async def get_user_bmr(self, user) -> int:
         if not all([user.height, user.age, user.gender]):
             raise ConflictError("Lack of user data")
-        weight_in = await self.weight_repo.get_current_weight(user.id)
+        weight_in = await self.weight_service.get_current_weight(user.id)
         if not weight_in:
             raise ConflictError("No weight data")
         weight = weight_in.weight
@@ -133,7 +136,7 @@ class UserService:
         if not user.height:
             raise ConflictError("No height data")
         height = user.height
-        weight_obj = await self.weight_repo.get_current_weight(user.id)
+        weight_obj = await self.weight_service.get_current_weight(user.id)
         if not weight_obj:
             raise ConflictError("No weight data")
         weight = weight_obj.weight
@@ -144,7 +147,9 @@ class UserService:
         if not user_in:
             raise NotFoundError("User not found")
 
-        is_password_correct = verify_password(data.password, user_in.hashed_password)
+        is_password_correct = await verify_password_async(
+            data.password, user_in.hashed_password
+        )
 
         if not is_password_correct:
             raise UnauthorizedError("Invalid password provided for account deletion")
@@ -156,3 +161,4 @@ class UserService:
         except IntegrityError as e:
             logger.info("Delete user id=%s error=%s", user_id, e)
             raise ConflictError("Cannot delete user") from e
+        await invalidate_cached_user(user_id, self.redis)
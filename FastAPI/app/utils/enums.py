@@ -8,6 +8,11 @@ class NutrientType(str, Enum):
     CARBS = "carbs"
 
 
+class FileFormat(str, Enum):
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
 nutrient_type_list = [
     NutrientType.CALORIES,
     NutrientType.PROTEINS,
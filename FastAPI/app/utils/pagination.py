@@ -0,0 +1,35 @@
+import base64
+import binascii
+from datetime import date, datetime
+
+from app.core.exceptions import BadRequestError
+
+
+def encode_cursor(cursor_date: date, cursor_id: int) -> str:
+    raw = f"{cursor_date.isoformat()}|{cursor_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[date, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        cursor_date, cursor_id = raw.split("|")
+        return date.fromisoformat(cursor_date), int(cursor_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequestError("Invalid cursor") from None
+
+
+def encode_sync_cursor(since: datetime) -> str:
+    return base64.urlsafe_b64encode(since.isoformat().encode()).decode()
+
+
+def decode_sync_cursor(cursor: str) -> datetime:
+    try:
+        since = datetime.fromisoformat(
+            base64.urlsafe_b64decode(cursor.encode()).decode()
+        )
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise BadRequestError("Invalid cursor") from None
+    if since.tzinfo is None:
+        raise BadRequestError("Invalid cursor")
+    return since
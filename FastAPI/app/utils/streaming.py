@@ -0,0 +1,40 @@
+import codecs
+from collections.abc import AsyncIterator
+
+from app.core.exceptions import BadRequestError
+from app.utils.enums import FileFormat
+
+MEDIA_TYPES = {
+    FileFormat.CSV: "text/csv",
+    FileFormat.JSONL: "application/x-ndjson",
+}
+
+
+def _check_line_length(line: str, line_no: int, max_line_length: int) -> None:
+    if len(line) > max_line_length:
+        raise BadRequestError(
+            f"Line {line_no} is longer than {max_line_length} characters"
+        )
+
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes], max_line_length: int
+) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    line_no = 0
+    try:
+        async for chunk in chunks:
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            for line in lines:
+                line_no += 1
+                _check_line_length(line, line_no, max_line_length)
+                yield line.rstrip("\r")
+            # A body without newlines must not grow the buffer without bound
+            _check_line_length(pending, line_no + 1, max_line_length)
+        pending += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise BadRequestError("File is not valid UTF-8") from None
+    if pending:
+        yield pending.rstrip("\r")
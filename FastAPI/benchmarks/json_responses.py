@@ -0,0 +1,76 @@
+"""Compare list response rendering through response_model and model_list_response.
+
+Run from the FastAPI directory: python -m benchmarks.json_responses
+"""
+
+import asyncio
+import datetime
+import timeit
+
+from fastapi._compat import ModelField
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.responses import FastJSONResponse, model_list_response
+from app.meal.models import MealType
+from app.meal.schemas import MealLogRead
+from app.models import MealLog
+
+ROUNDS = 20
+
+
+def make_rows(count: int) -> list[MealLog]:
+    return [
+        MealLog(
+            id=i,
+            user_id=1,
+            date=datetime.date(2024, 1, 1) + datetime.timedelta(days=i % 365),
+            type=MealType.LUNCH,
+            name=f"Meal {i}",
+            weight=250.0,
+            calories=412.0,
+            proteins=23.5,
+            fats=14.2,
+            carbs=48.9,
+        )
+        for i in range(count)
+    ]
+
+
+def response_model_path(
+    field: ModelField, rows: list[MealLog], response_class: type[JSONResponse]
+) -> bytes:
+    content = asyncio.run(serialize_response(field=field, response_content=rows))
+    return response_class(content).body
+
+
+def time_paths(field: ModelField, rows: list[MealLog]) -> dict[str, float]:
+    return {
+        "response_model": timeit.timeit(
+            lambda: response_model_path(field, rows, JSONResponse), number=ROUNDS
+        ),
+        "fast default": timeit.timeit(
+            lambda: response_model_path(field, rows, FastJSONResponse), number=ROUNDS
+        ),
+        "model_list": timeit.timeit(
+            lambda: model_list_response(MealLogRead, rows).body, number=ROUNDS
+        ),
+    }
+
+
+def main():
+    field = create_model_field("Response", list[MealLogRead], mode="serialization")
+    for count in (1_000, 10_000):
+        timings = time_paths(field, make_rows(count))
+        baseline = timings["response_model"]
+        print(f"{count:,} rows")
+        for label, seconds in timings.items():
+            print(
+                f"{label:>15}: {seconds / ROUNDS * 1000:>8.2f} ms"
+                f"  ({baseline / seconds:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
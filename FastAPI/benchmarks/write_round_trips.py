@@ -0,0 +1,90 @@
+"""Compare write round trips with and without the post-commit refresh.
+
+Each statement sleeps for a simulated network round trip, so the timings show
+what one statement less per write is worth against a remote database.
+
+Run from the FastAPI directory: python -m benchmarks.write_round_trips
+"""
+
+import asyncio
+import datetime
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.db import Base
+from app.meal.models import MealType
+from app.meal.repositories import MealRepository
+from app.models import MealLog, User
+
+ROUNDS = 200
+ROUND_TRIP_MS = 1.0
+
+
+def make_log(user_id: int, i: int) -> MealLog:
+    return MealLog(
+        user_id=user_id,
+        date=datetime.date(2024, 1, 1) + datetime.timedelta(days=i % 365),
+        type=MealType.LUNCH,
+        name=f"Meal {i}",
+        weight=250.0,
+        calories=412.0,
+        proteins=23.5,
+        fats=14.2,
+        carbs=48.9,
+    )
+
+
+async def refresh_after_commit(session: AsyncSession, log: MealLog) -> MealLog:
+    session.add(log)
+    await session.commit()
+    await session.refresh(log)
+    return log
+
+
+async def save(session: AsyncSession, log: MealLog) -> MealLog:
+    return await MealRepository(session).save(log)
+
+
+async def time_path(sessionmaker, user_id: int, write, statements: list[str]):
+    statements.clear()
+    start = time.perf_counter()
+    async with sessionmaker() as session:
+        for i in range(ROUNDS):
+            await write(session, make_log(user_id, i))
+    return time.perf_counter() - start, len(statements)
+
+
+async def main():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def simulate_round_trip(conn, cursor, statement, *args):
+        statements.append(statement)
+        time.sleep(ROUND_TRIP_MS / 1000)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessionmaker() as session:
+        user = User(username="benchmark", email="bench@example.com", hashed_password="")
+        session.add(user)
+        await session.commit()
+
+    print(f"{ROUNDS} meal log writes, {ROUND_TRIP_MS} ms per round trip")
+    baseline = None
+    for label, write in (("refresh", refresh_after_commit), ("save", save)):
+        seconds, count = await time_path(sessionmaker, user.id, write, statements)
+        baseline = baseline or seconds
+        print(
+            f"{label:>8}: {count / ROUNDS:.1f} statements/write"
+            f"  {seconds / ROUNDS * 1000:>6.2f} ms/write  ({baseline / seconds:.1f}x)"
+        )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
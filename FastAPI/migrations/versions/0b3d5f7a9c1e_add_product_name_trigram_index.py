@@ -0,0 +1,35 @@
+"""add product name trigram index
+
+Revision ID: 0b3d5f7a9c1e
+Revises: f2a4c6e8b0d1
+Create Date: 2026-10-18 18:02:37.640915
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b3d5f7a9c1e"
+down_revision: str | Sequence[str] | None = "f2a4c6e8b0d1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_fridge_products_product_name_trgm",
+        "fridge_products",
+        ["product_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"product_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_fridge_products_product_name_trgm", table_name="fridge_products")
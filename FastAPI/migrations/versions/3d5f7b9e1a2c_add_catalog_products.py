@@ -0,0 +1,101 @@
+"""add catalog products
+
+Revision ID: 3d5f7b9e1a2c
+Revises: 0b3d5f7a9c1e
+Create Date: 2026-10-18 18:48:12.204117
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "3d5f7b9e1a2c"
+down_revision: str | Sequence[str] | None = "0b3d5f7a9c1e"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+VALUE_COLUMNS = ("calories_100g", "proteins_100g", "fats_100g", "carbs_100g")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "catalog_products",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("calories_100g", sa.Float(), nullable=False),
+        sa.Column("proteins_100g", sa.Float(), nullable=False),
+        sa.Column("fats_100g", sa.Float(), nullable=False),
+        sa.Column("carbs_100g", sa.Float(), nullable=False),
+        sa.Column(
+            "category",
+            postgresql.ENUM(name="food_category", create_type=False),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    op.create_index(
+        op.f("ix_catalog_products_id"), "catalog_products", ["id"], unique=False
+    )
+
+    op.add_column(
+        "fridge_products",
+        sa.Column("catalog_product_id", sa.Integer(), nullable=True),
+    )
+    op.create_foreign_key(
+        "fridge_products_catalog_product_id_fkey",
+        "fridge_products",
+        "catalog_products",
+        ["catalog_product_id"],
+        ["id"],
+    )
+    op.create_index(
+        op.f("ix_fridge_products_catalog_product_id"),
+        "fridge_products",
+        ["catalog_product_id"],
+        unique=False,
+    )
+    # Existing values stay as overrides of unlinked products
+    for column in VALUE_COLUMNS:
+        op.alter_column(
+            "fridge_products", column, existing_type=sa.Float(), nullable=True
+        )
+    op.create_check_constraint(
+        "ck_fridge_product_values",
+        "fridge_products",
+        "catalog_product_id IS NOT NULL OR ("
+        + " AND ".join(f"{column} IS NOT NULL" for column in VALUE_COLUMNS)
+        + ")",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in VALUE_COLUMNS:
+        op.execute(
+            f"UPDATE fridge_products SET {column} = catalog_products.{column} "
+            "FROM catalog_products "
+            "WHERE fridge_products.catalog_product_id = catalog_products.id "
+            f"AND fridge_products.{column} IS NULL"
+        )
+    op.drop_constraint("ck_fridge_product_values", "fridge_products", type_="check")
+    op.drop_index(
+        op.f("ix_fridge_products_catalog_product_id"), table_name="fridge_products"
+    )
+    op.drop_constraint(
+        "fridge_products_catalog_product_id_fkey", "fridge_products", type_="foreignkey"
+    )
+    op.drop_column("fridge_products", "catalog_product_id")
+    op.drop_index(op.f("ix_catalog_products_id"), table_name="catalog_products")
+    op.drop_table("catalog_products")
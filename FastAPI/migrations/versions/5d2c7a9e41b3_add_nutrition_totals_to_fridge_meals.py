@@ -0,0 +1,66 @@
+"""add nutrition totals to fridge meals
+
+Revision ID: 5d2c7a9e41b3
+Revises: 171a9ba4af96
+Create Date: 2026-10-18 10:12:31.402117
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2c7a9e41b3"
+down_revision: str | Sequence[str] | None = "171a9ba4af96"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TOTAL_COLUMNS = ["calories", "proteins", "fats", "carbs", "weight"]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in TOTAL_COLUMNS:
+        op.add_column(
+            "fridge_meals",
+            sa.Column(column, sa.Float(), nullable=False, server_default="0"),
+        )
+    op.add_column(
+        "fridge_meals",
+        sa.Column("products_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    op.execute(
+        """
+        UPDATE fridge_meals SET
+            calories = totals.calories,
+            proteins = totals.proteins,
+            fats = totals.fats,
+            carbs = totals.carbs,
+            weight = totals.weight,
+            products_count = totals.products_count
+        FROM (
+            SELECT
+                i.fridge_meal_id,
+                COALESCE(SUM(p.calories_100g * i.weight / 100), 0) AS calories,
+                COALESCE(SUM(p.proteins_100g * i.weight / 100), 0) AS proteins,
+                COALESCE(SUM(p.fats_100g * i.weight / 100), 0) AS fats,
+                COALESCE(SUM(p.carbs_100g * i.weight / 100), 0) AS carbs,
+                COALESCE(SUM(i.weight), 0) AS weight,
+                COUNT(i.id) AS products_count
+            FROM fridge_meal_ingredients i
+            LEFT JOIN fridge_products p ON i.fridge_product_id = p.id
+            GROUP BY i.fridge_meal_id
+        ) AS totals
+        WHERE fridge_meals.id = totals.fridge_meal_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("fridge_meals", "products_count")
+    for column in reversed(TOTAL_COLUMNS):
+        op.drop_column("fridge_meals", column)
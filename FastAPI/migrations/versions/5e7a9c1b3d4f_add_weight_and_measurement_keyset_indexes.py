@@ -0,0 +1,37 @@
+"""add weight and measurement keyset indexes
+
+Revision ID: 5e7a9c1b3d4f
+Revises: 3d5f7b9e1a2c
+Create Date: 2026-10-18 19:26:51.730482
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5e7a9c1b3d4f"
+down_revision: str | Sequence[str] | None = "3d5f7b9e1a2c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ("weights", "measurements")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.create_index(
+            f"ix_{table}_user_id_date_id",
+            table,
+            ["user_id", sa.text("date DESC"), sa.text("id DESC")],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_user_id_date_id", table_name=table)
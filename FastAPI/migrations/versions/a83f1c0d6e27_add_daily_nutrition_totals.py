@@ -0,0 +1,61 @@
+"""add daily nutrition totals
+
+Revision ID: a83f1c0d6e27
+Revises: 5d2c7a9e41b3
+Create Date: 2026-10-18 12:40:05.118342
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a83f1c0d6e27"
+down_revision: str | Sequence[str] | None = "5d2c7a9e41b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "daily_nutrition_totals",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column(
+            "type",
+            postgresql.ENUM(name="meal_type", create_type=False),
+            nullable=False,
+        ),
+        sa.Column("weight", sa.Float(), nullable=False),
+        sa.Column("calories", sa.Float(), nullable=False),
+        sa.Column("proteins", sa.Float(), nullable=False),
+        sa.Column("fats", sa.Float(), nullable=False),
+        sa.Column("carbs", sa.Float(), nullable=False),
+        sa.Column("logs_count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint(
+            "user_id", "date", "type", name="daily_nutrition_totals_pkey"
+        ),
+    )
+
+    op.execute(
+        """
+        INSERT INTO daily_nutrition_totals
+            (user_id, date, type, weight, calories, proteins, fats, carbs, logs_count)
+        SELECT
+            user_id, date, type,
+            SUM(weight), SUM(calories), SUM(proteins), SUM(fats), SUM(carbs),
+            COUNT(id)
+        FROM meal_logs
+        GROUP BY user_id, date, type
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("daily_nutrition_totals")
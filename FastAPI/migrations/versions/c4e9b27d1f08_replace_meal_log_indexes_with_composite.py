@@ -0,0 +1,42 @@
+"""replace meal log indexes with composite
+
+Revision ID: c4e9b27d1f08
+Revises: a83f1c0d6e27
+Create Date: 2026-10-18 14:02:51.630417
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e9b27d1f08"
+down_revision: str | Sequence[str] | None = "a83f1c0d6e27"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_meal_logs_user_id_date_id",
+        "meal_logs",
+        ["user_id", "date", "id"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_meal_logs_user_id"), table_name="meal_logs")
+    op.drop_index(op.f("ix_meal_logs_type"), table_name="meal_logs")
+    op.drop_index(op.f("ix_meal_logs_name"), table_name="meal_logs")
+    op.drop_index(op.f("ix_meal_logs_date"), table_name="meal_logs")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_meal_logs_date"), "meal_logs", ["date"], unique=False)
+    op.create_index(op.f("ix_meal_logs_name"), "meal_logs", ["name"], unique=False)
+    op.create_index(op.f("ix_meal_logs_type"), "meal_logs", ["type"], unique=False)
+    op.create_index(
+        op.f("ix_meal_logs_user_id"), "meal_logs", ["user_id"], unique=False
+    )
+    op.drop_index("ix_meal_logs_user_id_date_id", table_name="meal_logs")
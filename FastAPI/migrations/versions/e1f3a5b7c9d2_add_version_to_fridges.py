@@ -0,0 +1,31 @@
+"""add version to fridges
+
+Revision ID: e1f3a5b7c9d2
+Revises: c4e9b27d1f08
+Create Date: 2026-10-18 16:05:12.518204
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f3a5b7c9d2"
+down_revision: str | Sequence[str] | None = "c4e9b27d1f08"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "fridges",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("fridges", "version")
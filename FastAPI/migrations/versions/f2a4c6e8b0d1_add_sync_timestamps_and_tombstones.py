@@ -0,0 +1,84 @@
+"""add sync timestamps and tombstones
+
+Revision ID: f2a4c6e8b0d1
+Revises: e1f3a5b7c9d2
+Create Date: 2026-10-18 17:20:44.093518
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f2a4c6e8b0d1"
+down_revision: str | Sequence[str] | None = "e1f3a5b7c9d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SYNC_TABLES = {
+    "fridge_products": "fridge_id",
+    "fridge_meals": "fridge_id",
+    "fridge_meal_ingredients": "fridge_meal_id",
+    "meal_logs": "user_id",
+    "weights": "user_id",
+    "measurements": "user_id",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, scope_column in SYNC_TABLES.items():
+        op.add_column(
+            table,
+            sa.Column(
+                "updated_at",
+                sa.DateTime(timezone=True),
+                nullable=False,
+                server_default=sa.func.now(),
+            ),
+        )
+        op.create_index(
+            f"ix_{table}_{scope_column}_updated_at",
+            table,
+            [scope_column, "updated_at"],
+            unique=False,
+        )
+
+    op.create_table(
+        "sync_tombstones",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("entity", sa.String(), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("fridge_id", sa.Integer(), nullable=True),
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["fridge_id"], ["fridges.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_sync_tombstones_user_id_deleted_at",
+        "sync_tombstones",
+        ["user_id", "deleted_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_sync_tombstones_fridge_id_deleted_at",
+        "sync_tombstones",
+        ["fridge_id", "deleted_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_sync_tombstones_fridge_id_deleted_at", table_name="sync_tombstones"
+    )
+    op.drop_index("ix_sync_tombstones_user_id_deleted_at", table_name="sync_tombstones")
+    op.drop_table("sync_tombstones")
+    for table, scope_column in SYNC_TABLES.items():
+        op.drop_index(f"ix_{table}_{scope_column}_updated_at", table_name=table)
+        op.drop_column(table, "updated_at")
@@ -0,0 +1,62 @@
+import pytest
+
+from app.auth.dependencies import get_current_user
+from app.core.security import create_access_token
+from app.fridge.dependencies import get_fridge
+from app.user.cache import USER_CACHE_CHANNEL, user_cache
+from app.user.schemas import UserUpdate
+from app.user.services import UserService
+
+
+@pytest.mark.integration
+class TestGetCurrentUser:
+    async def test_get_current_user_populates_cache(self, session, user):
+        token = create_access_token(user.username, user.id)
+        stats_before = user_cache.stats()
+
+        first = await get_current_user(session, token)
+        second = await get_current_user(session, token)
+
+        stats = user_cache.stats()
+        assert first.id == second.id == user.id
+        assert stats["hits"] - stats_before["hits"] == 1
+        assert stats["misses"] - stats_before["misses"] == 1
+
+    async def test_cached_user_is_attached_to_session(self, session, user):
+        token = create_access_token(user.username, user.id)
+        await get_current_user(session, token)
+
+        result = await get_current_user(session, token)
+
+        assert result in session
+        assert result.email == user.email
+
+    async def test_get_fridge_from_cached_user(self, session, user, fridge):
+        session.expire(user, ["fridge"])
+        token = create_access_token(user.username, user.id)
+        await get_current_user(session, token)
+        session.expunge_all()
+        hits_before = user_cache.hits
+
+        cached_user = await get_current_user(session, token)
+        result = await get_fridge(session, cached_user)
+
+        assert user_cache.hits == hits_before + 1
+        assert result.id == fridge.id
+        assert result is cached_user.fridge
+
+    async def test_update_user_invalidates_cache(self, session, user, fake_redis):
+        token = create_access_token(user.username, user.id)
+        await get_current_user(session, token)
+        pubsub = fake_redis.pubsub()
+        await pubsub.subscribe(USER_CACHE_CHANNEL)
+
+        await UserService(session, fake_redis).update_user(
+            user.id, UserUpdate(height=190)
+        )
+
+        assert user_cache.get(user.id) is None
+        await pubsub.get_message(timeout=1)
+        message = await pubsub.get_message(timeout=1)
+        assert message["data"] == str(user.id)
+        await pubsub.aclose()
@@ -100,3 +100,12 @@ class TestAuthEndpoints:
             "/auth/logout", json={"refresh_token": test_refresh_token}
         )
         assert response.status_code == 200
+
+    async def test_logout_all(self, client_with_redis, fake_redis, user):
+        await fake_redis.set("refresh:abc", user.id)
+        await fake_redis.sadd(f"refresh_user:{user.id}", "abc")
+
+        response = await client_with_redis.post("/auth/logout-all")
+
+        assert response.status_code == 200
+        assert not await fake_redis.exists("refresh:abc")
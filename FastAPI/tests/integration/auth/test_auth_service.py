@@ -95,3 +95,16 @@ class TestAuthService:
         await token_repo.add_refresh_token_to_redis(jti, user.id)
         await auth_service.logout_user(refresh_token)
         assert not await token_repo.is_refresh_token_valid(jti)
+
+    async def test_logout_user_everywhere(self, auth_service, token_repo, user):
+        jtis = []
+        for _ in range(2):
+            _, jti = create_refresh_token(user.username, user.id)
+            await token_repo.add_refresh_token_to_redis(jti, user.id)
+            jtis.append(jti)
+
+        revoked = await auth_service.logout_user_everywhere(user.id)
+
+        assert revoked == 2
+        for jti in jtis:
+            assert not await token_repo.is_refresh_token_valid(jti)
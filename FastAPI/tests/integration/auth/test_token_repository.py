@@ -42,3 +42,52 @@ class TestTokenRepository:
         await token_repo.add_refresh_token_to_redis(jti, user.id)
         await token_repo.delete_refresh_token_from_redis(jti)
         assert await token_repo.is_refresh_token_valid(jti) is False
+
+    async def test_rotate_refresh_token(self, fake_redis, token_repo, user):
+        old_jti, new_jti = str(uuid.uuid4()), str(uuid.uuid4())
+        await token_repo.add_refresh_token_to_redis(old_jti, user.id)
+
+        assert await token_repo.rotate_refresh_token(old_jti, new_jti, user.id)
+
+        assert await token_repo.is_refresh_token_valid(old_jti) is False
+        assert await token_repo.is_refresh_token_valid(new_jti) is True
+        assert await fake_redis.smembers(f"refresh_user:{user.id}") == {new_jti}
+
+    async def test_rotate_unknown_refresh_token(self, fake_redis, token_repo, user):
+        new_jti = str(uuid.uuid4())
+
+        assert not await token_repo.rotate_refresh_token("missing", new_jti, user.id)
+
+        assert await token_repo.is_refresh_token_valid(new_jti) is False
+        assert await fake_redis.smembers(f"refresh_user:{user.id}") == set()
+
+    async def test_concurrent_rotation_succeeds_once(self, token_repo, user):
+        old_jti = str(uuid.uuid4())
+        new_jtis = [str(uuid.uuid4()) for _ in range(5)]
+        await token_repo.add_refresh_token_to_redis(old_jti, user.id)
+
+        results = await asyncio.gather(
+            *(
+                token_repo.rotate_refresh_token(old_jti, new_jti, user.id)
+                for new_jti in new_jtis
+            )
+        )
+
+        assert results.count(True) == 1
+        valid = [await token_repo.is_refresh_token_valid(jti) for jti in new_jtis]
+        assert valid == results
+
+    async def test_revoke_all_refresh_tokens(self, fake_redis, token_repo, user):
+        jtis = [str(uuid.uuid4()) for _ in range(3)]
+        for jti in jtis:
+            await token_repo.add_refresh_token_to_redis(jti, user.id)
+        other_jti = str(uuid.uuid4())
+        await token_repo.add_refresh_token_to_redis(other_jti, user.id + 1)
+
+        revoked = await token_repo.revoke_all_refresh_tokens(user.id)
+
+        assert revoked == 3
+        for jti in jtis:
+            assert await token_repo.is_refresh_token_valid(jti) is False
+        assert await token_repo.is_refresh_token_valid(other_jti) is True
+        assert not await fake_redis.exists(f"refresh_user:{user.id}")
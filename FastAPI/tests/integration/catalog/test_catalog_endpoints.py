@@ -0,0 +1,119 @@
+import pytest
+from sqlalchemy import select
+
+from app.catalog.cache import catalog_cache
+from app.fridge.models import FoodCategory, Fridge, FridgeMeal, FridgeProduct
+from app.fridge.repositories import FridgeMealRepository
+from app.models import FridgeMealIngredient
+
+
+@pytest.mark.integration
+class TestCatalogEndpoints:
+    async def test_read_catalog_products_loads_cache(
+        self, client, catalog_product_factory
+    ):
+        await catalog_product_factory("Rice")
+        await catalog_product_factory("Apple", category=FoodCategory.FRUIT)
+
+        response = await client.get("/catalog/products")
+
+        assert response.status_code == 200
+        assert [p["name"] for p in response.json()] == ["Apple", "Rice"]
+        assert catalog_cache.loaded is True
+
+        fruits = await client.get("/catalog/products", params={"category": "fruits"})
+        assert [p["name"] for p in fruits.json()] == ["Apple"]
+        assert catalog_cache.stats()["loads"] == 1
+
+    async def test_read_catalog_products_no_auth(self, client_no_user):
+        response = await client_no_user.get("/catalog/products")
+        assert response.status_code == 401
+
+    async def test_search_catalog_products(self, client, catalog_product_factory):
+        for name in ("Rolled oats", "Oats", "Rice"):
+            await catalog_product_factory(name)
+
+        response = await client.get("/catalog/products/search", params={"q": "oat"})
+
+        assert response.status_code == 200
+        assert [p["name"] for p in response.json()] == ["Oats", "Rolled oats"]
+
+    async def test_read_catalog_product_missing_from_cache(
+        self, client, catalog_product_factory
+    ):
+        catalog_cache.replace([])
+        product = await catalog_product_factory("Oats", calories_100g=389)
+
+        response = await client.get(f"/catalog/products/{product.id}")
+        missing = await client.get("/catalog/products/9999")
+
+        assert response.status_code == 200
+        assert response.json()["calories_100g"] == 389
+        assert missing.status_code == 404
+
+    async def test_upsert_catalog_products_updates_linked_fridge_products(
+        self,
+        client_with_redis,
+        session,
+        fridge,
+        catalog_product_factory,
+        internal_headers,
+    ):
+        oats = await catalog_product_factory("Oats", calories_100g=380)
+        linked = FridgeProduct(
+            fridge_id=fridge.id,
+            catalog_product_id=oats.id,
+            product_name="Oats",
+            category=FoodCategory.GRAINS,
+        )
+        meal = FridgeMeal(fridge_id=fridge.id, name="Porridge")
+        session.add_all([linked, meal])
+        await session.flush()
+        session.add(
+            FridgeMealIngredient(
+                fridge_meal_id=meal.id, fridge_product_id=linked.id, weight=50
+            )
+        )
+        await session.flush()
+        await FridgeMealRepository(session).update_meal_totals(meal.id)
+        await session.commit()
+        await session.refresh(linked)
+        product_id, meal_id, fridge_id = linked.id, meal.id, fridge.id
+        updated_at, version = linked.updated_at, fridge.version
+
+        response = await client_with_redis.put(
+            "/internal/catalog/products",
+            json=[
+                {"name": "Oats", "calories_100g": 400, "category": "grains"},
+                {"name": "Rye", "calories_100g": 330, "category": "grains"},
+            ],
+            headers=internal_headers,
+        )
+
+        assert response.status_code == 200
+        assert [p["name"] for p in response.json()] == ["Oats", "Rye"]
+        assert response.json()[0]["id"] == oats.id
+        assert catalog_cache.get(oats.id).calories_100g == 400
+
+        session.expire_all()
+        product = await session.scalar(
+            select(FridgeProduct).where(FridgeProduct.id == product_id)
+        )
+        assert product.calories_100g == 400
+        assert product.updated_at > updated_at
+        assert (await session.get(FridgeMeal, meal_id)).calories == 200
+        assert (await session.get(Fridge, fridge_id)).version == version + 1
+
+    async def test_upsert_catalog_products_requires_internal_token(
+        self, client_with_redis, session, catalog_product_factory, internal_headers
+    ):
+        oats = await catalog_product_factory("Oats", calories_100g=380)
+
+        response = await client_with_redis.put(
+            "/internal/catalog/products",
+            json=[{"name": "Oats", "calories_100g": 1, "category": "grains"}],
+        )
+
+        assert response.status_code == 401
+        await session.refresh(oats)
+        assert oats.calories_100g == 380
@@ -1,17 +1,25 @@
 import logging
 import os
 import pathlib
+from contextlib import asynccontextmanager, contextmanager
 
 import fakeredis.aioredis
 import pytest
 import pytest_asyncio
 from dotenv import load_dotenv
 from httpx import ASGITransport, AsyncClient
-from sqlalchemy import NullPool
+from sqlalchemy import NullPool, event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import models  # noqa: F401
-from app.auth.dependencies import get_current_user
+from app.auth.dependencies import (
+    get_current_user,
+    get_read_db,
+    get_read_session_factory,
+)
+from app.catalog.cache import catalog_cache
+from app.catalog.models import CatalogProduct
+from app.core.config import settings
 from app.core.db import Base, DBSessionManager, get_db
 from app.core.redis_session import get_redis_client
 from app.core.security import get_hashed_password
@@ -23,7 +31,10 @@ from app.fridge.models import (
     FridgeMealIngredient,
     FridgeProduct,
 )
+from app.fridge.repositories import FridgeMealRepository
 from app.main import get_app
+from app.measurements.cache import latest_weight_cache
+from app.user.cache import user_cache
 from app.user.models import User
 
 BASE_DIR = pathlib.Path(__file__).resolve().parent.parent.parent
@@ -61,6 +72,33 @@ async def setup_db():
     await test_session_manager.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    user_cache.clear()
+    yield
+    user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_latest_weight_cache():
+    latest_weight_cache.clear()
+    yield
+    latest_weight_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_catalog_cache():
+    catalog_cache.clear()
+    yield
+    catalog_cache.clear()
+
+
+@pytest.fixture
+def internal_headers(monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", "internal-test-token")
+    return {"X-Internal-Token": "internal-test-token"}
+
+
 @pytest_asyncio.fixture
 async def session():
     async with test_session_manager.connect() as conn:
@@ -76,6 +114,25 @@ async def session():
                 await trans.rollback()
 
 
+@pytest.fixture
+def count_queries():
+    @contextmanager
+    def counter():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = test_session_manager.engine.sync_engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return counter
+
+
 @pytest_asyncio.fixture
 async def fake_redis():
     return fakeredis.aioredis.FakeRedis(decode_responses=True)
@@ -105,6 +162,14 @@ async def other_user(session):
     return u
 
 
+def session_factory_for(session):
+    @asynccontextmanager
+    async def factory():
+        yield session
+
+    return factory
+
+
 @pytest_asyncio.fixture
 async def client(session, user):
     async def override_get_db():
@@ -113,8 +178,15 @@ async def client(session, user):
     async def override_get_current_user():
         return user
 
+    def override_get_read_session_factory():
+        return session_factory_for(session)
+
     app = get_app()
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_read_session_factory] = (
+        override_get_read_session_factory
+    )
     app.dependency_overrides[get_current_user] = override_get_current_user
 
     async with AsyncClient(
@@ -136,8 +208,15 @@ async def client_with_redis(session, user, fake_redis):
     async def override_get_current_user():
         return user
 
+    def override_get_read_session_factory():
+        return session_factory_for(session)
+
     app = get_app()
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_read_session_factory] = (
+        override_get_read_session_factory
+    )
     app.dependency_overrides[get_current_user] = override_get_current_user
     app.dependency_overrides[get_redis_client] = override_get_redis_client
 
@@ -156,6 +235,7 @@ async def client_no_user(session, user):
 
     app = get_app()
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
 
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://testserver"
@@ -182,11 +262,18 @@ async def client_with_fridge(session, user, fridge):
     async def override_get_current_user():
         return user
 
+    def override_get_read_session_factory():
+        return session_factory_for(session)
+
     async def override_get_fridge():
         return fridge
 
     app = get_app()
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_read_session_factory] = (
+        override_get_read_session_factory
+    )
     app.dependency_overrides[get_current_user] = override_get_current_user
     app.dependency_overrides[get_fridge] = override_get_fridge
 
@@ -227,6 +314,31 @@ def fridge_product_factory(session, fridge):
     return factory
 
 
+@pytest_asyncio.fixture
+def catalog_product_factory(session):
+    async def factory(
+        name,
+        calories_100g=100,
+        proteins_100g=10,
+        fats_100g=5,
+        carbs_100g=20,
+        category: FoodCategory = FoodCategory.GRAINS,
+    ):
+        product = CatalogProduct(
+            name=name,
+            calories_100g=calories_100g,
+            proteins_100g=proteins_100g,
+            fats_100g=fats_100g,
+            carbs_100g=carbs_100g,
+            category=category,
+        )
+        session.add(product)
+        await session.commit()
+        return product
+
+    return factory
+
+
 @pytest_asyncio.fixture
 def fridge_meal_factory(session, fridge):
     async def factory(meal_name):
@@ -247,6 +359,8 @@ def fridge_meal_ingredient_factory(session, fridge):
             fridge_meal_id=meal.id, weight=weight, fridge_product_id=product.id
         )
         session.add(ingredient)
+        await session.flush()
+        await FridgeMealRepository(session).update_meal_totals(meal.id)
         await session.commit()
         await session.refresh(ingredient)
         return ingredient
@@ -0,0 +1,39 @@
+import pytest
+
+from app.core.config import settings
+
+
+@pytest.mark.integration
+class TestInternalEndpoints:
+    async def test_cache_stats_with_token(self, client, internal_headers):
+        response = await client.get("/internal/cache-stats", headers=internal_headers)
+
+        assert response.status_code == 200
+        assert "users" in response.json()
+
+    async def test_pool_stats_with_token(self, client, internal_headers):
+        response = await client.get("/internal/pool-stats", headers=internal_headers)
+
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("path", ["/internal/cache-stats", "/internal/pool-stats"])
+    async def test_missing_token(self, client, internal_headers, path):
+        response = await client.get(path)
+
+        assert response.status_code == 401
+
+    async def test_wrong_token(self, client, internal_headers):
+        response = await client.get(
+            "/internal/cache-stats", headers={"X-Internal-Token": "guess"}
+        )
+
+        assert response.status_code == 401
+
+    async def test_closed_without_configured_token(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", "")
+
+        response = await client.get(
+            "/internal/cache-stats", headers={"X-Internal-Token": ""}
+        )
+
+        assert response.status_code == 401
@@ -1,4 +1,9 @@
+import time
+
 import pytest
+from fastapi import HTTPException
+
+from app.core.rate_limiting import AttemptLimiter
 
 
 @pytest.mark.integration
@@ -10,7 +15,7 @@ class TestRateLimiting:
         for i in range(5):
             response = await client_with_redis.post("/auth/login", data=payload)
             assert response.status_code == 401
-            assert await fake_redis.get(f"login_attempt:{user.email}") == str(i + 1)
+            assert await fake_redis.zcard(f"login_attempt:{user.email}") == i + 1
 
         response = await client_with_redis.post("/auth/login", data=payload)
         assert response.status_code == 429
@@ -24,16 +29,54 @@ class TestRateLimiting:
                 data={"username": user.email, "password": "wrong_password"},
             )
             assert response.status_code == 401
-            assert await fake_redis.get(f"login_attempt:{user.email}") == str(i + 1)
+            assert await fake_redis.zcard(f"login_attempt:{user.email}") == i + 1
 
         response = await client_with_redis.post(
             "/auth/login", data={"username": user.email, "password": "password1"}
         )
         assert response.status_code == 200
 
-        assert await fake_redis.get(f"login_attempt:{user.email}") is None
+        assert await fake_redis.exists(f"login_attempt:{user.email}") == 0
 
         response = await client_with_redis.post(
             "/auth/login", data={"username": user.email, "password": "wrong_password"}
         )
         assert response.status_code == 401
+
+
+@pytest.mark.integration
+class TestAttemptLimiter:
+    async def test_records_and_checks_in_one_call(self, fake_redis):
+        limiter = AttemptLimiter("test", max_attempts=2, window_seconds=60)
+
+        await limiter.hit("alice", fake_redis)
+        await limiter.hit("alice", fake_redis)
+        with pytest.raises(HTTPException) as exc:
+            await limiter.hit("alice", fake_redis)
+
+        assert exc.value.status_code == 429
+        assert await fake_redis.zcard("test:alice") == 2
+        assert 0 < await fake_redis.ttl("test:alice") <= 60
+
+    async def test_blocked_attempts_do_not_extend_window(self, fake_redis):
+        limiter = AttemptLimiter("test", max_attempts=1, window_seconds=60)
+        await limiter.hit("alice", fake_redis)
+        first = await fake_redis.zrange("test:alice", 0, -1, withscores=True)
+
+        with pytest.raises(HTTPException):
+            await limiter.hit("alice", fake_redis)
+
+        assert await fake_redis.zrange("test:alice", 0, -1, withscores=True) == first
+
+    async def test_window_slides_across_boundaries(self, fake_redis):
+        limiter = AttemptLimiter("test", max_attempts=2, window_seconds=60)
+        now = time.time()
+        await fake_redis.zadd("test:alice", {"old": now - 59, "recent": now - 1})
+
+        with pytest.raises(HTTPException) as exc:
+            await limiter.hit("alice", fake_redis)
+        assert "Retry in 1 minutes" in exc.value.detail
+
+        await fake_redis.zadd("test:alice", {"old": now - 61})
+        await limiter.hit("alice", fake_redis)
+        assert await fake_redis.zcard("test:alice") == 2
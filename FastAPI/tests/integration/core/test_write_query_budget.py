@@ -0,0 +1,69 @@
+import pytest
+
+
+@pytest.mark.integration
+class TestWriteQueryBudget:
+    async def test_create_fridge_product(self, client_with_fridge, count_queries):
+        payload = {
+            "product_name": "Apple",
+            "calories_100g": 52,
+            "proteins_100g": 0.3,
+            "fats_100g": 0.2,
+            "carbs_100g": 14,
+            "category": "fruits",
+            "is_favourite": True,
+        }
+        with count_queries() as queries:
+            response = await client_with_fridge.post("/fridge/products", json=payload)
+
+        assert response.status_code == 200
+        assert len(queries) == 2
+
+    async def test_create_fridge_meal(self, client_with_fridge, count_queries):
+        payload = {"name": "Soup", "ingredients": []}
+        with count_queries() as queries:
+            response = await client_with_fridge.post("/fridge/meals", json=payload)
+
+        assert response.status_code == 200
+        assert len(queries) == 3
+
+    async def test_create_meal_log_quick(self, client, count_queries):
+        payload = {
+            "date": "2022-01-01",
+            "type": "breakfast",
+            "weight": 50,
+            "name": "log1",
+            "calories": 150,
+        }
+        with count_queries() as queries:
+            response = await client.post("/meals/quick", json=payload)
+
+        assert response.status_code == 200
+        assert len(queries) == 2
+
+    async def test_create_weight(self, client, count_queries):
+        payload = {"date": "2022-01-01", "weight": 80}
+        with count_queries() as queries:
+            response = await client.post("/weights", json=payload)
+
+        assert response.status_code == 200
+        # Insert, plus the primary read that refills the latest weight cache
+        assert len(queries) == 3
+
+    async def test_create_measurements(self, client, count_queries):
+        payload = {"date": "2022-01-01", "waist": 80}
+        with count_queries() as queries:
+            response = await client.post("/measurements", json=payload)
+
+        assert response.status_code == 200
+        assert len(queries) == 2
+
+    async def test_update_user(self, client_with_redis, count_queries):
+        with count_queries() as queries:
+            response = await client_with_redis.put(
+                "/user/me", json={"username": "renamed"}
+            )
+
+        assert response.status_code == 200
+        # Load, update and the current weight lookup for the response
+        assert len(queries) == 3
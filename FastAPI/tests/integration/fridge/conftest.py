@@ -63,6 +63,8 @@ async def sample_fridge_meal_with_ingredient(session, fridge, sample_fridge_prod
     )
 
     session.add(ingredient)
+    await session.flush()
+    await FridgeMealRepository(session).update_meal_totals(meal.id)
     await session.commit()
     await session.refresh(meal, attribute_names=["ingredients"])
     return meal
@@ -99,6 +101,8 @@ async def sample_fridge_meal_with_ingredients(session, fridge):
         for p in products
     ]
     session.add_all(ingredients)
+    await session.flush()
+    await FridgeMealRepository(session).update_meal_totals(meal.id)
 
     await session.commit()
     await session.refresh(meal, attribute_names=["ingredients"])
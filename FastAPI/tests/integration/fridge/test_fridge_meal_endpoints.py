@@ -184,3 +184,23 @@ class TestFridgeMealEndpoints:
     async def test_get_fridge_meal_macro_wrong_meal_id(self, client_with_fridge):
         response = await client_with_fridge.get("/fridge/meals/99999/macros")
         assert response.status_code == 404
+
+    async def test_read_fridge_meals_etag_changes_on_ingredient_write(
+        self, client_with_fridge, sample_fridge_meal_with_ingredients
+    ):
+        meal = sample_fridge_meal_with_ingredients
+        etag = (await client_with_fridge.get("/fridge/meals")).headers["etag"]
+        not_modified = await client_with_fridge.get(
+            "/fridge/meals", headers={"If-None-Match": etag}
+        )
+
+        await client_with_fridge.delete(
+            f"/fridge/meals/{meal.id}/ingredients/{meal.ingredients[0].id}"
+        )
+        response = await client_with_fridge.get(
+            "/fridge/meals", headers={"If-None-Match": etag}
+        )
+
+        assert not_modified.status_code == 304
+        assert response.status_code == 200
+        assert response.json()[0]["products_count"] == 2
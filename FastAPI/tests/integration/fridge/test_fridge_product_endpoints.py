@@ -1,5 +1,8 @@
 import pytest
 
+from app.core.config import settings
+from app.fridge.models import FoodCategory, FridgeProduct
+
 
 @pytest.mark.integration
 class TestFridgeProductEndpoints:
@@ -119,3 +122,332 @@ class TestFridgeProductEndpoints:
     async def test_delete_fridge_product_wrong_id(self, client_with_fridge):
         response = await client_with_fridge.delete("/fridge/products/9999")
         assert response.status_code == 404
+
+    # --- conditional GET /fridge/products ---
+
+    async def test_read_fridge_products_not_modified(
+        self, client_with_fridge, count_queries, sample_fridge_meal_with_ingredients
+    ):
+        response = await client_with_fridge.get("/fridge/products")
+        etag = response.headers["etag"]
+
+        with count_queries() as queries:
+            cached = await client_with_fridge.get(
+                "/fridge/products", headers={"If-None-Match": etag}
+            )
+
+        assert etag.startswith('W/"')
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert cached.content == b""
+        assert len(queries) == 1
+
+        strong = await client_with_fridge.get(
+            "/fridge/products", headers={"If-None-Match": etag.removeprefix("W/")}
+        )
+        assert strong.status_code == 304
+
+    async def test_read_fridge_products_etag_changes_on_write(
+        self, client_with_fridge, fridge
+    ):
+        etag = (await client_with_fridge.get("/fridge/products")).headers["etag"]
+        payload = {
+            "product_name": "Apple",
+            "calories_100g": 52,
+            "proteins_100g": 0.3,
+            "fats_100g": 0.2,
+            "carbs_100g": 14,
+            "category": "fruits",
+            "is_favourite": True,
+        }
+        await client_with_fridge.post("/fridge/products", json=payload)
+
+        response = await client_with_fridge.get(
+            "/fridge/products", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert [p["product_name"] for p in response.json()] == ["Apple"]
+
+    async def test_read_fridge_products_gzip(self, client_with_fridge, session, fridge):
+        for i in range(50):
+            session.add(
+                FridgeProduct(
+                    fridge_id=fridge.id,
+                    product_name=f"Product {i}",
+                    calories_100g=100,
+                    proteins_100g=10,
+                    fats_100g=5,
+                    carbs_100g=20,
+                    category=FoodCategory.FRUIT,
+                    is_favourite=False,
+                )
+            )
+        await session.commit()
+
+        response = await client_with_fridge.get(
+            "/fridge/products", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()) == 50
+
+    # --- GET /fridge/products/search ---
+
+    async def test_search_fridge_products_ranks_prefix_first(
+        self, client_with_fridge, session, fridge
+    ):
+        for name in ("Rolled oats", "Oat milk", "Boat snack", "Rice", "Oats"):
+            session.add(
+                FridgeProduct(
+                    fridge_id=fridge.id,
+                    product_name=name,
+                    calories_100g=100,
+                    proteins_100g=10,
+                    fats_100g=5,
+                    carbs_100g=20,
+                    category=FoodCategory.GRAINS,
+                    is_favourite=False,
+                )
+            )
+        await session.commit()
+
+        response = await client_with_fridge.get(
+            "/fridge/products/search", params={"q": "oat"}
+        )
+
+        assert response.status_code == 200
+        assert [p["product_name"] for p in response.json()] == [
+            "Oats",
+            "Oat milk",
+            "Rolled oats",
+            "Boat snack",
+        ]
+
+    async def test_search_fridge_products_limit_and_wildcards(
+        self, client_with_fridge, session, fridge
+    ):
+        for i in range(5):
+            session.add(
+                FridgeProduct(
+                    fridge_id=fridge.id,
+                    product_name=f"Apple {i}",
+                    calories_100g=50,
+                    category=FoodCategory.FRUIT,
+                    is_favourite=False,
+                )
+            )
+        await session.commit()
+
+        limited = await client_with_fridge.get(
+            "/fridge/products/search", params={"q": "apple", "limit": 2}
+        )
+        wildcard = await client_with_fridge.get(
+            "/fridge/products/search", params={"q": "%"}
+        )
+
+        assert [p["product_name"] for p in limited.json()] == ["Apple 0", "Apple 1"]
+        assert wildcard.json() == []
+
+    async def test_search_fridge_products_requires_query(self, client_with_fridge):
+        response = await client_with_fridge.get("/fridge/products/search")
+        assert response.status_code == 422
+
+    # --- POST /fridge/products/import, GET /fridge/products/export ---
+
+    async def test_import_fridge_products_csv_upserts(
+        self,
+        client_with_fridge,
+        fridge_product_factory,
+        fridge_meal_factory,
+        fridge_meal_ingredient_factory,
+    ):
+        oats = await fridge_product_factory(
+            product_name="Oats",
+            calories_100g=100,
+            proteins_100g=10,
+            fats_100g=5,
+            carbs_100g=20,
+            category=FoodCategory.GRAINS,
+            is_favourite=False,
+        )
+        meal = await fridge_meal_factory("Porridge")
+        await fridge_meal_ingredient_factory(meal=meal, weight=200, product=oats)
+        body = (
+            "product_name,calories_100g,proteins_100g,category,is_favourite\n"
+            "Oats,380,13,grains,true\n"
+            "Rice,130,2.7,grains,false\n"
+            "Bad!,1,1,grains,false\n"
+            "Milk,-1,3,dairy,false\n"
+            "Short,1\n"
+            "Rice,131,2.7,grains,false\n"
+        )
+
+        response = await client_with_fridge.post(
+            "/fridge/products/import", content=body.encode()
+        )
+        products = (await client_with_fridge.get("/fridge/products")).json()
+        meal_data = (await client_with_fridge.get(f"/fridge/meals/{meal.id}")).json()
+
+        assert response.status_code == 200
+        report = response.json()
+        assert report["imported"] == 2
+        assert report["failed"] == 3
+        assert [error["line"] for error in report["errors"]] == [4, 5, 6]
+        assert "calories_100g" in report["errors"][1]["error"]
+        by_name = {p["product_name"]: p for p in products}
+        assert by_name["Oats"]["calories_100g"] == 380
+        assert by_name["Oats"]["is_favourite"] is True
+        assert by_name["Rice"]["calories_100g"] == 131
+        assert meal_data["calories"] == 760
+
+    async def test_import_fridge_products_jsonl(self, client_with_fridge, fridge):
+        body = (
+            '{"product_name": "Apple", "calories_100g": 52, "category": "fruits"}\n'
+            "not json\n"
+            "[1, 2]\n"
+        )
+
+        response = await client_with_fridge.post(
+            "/fridge/products/import",
+            params={"format": "jsonl"},
+            content=body.encode(),
+        )
+
+        report = response.json()
+        assert report["imported"] == 1
+        assert [error["line"] for error in report["errors"]] == [2, 3]
+
+    async def test_import_fridge_products_rejects_non_utf8(
+        self, client_with_fridge, fridge
+    ):
+        body = "product_name,calories_100g,category\nŻurek,60,soups\n"
+
+        response = await client_with_fridge.post(
+            "/fridge/products/import", content=body.encode("cp1250")
+        )
+        products = (await client_with_fridge.get("/fridge/products")).json()
+
+        assert response.status_code == 400
+        assert "UTF-8" in response.json()["message"]
+        assert products == []
+
+    async def test_import_fridge_products_rejects_overlong_line(
+        self, client_with_fridge, fridge, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "PRODUCT_IMPORT_MAX_LINE_LENGTH", 64)
+
+        response = await client_with_fridge.post(
+            "/fridge/products/import", content=b"product_name," + b"x" * 100
+        )
+
+        assert response.status_code == 400
+        assert "Line 1" in response.json()["message"]
+
+    async def test_export_fridge_products_round_trips(
+        self, client_with_fridge, session, fridge
+    ):
+        for i in range(3):
+            session.add(
+                FridgeProduct(
+                    fridge_id=fridge.id,
+                    product_name=f"Product {i}",
+                    calories_100g=100 + i,
+                    category=FoodCategory.SNACKS,
+                    is_favourite=i == 0,
+                )
+            )
+        await session.commit()
+
+        csv_export = await client_with_fridge.get("/fridge/products/export")
+        jsonl_export = await client_with_fridge.get(
+            "/fridge/products/export", params={"format": "jsonl"}
+        )
+        reimport = await client_with_fridge.post(
+            "/fridge/products/import", content=csv_export.content
+        )
+
+        assert csv_export.status_code == 200
+        assert csv_export.headers["content-type"].startswith("text/csv")
+        lines = csv_export.text.splitlines()
+        assert lines[0].startswith("product_name,calories_100g")
+        assert lines[1] == "Product 0,100.0,0.0,0.0,0.0,snacks,True"
+        assert len(jsonl_export.text.splitlines()) == 3
+        assert reimport.json() == {"imported": 3, "failed": 0, "errors": []}
+
+    # --- POST /fridge/products/from-catalog ---
+
+    async def test_add_fridge_product_from_catalog_follows_catalog(
+        self, client_with_fridge, catalog_product_factory
+    ):
+        oats = await catalog_product_factory("Oats", calories_100g=380, fats_100g=7)
+
+        response = await client_with_fridge.post(
+            "/fridge/products/from-catalog",
+            json={"catalog_product_id": oats.id, "fats_100g": 6.5},
+        )
+        listing = await client_with_fridge.get("/fridge/products")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["catalog_product_id"] == oats.id
+        assert data["product_name"] == "Oats"
+        assert data["category"] == "grains"
+        assert data["calories_100g"] == 380
+        assert data["fats_100g"] == 6.5
+        assert listing.json() == [data]
+
+    async def test_add_fridge_product_from_catalog_custom_name(
+        self, client_with_fridge, catalog_product_factory
+    ):
+        oats = await catalog_product_factory("Oats")
+        payload = {"catalog_product_id": oats.id, "product_name": "Breakfast oats"}
+
+        first = await client_with_fridge.post(
+            "/fridge/products/from-catalog", json=payload
+        )
+        duplicate = await client_with_fridge.post(
+            "/fridge/products/from-catalog", json=payload
+        )
+
+        assert first.json()["product_name"] == "Breakfast oats"
+        assert duplicate.status_code == 409
+
+    async def test_add_fridge_product_from_unknown_catalog_product(
+        self, client_with_fridge
+    ):
+        response = await client_with_fridge.post(
+            "/fridge/products/from-catalog", json={"catalog_product_id": 9999}
+        )
+        assert response.status_code == 404
+
+    async def test_update_catalog_linked_product_override(
+        self, client_with_fridge, catalog_product_factory
+    ):
+        oats = await catalog_product_factory("Oats", calories_100g=380)
+        created = await client_with_fridge.post(
+            "/fridge/products/from-catalog", json={"catalog_product_id": oats.id}
+        )
+        product_id = created.json()["id"]
+
+        overridden = await client_with_fridge.put(
+            f"/fridge/products/{product_id}", json={"calories_100g": 350}
+        )
+        cleared = await client_with_fridge.put(
+            f"/fridge/products/{product_id}", json={"calories_100g": None}
+        )
+
+        assert overridden.json()["calories_100g"] == 350
+        assert cleared.status_code == 200
+        assert cleared.json()["calories_100g"] == 380
+
+    async def test_clearing_value_of_unlinked_product_conflicts(
+        self, client_with_fridge, sample_fridge_product
+    ):
+        response = await client_with_fridge.put(
+            f"/fridge/products/{sample_fridge_product.id}",
+            json={"calories_100g": None},
+        )
+        assert response.status_code == 409
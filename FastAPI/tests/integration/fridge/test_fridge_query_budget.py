@@ -0,0 +1,107 @@
+import pytest
+
+
+@pytest.mark.integration
+class TestFridgeQueryBudget:
+    async def test_read_fridge_meals(
+        self, client_with_fridge, count_queries, sample_fridge_meal_with_ingredients
+    ):
+        with count_queries() as queries:
+            response = await client_with_fridge.get("/fridge/meals")
+
+        assert response.status_code == 200
+        assert len(queries) == 2
+
+    async def test_read_fridge_meal_macro(
+        self, client_with_fridge, count_queries, sample_fridge_meal_with_ingredients
+    ):
+        meal_id = sample_fridge_meal_with_ingredients.id
+        with count_queries() as queries:
+            response = await client_with_fridge.get(f"/fridge/meals/{meal_id}/macros")
+
+        assert response.status_code == 200
+        assert len(queries) == 1
+
+    async def test_read_fridge_meal_nutrient_sum(
+        self, client_with_fridge, count_queries, sample_fridge_meal_with_ingredients
+    ):
+        meal_id = sample_fridge_meal_with_ingredients.id
+        with count_queries() as queries:
+            response = await client_with_fridge.get(
+                f"/fridge/meals/{meal_id}/nutrients/calories"
+            )
+
+        assert response.status_code == 200
+        assert len(queries) == 1
+
+    async def test_read_fridge_meal_ingredients(
+        self, client_with_fridge, count_queries, sample_fridge_meal_with_ingredients
+    ):
+        meal_id = sample_fridge_meal_with_ingredients.id
+        with count_queries() as queries:
+            response = await client_with_fridge.get(
+                f"/fridge/meals/{meal_id}/ingredients"
+            )
+
+        assert response.status_code == 200
+        assert len(response.json()) == 3
+        assert len(queries) == 1
+
+    async def test_read_fridge_meal_ingredients_empty_meal(
+        self, client_with_fridge, count_queries, sample_fridge_meal
+    ):
+        with count_queries() as queries:
+            response = await client_with_fridge.get(
+                f"/fridge/meals/{sample_fridge_meal.id}/ingredients"
+            )
+
+        assert response.status_code == 200
+        assert response.json() == []
+        assert len(queries) == 1
+
+    async def test_add_fridge_meal_ingredient(
+        self,
+        client_with_fridge,
+        count_queries,
+        sample_fridge_meal,
+        sample_fridge_product,
+    ):
+        payload = {"weight": 50, "fridge_product_id": sample_fridge_product.id}
+        with count_queries() as queries:
+            response = await client_with_fridge.post(
+                f"/fridge/meals/{sample_fridge_meal.id}/ingredients", json=payload
+            )
+
+        assert response.status_code == 200
+        # insert, meal totals, ingredient read
+        assert len(queries) == 4
+
+    async def test_update_fridge_meal_ingredient(
+        self, client_with_fridge, count_queries, sample_fridge_meal_with_ingredient
+    ):
+        meal = sample_fridge_meal_with_ingredient
+        ingredient = meal.ingredients[0]
+        with count_queries() as queries:
+            response = await client_with_fridge.put(
+                f"/fridge/meals/{meal.id}/ingredients/{ingredient.id}",
+                json={"weight": 80},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["weight"] == 80
+        # update, meal totals
+        assert len(queries) == 3
+
+    async def test_delete_fridge_meal_ingredient(
+        self, client_with_fridge, count_queries, sample_fridge_meal_with_ingredient
+    ):
+        meal = sample_fridge_meal_with_ingredient
+        ingredient = meal.ingredients[0]
+        with count_queries() as queries:
+            response = await client_with_fridge.delete(
+                f"/fridge/meals/{meal.id}/ingredients/{ingredient.id}"
+            )
+
+        assert response.status_code == 200
+        # delete, tombstone, meal totals
+        assert len(queries) == 4
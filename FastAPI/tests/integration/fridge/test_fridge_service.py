@@ -10,6 +10,13 @@ from app.fridge.schemas import (
     FridgeProductCreate,
     FridgeProductUpdate,
 )
+from app.utils.enums import FileFormat
+
+
+def first_write(queries: list[str]) -> str:
+    return next(
+        q for q in queries if q.lstrip().startswith(("INSERT", "UPDATE", "DELETE"))
+    )
 
 
 @pytest.mark.integration
@@ -215,3 +222,119 @@ class TestFridgeService:
             await fridge_service.delete_fridge_meal_ingredient(
                 fridge.id, 9999, ingredient.id
             )
+
+    async def test_create_fridge_meal_with_ingredients_stores_totals(
+        self, fridge_service, fridge, sample_fridge_product
+    ):
+        data = FridgeMealWithIngredientsCreate(
+            name="Smoothie",
+            ingredients=[
+                FridgeMealIngredientCreate(
+                    weight=200, fridge_product_id=sample_fridge_product.id
+                )
+            ],
+        )
+
+        result = await fridge_service.create_fridge_meal_with_ingredients(
+            fridge.id, data
+        )
+
+        assert result.calories == 178
+        assert result.weight == 200
+        assert result.products_count == 1
+
+    async def test_meal_totals_follow_ingredient_changes(
+        self, fridge_service, fridge, sample_fridge_meal, sample_fridge_product
+    ):
+        ingredient = await fridge_service.add_fridge_meal_ingredient(
+            fridge.id,
+            sample_fridge_meal.id,
+            FridgeMealIngredientCreate(
+                weight=100, fridge_product_id=sample_fridge_product.id
+            ),
+        )
+        meal = await fridge_service.get_fridge_meal(fridge.id, sample_fridge_meal.id)
+        assert meal.calories == 89
+        assert meal.products_count == 1
+
+        await fridge_service.update_fridge_meal_ingredient(
+            fridge.id,
+            sample_fridge_meal.id,
+            ingredient.id,
+            FridgeMealIngredientUpdate(weight=200),
+        )
+        meal = await fridge_service.get_fridge_meal(fridge.id, sample_fridge_meal.id)
+        assert meal.calories == 178
+        assert meal.weight == 200
+
+        await fridge_service.delete_fridge_meal_ingredient(
+            fridge.id, sample_fridge_meal.id, ingredient.id
+        )
+        meal = await fridge_service.get_fridge_meal(fridge.id, sample_fridge_meal.id)
+        assert meal.calories == 0
+        assert meal.weight == 0
+        assert meal.products_count == 0
+
+    async def test_meal_totals_follow_product_changes(
+        self,
+        fridge_service,
+        fridge,
+        sample_fridge_meal_with_ingredient,
+        sample_fridge_product,
+    ):
+        meal_id = sample_fridge_meal_with_ingredient.id
+
+        await fridge_service.update_fridge_product(
+            fridge.id, sample_fridge_product.id, FridgeProductUpdate(calories_100g=200)
+        )
+        meals = await fridge_service.get_fridge_meals(fridge.id)
+        assert next(m for m in meals if m.id == meal_id).calories == 100
+
+        await fridge_service.delete_fridge_product(fridge.id, sample_fridge_product.id)
+        meals = await fridge_service.get_fridge_meals(fridge.id)
+        meal = next(m for m in meals if m.id == meal_id)
+        assert meal.calories == 0
+        assert meal.products_count == 0
+
+    async def test_write_paths_lock_fridge_first(
+        self,
+        fridge_service,
+        fridge,
+        count_queries,
+        sample_fridge_meal_with_ingredient,
+        sample_fridge_product,
+    ):
+        meal_id = sample_fridge_meal_with_ingredient.id
+        ingredient_id = sample_fridge_meal_with_ingredient.ingredients[0].id
+
+        async def lines():
+            yield '{"product_name": "Rye", "calories_100g": 330, "category": "grains"}'
+
+        writes = [
+            lambda: fridge_service.update_fridge_product(
+                fridge.id,
+                sample_fridge_product.id,
+                FridgeProductUpdate(calories_100g=120),
+            ),
+            lambda: fridge_service.update_fridge_meal(
+                fridge.id, meal_id, FridgeMealUpdate(name="late toast")
+            ),
+            lambda: fridge_service.update_fridge_meal_ingredient(
+                fridge.id, meal_id, ingredient_id, FridgeMealIngredientUpdate(weight=70)
+            ),
+            lambda: fridge_service.add_fridge_meal_ingredient(
+                fridge.id,
+                meal_id,
+                FridgeMealIngredientCreate(
+                    weight=10, fridge_product_id=sample_fridge_product.id
+                ),
+            ),
+            lambda: fridge_service.import_fridge_products(
+                fridge.id, lines(), FileFormat.JSONL
+            ),
+        ]
+        for write in writes:
+            with count_queries() as queries:
+                await write()
+
+            assert first_write(queries).lstrip().startswith("UPDATE fridges")
@@ -20,10 +20,12 @@ async def meal_service(session):
 
 @pytest_asyncio.fixture
 def meal_log_factory(session, user):
-    async def factory(weight, type, name, calories, proteins, fats, carbs):
+    async def factory(
+        weight, type, name, calories, proteins, fats, carbs, log_date=date(2022, 1, 1)
+    ):
         log = MealLog(
             user_id=user.id,
-            date=date(2022, 1, 1),
+            date=log_date,
             type=type,
             weight=weight,
             name=name,
@@ -1,3 +1,5 @@
+from datetime import date
+
 import pytest
 
 from app.fridge.models import FoodCategory
@@ -205,6 +207,138 @@ class TestMealEndpoints:
         assert data["name"] == new_name
         assert data["id"] == sample_meal_log.id
 
+    # --- POST /meals/bulk ---
+
+    async def test_add_meal_logs_bulk(self, client_with_fridge, fridge_product_factory):
+        product = await fridge_product_factory(
+            product_name="Apple",
+            calories_100g=50,
+            proteins_100g=0,
+            fats_100g=0,
+            carbs_100g=12,
+            category=FoodCategory.FRUIT,
+            is_favourite=False,
+        )
+        payload = {
+            "quick": [
+                {"date": "2022-01-01", "type": "snack", "weight": 30, "name": "Nuts"}
+            ],
+            "from_product": [
+                {
+                    "fridge_product_id": product.id,
+                    "date": "2022-01-02",
+                    "type": "snack",
+                    "weight": 200,
+                }
+            ],
+        }
+
+        response = await client_with_fridge.post("/meals/bulk", json=payload)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [log["name"] for log in data] == ["Nuts", "Apple"]
+        assert data[1]["calories"] == 100
+
+    async def test_add_meal_logs_bulk_unknown_meal(self, client_with_fridge):
+        payload = {
+            "from_meal": [
+                {
+                    "fridge_meal_id": 9999,
+                    "date": "2022-01-01",
+                    "type": "dinner",
+                    "weight": 100,
+                }
+            ]
+        }
+
+        response = await client_with_fridge.post("/meals/bulk", json=payload)
+
+        assert response.status_code == 404
+
+    # --- GET /meals ---
+
+    async def test_read_meal_logs_range(self, client, meal_log_factory):
+        for day in (1, 2, 3):
+            await meal_log_factory(
+                name=f"log{day}",
+                type=MealType.DINNER,
+                weight=100.0,
+                calories=100.0,
+                proteins=0,
+                fats=0,
+                carbs=0,
+                log_date=date(2022, 1, day),
+            )
+        params = {"date_from": "2022-01-01", "date_to": "2022-01-31", "limit": 2}
+
+        response = await client.get("/meals", params=params)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [log["date"] for log in data["items"]] == ["2022-01-01", "2022-01-02"]
+
+        response = await client.get(
+            "/meals", params={**params, "cursor": data["next_cursor"]}
+        )
+        data = response.json()
+        assert [log["date"] for log in data["items"]] == ["2022-01-03"]
+        assert data["next_cursor"] is None
+
+    async def test_read_meal_logs_range_invalid_cursor(self, client):
+        params = {
+            "date_from": "2022-01-01",
+            "date_to": "2022-01-31",
+            "cursor": "garbage",
+        }
+
+        response = await client.get("/meals", params=params)
+
+        assert response.status_code == 400
+
+    # --- GET /meals/{log_date}/summary ---
+
+    async def test_read_daily_summary(self, client):
+        for meal_type, calories in [("breakfast", 300), ("breakfast", 100)]:
+            payload = {
+                "date": "2022-01-01",
+                "type": meal_type,
+                "weight": 100,
+                "name": "log",
+                "calories": calories,
+            }
+            await client.post("/meals/quick", json=payload)
+
+        response = await client.get("/meals/2022-01-01/summary")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["calories"] == 400
+        assert data["meals"][0]["type"] == "breakfast"
+        assert data["meals"][0]["logs_count"] == 2
+
+    async def test_read_daily_summaries_range(self, client):
+        for day in ["2022-01-01", "2022-01-03", "2022-02-01"]:
+            payload = {
+                "date": day,
+                "type": "dinner",
+                "weight": 100,
+                "name": "log",
+                "calories": 100,
+            }
+            await client.post("/meals/quick", json=payload)
+
+        response = await client.get(
+            "/meals/summary",
+            params={"date_from": "2022-01-01", "date_to": "2022-01-31"},
+        )
+
+        assert response.status_code == 200
+        assert [day["date"] for day in response.json()] == [
+            "2022-01-01",
+            "2022-01-03",
+        ]
+
     # --- PUT /meals/{log_id}/weight ---
 
     async def test_update_meal_log_weight_recalculates_macros(
@@ -1,8 +1,10 @@
 from datetime import date
 
 import pytest
+from sqlalchemy import event
 
 from app.meal.models import MealType
+from app.meal.repositories import DailyNutritionTotalRepository
 
 
 @pytest.mark.integration
@@ -41,3 +43,31 @@ class TestMealRepository:
         assert result[0].name == "meal_log_1"
         assert result[1].name == "meal_log_2"
         assert result[2].name == "meal_log_3"
+
+    async def test_add_many_to_totals_upserts_in_key_order(self, session, user):
+        repo = DailyNutritionTotalRepository(session)
+        keys = [
+            (date(2022, 1, 2), MealType.LUNCH),
+            (date(2022, 1, 1), MealType.SNACK),
+            (date(2022, 1, 2), MealType.BREAKFAST),
+            (date(2022, 1, 1), MealType.DINNER),
+        ]
+        params = []
+
+        def capture(conn, cursor, statement, parameters, *args):
+            params.append(parameters)
+
+        bind = session.get_bind()
+        event.listen(bind, "before_cursor_execute", capture)
+        try:
+            await repo.add_many_to_totals(
+                [
+                    {"user_id": user.id, "date": d, "type": t, "calories": 10}
+                    for d, t in keys
+                ]
+            )
+        finally:
+            event.remove(bind, "before_cursor_execute", capture)
+
+        written = [p for p in params[0] if p in {t.name for _, t in keys}]
+        assert written == ["DINNER", "SNACK", "BREAKFAST", "LUNCH"]
@@ -2,9 +2,12 @@ from datetime import date
 
 import pytest
 
-from app.fridge.models import FoodCategory
+from app.core.exceptions import BadRequestError, NotFoundError
+from app.fridge.models import FoodCategory, FridgeProduct
 from app.meal.models import MealType
 from app.meal.schemas import (
+    MealLogBulkCreate,
+    MealLogFromMealCreate,
     MealLogFromProductCreate,
     MealLogQuickCreate,
 )
@@ -61,6 +64,35 @@ class TestMealService:
         assert result.proteins == 3.0
         assert result.carbs == 24.0
 
+    async def test_create_meal_log_from_catalog_linked_product(
+        self, meal_service, session, user, fridge, catalog_product_factory
+    ):
+        oats = await catalog_product_factory("Oats", calories_100g=380, fats_100g=7)
+        product = FridgeProduct(
+            fridge_id=fridge.id,
+            catalog_product_id=oats.id,
+            product_name="Oats",
+            category=FoodCategory.GRAINS,
+            fats_100g=6,
+        )
+        session.add(product)
+        await session.commit()
+        session.expunge(product)
+
+        result = await meal_service.create_meal_log_from_fridge_product(
+            user.id,
+            fridge.id,
+            MealLogFromProductCreate(
+                fridge_product_id=product.id,
+                date=date(2022, 1, 1),
+                type=MealType.BREAKFAST,
+                weight=50,
+            ),
+        )
+
+        assert result.calories == 190
+        assert result.fats == 3
+
     async def test_create_meal_log_from_fridge_product_rounding(
         self, meal_service, user, fridge, fridge_product_factory
     ):
@@ -161,3 +193,212 @@ class TestMealService:
         assert updated_log.proteins == 30.0
         assert updated_log.fats == 15.0
         assert updated_log.carbs == 45.0
+
+    async def test_daily_summary_follows_meal_log_writes(self, meal_service, user):
+        day = date(2022, 1, 1)
+        breakfast = await meal_service.create_meal_log_quick(
+            user.id,
+            MealLogQuickCreate(
+                date=day,
+                type=MealType.BREAKFAST,
+                weight=100,
+                name="Oats",
+                calories=380,
+                proteins=13,
+                fats=7,
+                carbs=60,
+            ),
+        )
+        await meal_service.create_meal_log_quick(
+            user.id,
+            MealLogQuickCreate(
+                date=day, type=MealType.LUNCH, weight=200, name="Soup", calories=120
+            ),
+        )
+
+        summary = await meal_service.get_daily_summary(user.id, day)
+        assert summary.calories == 500
+        assert [meal.type for meal in summary.meals] == [
+            MealType.BREAKFAST,
+            MealType.LUNCH,
+        ]
+
+        await meal_service.update_meal_log_weight(user.id, breakfast.id, 50)
+        summary = await meal_service.get_daily_summary(user.id, day)
+        assert summary.calories == 310
+        assert summary.meals[0].weight == 50
+        assert summary.meals[0].logs_count == 1
+
+        await meal_service.delete_meal_log(user.id, breakfast.id)
+        summary = await meal_service.get_daily_summary(user.id, day)
+        assert summary.calories == 120
+        assert [meal.type for meal in summary.meals] == [MealType.LUNCH]
+
+    async def test_daily_summary_empty_day(self, meal_service, user):
+        summary = await meal_service.get_daily_summary(user.id, date(2022, 1, 5))
+
+        assert summary.date == date(2022, 1, 5)
+        assert summary.calories == 0
+        assert summary.meals == []
+
+    async def test_get_meal_logs_range_pages_with_cursor(
+        self, meal_service, meal_log_factory, user
+    ):
+        for day in (3, 1, 2, 1, 20):
+            await meal_log_factory(
+                name=f"log{day}",
+                type=MealType.LUNCH if day != 2 else MealType.SNACK,
+                weight=100.0,
+                calories=100.0,
+                proteins=0,
+                fats=0,
+                carbs=0,
+                log_date=date(2022, 1, day),
+            )
+
+        first = await meal_service.get_meal_logs_range(
+            user.id, date(2022, 1, 1), date(2022, 1, 10), limit=2
+        )
+        second = await meal_service.get_meal_logs_range(
+            user.id,
+            date(2022, 1, 1),
+            date(2022, 1, 10),
+            cursor=first.next_cursor,
+            limit=2,
+        )
+
+        assert [log.date.day for log in first.items] == [1, 1]
+        assert first.items[0].id < first.items[1].id
+        assert [log.date.day for log in second.items] == [2, 3]
+        assert second.next_cursor is None
+
+        lunches = await meal_service.get_meal_logs_range(
+            user.id, date(2022, 1, 1), date(2022, 1, 10), MealType.LUNCH
+        )
+        assert [log.date.day for log in lunches.items] == [1, 1, 3]
+
+    async def test_get_meal_logs_range_invalid_cursor(self, meal_service, user):
+        with pytest.raises(BadRequestError):
+            await meal_service.get_meal_logs_range(
+                user.id, date(2022, 1, 1), date(2022, 1, 10), cursor="not-a-cursor"
+            )
+
+    async def test_create_meal_logs_from_fridge_meal_single_insert(
+        self,
+        meal_service,
+        session,
+        user,
+        fridge,
+        count_queries,
+        fridge_meal_factory,
+        fridge_product_factory,
+        fridge_meal_ingredient_factory,
+    ):
+        meal = await fridge_meal_factory("Stew")
+        for i in range(15):
+            product = await fridge_product_factory(
+                product_name=f"Ingredient{i}",
+                calories_100g=100,
+                proteins_100g=10,
+                fats_100g=10,
+                carbs_100g=10,
+                category=FoodCategory.VEGETABLE,
+                is_favourite=False,
+            )
+            await fridge_meal_ingredient_factory(meal=meal, weight=20, product=product)
+        data = MealLogFromMealCreate(
+            fridge_meal_id=meal.id,
+            date=date(2022, 1, 1),
+            type=MealType.DINNER,
+            weight=300,
+        )
+
+        with count_queries() as queries:
+            logs = await meal_service.create_meal_logs_from_fridge_meal(
+                user.id, fridge.id, data
+            )
+
+        assert len(logs) == 15
+        assert [log.name for log in logs] == [f"Ingredient{i}" for i in range(15)]
+        assert all(log.id is not None for log in logs)
+        inserts = [q for q in queries if q.startswith("INSERT INTO meal_logs")]
+        # SQLite has no sentinel to order a batched RETURNING by, so SQLAlchemy
+        # inserts row by row there
+        expected = 15 if session.get_bind().dialect.name == "sqlite" else 1
+        assert len(inserts) == expected
+        assert len(queries) == 4 + expected
+
+    async def test_create_meal_logs_bulk(
+        self,
+        meal_service,
+        user,
+        fridge,
+        fridge_meal_factory,
+        fridge_product_factory,
+        fridge_meal_ingredient_factory,
+    ):
+        product = await fridge_product_factory(
+            product_name="Rice",
+            calories_100g=130,
+            proteins_100g=2.7,
+            fats_100g=0.3,
+            carbs_100g=28,
+            category=FoodCategory.GRAINS,
+            is_favourite=False,
+        )
+        meal = await fridge_meal_factory("Rice bowl")
+        await fridge_meal_ingredient_factory(meal=meal, weight=200, product=product)
+        data = MealLogBulkCreate(
+            quick=[
+                MealLogQuickCreate(
+                    date=date(2022, 1, 1),
+                    type=MealType.BREAKFAST,
+                    weight=100,
+                    name="Yogurt",
+                    calories=60,
+                )
+            ],
+            from_product=[
+                MealLogFromProductCreate(
+                    fridge_product_id=product.id,
+                    date=date(2022, 1, 1),
+                    type=MealType.LUNCH,
+                    weight=100,
+                )
+            ],
+            from_meal=[
+                MealLogFromMealCreate(
+                    fridge_meal_id=meal.id,
+                    date=date(2022, 1, 2),
+                    type=MealType.DINNER,
+                    weight=50,
+                )
+            ],
+        )
+
+        logs = await meal_service.create_meal_logs_bulk(user.id, fridge.id, data)
+
+        assert [log.name for log in logs] == ["Yogurt", "Rice", "Rice"]
+        assert logs[1].calories == 130
+        assert logs[2].weight == 50
+        first_day = await meal_service.get_daily_summary(user.id, date(2022, 1, 1))
+        second_day = await meal_service.get_daily_summary(user.id, date(2022, 1, 2))
+        assert first_day.calories == 190
+        assert second_day.calories == 65
+
+    async def test_create_meal_logs_bulk_unknown_product(
+        self, meal_service, user, fridge
+    ):
+        data = MealLogBulkCreate(
+            from_product=[
+                MealLogFromProductCreate(
+                    fridge_product_id=9999,
+                    date=date(2022, 1, 1),
+                    type=MealType.LUNCH,
+                    weight=100,
+                )
+            ]
+        )
+
+        with pytest.raises(NotFoundError):
+            await meal_service.create_meal_logs_bulk(user.id, fridge.id, data)
@@ -34,14 +34,17 @@ class TestMeasurementRepository:
     async def test_get_measurements_list(
         self, measurements_repo, user, sample_measurements
     ):
-        result = await measurements_repo.get_measurements_list(user.id, 0, 10)
+        result = await measurements_repo.get_measurements_list(user.id, 10)
 
         assert result == sorted(sample_measurements, key=lambda w: w.date, reverse=True)
 
-    async def test_get_measurements_list_offset(
+    async def test_get_measurements_list_before(
         self, measurements_repo, user, sample_measurements
     ):
-        result = await measurements_repo.get_measurements_list(user.id, 1, 10)
+        latest = sample_measurements[2]
+        result = await measurements_repo.get_measurements_list(
+            user.id, 10, (latest.date, latest.id)
+        )
 
         assert (
             result
@@ -51,7 +54,7 @@ class TestMeasurementRepository:
     async def test_get_measurements_list_limit(
         self, measurements_repo, user, sample_measurements
     ):
-        result = await measurements_repo.get_measurements_list(user.id, 0, 2)
+        result = await measurements_repo.get_measurements_list(user.id, 2)
 
         assert (
             result
@@ -59,6 +62,6 @@ class TestMeasurementRepository:
         )
 
     async def test_get_measurements_list_no_weights(self, measurements_repo, user):
-        result = await measurements_repo.get_measurements_list(user.id, 0, 10)
+        result = await measurements_repo.get_measurements_list(user.id, 10)
 
         assert result == []
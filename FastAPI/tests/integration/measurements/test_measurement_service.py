@@ -2,6 +2,8 @@ import datetime as dt
 
 import pytest
 
+from app.core.config import settings
+from app.measurements.cache import MISSING, latest_weight_cache
 from app.measurements.schemas import MeasurementsCreate, WeightCreate
 
 
@@ -57,3 +59,33 @@ class TestMeasurementService:
         assert result.date == dt.date(2022, 1, 1)
         assert result.weight == 85
         assert result.user_id == user.id
+
+    async def test_replica_reads_cached_for_replica_lag_only(
+        self, weight_service, session, user, sample_weight, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "REPLICA_MAX_LAG_SECONDS", 0)
+        session.info["replica"] = True
+        try:
+            current = await weight_service.get_current_weight(user.id)
+        finally:
+            del session.info["replica"]
+
+        assert current.weight == 80
+        assert latest_weight_cache.get(user.id) is MISSING
+
+        await weight_service.get_current_weight(user.id)
+        assert latest_weight_cache.get(user.id).weight == 80
+
+    async def test_writes_refill_current_weight_cache(self, weight_service, user):
+        await weight_service.create_weight(
+            user.id, WeightCreate(date=dt.date(2024, 1, 1), weight=81)
+        )
+        assert latest_weight_cache.get(user.id).weight == 81
+
+        weight = await weight_service.create_weight(
+            user.id, WeightCreate(date=dt.date(2024, 2, 1), weight=79)
+        )
+        assert latest_weight_cache.get(user.id).weight == 79
+
+        await weight_service.delete_weight(user.id, weight.id)
+        assert latest_weight_cache.get(user.id).weight == 81
@@ -26,6 +26,16 @@ class TestMeasurementsEndpoints:
         assert data["calves"] is None
         assert data["hips"] is None
 
+    async def test_add_measurements_refreshes_current_weight(self, client_with_redis):
+        before = await client_with_redis.get("/weights/current")
+        await client_with_redis.post(
+            "/measurements", json={"weight": {"weight": 79}, "neck": 40}
+        )
+        after = await client_with_redis.get("/weights/current")
+
+        assert before.json() is None
+        assert after.json()["weight"] == 79
+
     async def test_add_measurements_no_auth(self, client_no_user):
         payload = {
             "weight": {"weight": 80},
@@ -136,12 +146,20 @@ class TestMeasurementsEndpoints:
     async def test_read_measurements_list_success(self, client, sample_measurements):
         response = await client.get("/measurements")
         assert response.status_code == 200
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
         assert len(data) == 3
         assert "id" in data[0]
         assert "neck" in data[0]
 
+    async def test_read_measurements_trend_head(self, client, sample_measurements):
+        response = await client.get("/measurements/trend-head")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [m["date"] for m in data] == ["2022-01-03", "2022-01-02"]
+        assert data[0]["weight"]["weight"] == 84
+
     async def test_read_measurements_list_no_auth(
         self, client_no_user, sample_measurements
     ):
@@ -151,7 +169,23 @@ class TestMeasurementsEndpoints:
     async def test_read_measurements_list_no_data(self, client):
         response = await client.get("/measurements")
         assert response.status_code == 200
-        assert response.json() == []
+        assert response.json() == {"items": [], "next_cursor": None}
+
+    async def test_read_measurements_list_pages_with_cursor(
+        self, client, sample_measurements
+    ):
+        first = await client.get("/measurements", params={"limit": 1})
+        rest = await client.get(
+            "/measurements", params={"cursor": first.json()["next_cursor"]}
+        )
+
+        assert [m["date"] for m in first.json()["items"]] == ["2022-01-03"]
+        assert [m["date"] for m in rest.json()["items"]] == [
+            "2022-01-02",
+            "2022-01-01",
+        ]
+        assert rest.json()["items"][0]["weight"]["weight"] == 82
+        assert rest.json()["next_cursor"] is None
 
     async def test_delete_measurement_success(self, client, sample_measurement):
         response = await client.delete(f"/measurements/{sample_measurement.id}")
@@ -27,6 +27,34 @@ class TestWeightEndpoints:
         assert data["weight"] == sample_weights[-1].weight
         assert data["date"] == str(sample_weights[-1].date)
 
+    async def test_read_current_weight_cached_until_write(
+        self, client_with_redis, sample_weights, count_queries
+    ):
+        await client_with_redis.get("/weights/current")
+        with count_queries() as queries:
+            cached = await client_with_redis.get("/weights/current")
+        await client_with_redis.post(
+            "/weights", json={"date": "2022-01-04", "weight": 86}
+        )
+        after_add = await client_with_redis.get("/weights/current")
+        await client_with_redis.delete(f"/weights/{after_add.json()['id']}")
+        after_delete = await client_with_redis.get("/weights/current")
+
+        assert queries == []
+        assert cached.json()["weight"] == 84
+        assert after_add.json()["weight"] == 86
+        assert after_delete.json()["weight"] == 84
+
+    async def test_read_weight_trend_head(self, client, sample_weights, count_queries):
+        with count_queries() as queries:
+            response = await client.get("/weights/trend-head")
+        everything = await client.get("/weights/trend-head", params={"limit": 10})
+
+        assert response.status_code == 200
+        assert [w["weight"] for w in response.json()] == [84, 82]
+        assert len(queries) == 1
+        assert [w["weight"] for w in everything.json()] == [84, 82, 80]
+
     async def test_read_current_weight_no_auth(self, client_no_user, sample_weight):
         response = await client_no_user.get("/weights/current")
 
@@ -93,9 +121,10 @@ class TestWeightEndpoints:
         response = await client.get("/weights")
 
         assert response.status_code == 200
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
         assert len(data) == 3
+        assert response.json()["next_cursor"] is None
 
         first = data[0]
         assert "id" in first
@@ -111,10 +140,28 @@ class TestWeightEndpoints:
         response = await client.get("/weights")
 
         assert response.status_code == 200
-        data = response.json()
+        data = response.json()["items"]
         assert isinstance(data, list)
         assert len(data) == 0
 
+    async def test_read_user_weights_pages_with_cursor(self, client, sample_weights):
+        first = await client.get("/weights", params={"limit": 2})
+        second = await client.get(
+            "/weights", params={"limit": 2, "cursor": first.json()["next_cursor"]}
+        )
+
+        assert [w["date"] for w in first.json()["items"]] == [
+            "2022-01-03",
+            "2022-01-02",
+        ]
+        assert [w["date"] for w in second.json()["items"]] == ["2022-01-01"]
+        assert second.json()["next_cursor"] is None
+
+    async def test_read_user_weights_invalid_cursor(self, client):
+        response = await client.get("/weights", params={"cursor": "not-a-cursor"})
+
+        assert response.status_code == 400
+
     async def test_delete_weight_route_success(self, client, sample_weight):
         response = await client.delete(f"/weights/{sample_weight.id}")
 
@@ -38,21 +38,22 @@ class TestWeightRepository:
         assert result is None
 
     async def test_get_weights(self, weight_repo, user, sample_weights):
-        result = await weight_repo.get_weights(user.id, 0, 10)
+        result = await weight_repo.get_weights(user.id, 10)
 
         assert result == sorted(sample_weights, key=lambda w: w.date, reverse=True)
 
-    async def test_get_weights_offset(self, weight_repo, user, sample_weights):
-        result = await weight_repo.get_weights(user.id, 1, 10)
+    async def test_get_weights_before(self, weight_repo, user, sample_weights):
+        latest = sample_weights[2]
+        result = await weight_repo.get_weights(user.id, 10, (latest.date, latest.id))
 
         assert result == sorted(sample_weights, key=lambda w: w.date, reverse=True)[1:]
 
     async def test_get_weights_limit(self, weight_repo, user, sample_weights):
-        result = await weight_repo.get_weights(user.id, 0, 2)
+        result = await weight_repo.get_weights(user.id, 2)
 
         assert result == sorted(sample_weights, key=lambda w: w.date, reverse=True)[:2]
 
     async def test_get_weights_no_weights(self, weight_repo, user):
-        result = await weight_repo.get_weights(user.id, 0, 10)
+        result = await weight_repo.get_weights(user.id, 10)
 
         assert result == []
@@ -0,0 +1,14 @@
+import pytest_asyncio
+
+from app.fridge.services import FridgeService
+from app.sync.services import SyncService
+
+
+@pytest_asyncio.fixture
+async def sync_service(session):
+    return SyncService(session)
+
+
+@pytest_asyncio.fixture
+async def fridge_service(session):
+    return FridgeService(session)
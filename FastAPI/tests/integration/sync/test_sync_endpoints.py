@@ -0,0 +1,32 @@
+import pytest
+
+
+@pytest.mark.integration
+class TestSyncEndpoints:
+    async def test_sync_round_trip(self, client_with_fridge):
+        first = await client_with_fridge.get("/sync")
+        assert first.status_code == 200
+        assert first.json()["full"] is True
+
+        response = await client_with_fridge.post(
+            "/weights", json={"date": "2024-01-01", "weight": 80}
+        )
+        weight_id = response.json()["id"]
+        await client_with_fridge.delete(f"/weights/{weight_id}")
+
+        delta = await client_with_fridge.get(
+            "/sync", params={"cursor": first.json()["cursor"]}
+        )
+        data = delta.json()
+
+        assert delta.status_code == 200
+        assert data["full"] is False
+        assert data["deleted"] == {"weights": [weight_id]}
+
+    async def test_sync_invalid_cursor(self, client_with_fridge):
+        response = await client_with_fridge.get("/sync", params={"cursor": "bad"})
+        assert response.status_code == 400
+
+    async def test_sync_no_auth(self, client_no_user):
+        response = await client_no_user.get("/sync")
+        assert response.status_code == 401
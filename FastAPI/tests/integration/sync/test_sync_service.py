@@ -0,0 +1,176 @@
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from app.core.config import settings
+from app.core.db import utc_now
+from app.core.exceptions import BadRequestError
+from app.fridge.models import FoodCategory
+from app.fridge.schemas import (
+    FridgeMealIngredientCreate,
+    FridgeMealWithIngredientsCreate,
+    FridgeProductCreate,
+    FridgeProductUpdate,
+)
+from app.meal.models import MealLog, MealType
+from app.measurements.models import Weight
+from app.utils.pagination import decode_sync_cursor, encode_sync_cursor
+
+
+def product_data(name: str) -> FridgeProductCreate:
+    return FridgeProductCreate(
+        product_name=name,
+        calories_100g=100,
+        proteins_100g=10,
+        fats_100g=5,
+        carbs_100g=20,
+        category=FoodCategory.GRAINS,
+    )
+
+
+@pytest.mark.integration
+class TestSyncService:
+    async def test_without_cursor_returns_full_snapshot(
+        self, sync_service, fridge_service, session, user, fridge
+    ):
+        await fridge_service.create_fridge_product(fridge.id, product_data("Rice"))
+        session.add(Weight(user_id=user.id, date=date(2024, 1, 1), weight=80))
+        await session.commit()
+
+        changes = await sync_service.get_changes(user.id, fridge.id)
+
+        assert changes.full is True
+        assert [p.product_name for p in changes.fridge_products] == ["Rice"]
+        assert [w.weight for w in changes.weights] == [80]
+        assert changes.deleted == {}
+
+    async def test_cursor_returns_only_changes(
+        self, sync_service, fridge_service, session, user, fridge
+    ):
+        rice = await fridge_service.create_fridge_product(
+            fridge.id, product_data("Rice")
+        )
+        oats = await fridge_service.create_fridge_product(
+            fridge.id, product_data("Oats")
+        )
+        log = MealLog(
+            user_id=user.id,
+            date=date(2024, 1, 1),
+            type=MealType.LUNCH,
+            weight=100,
+            name="Soup",
+            calories=100,
+        )
+        session.add(log)
+        await session.commit()
+        cursor = encode_sync_cursor(utc_now())
+
+        await fridge_service.update_fridge_product(
+            fridge.id, rice.id, FridgeProductUpdate(calories_100g=130)
+        )
+        meal = await fridge_service.create_fridge_meal_with_ingredients(
+            fridge.id,
+            FridgeMealWithIngredientsCreate(
+                name="Porridge",
+                ingredients=[
+                    FridgeMealIngredientCreate(weight=50, fridge_product_id=oats.id)
+                ],
+            ),
+        )
+        await fridge_service.add_fridge_meal_ingredient(
+            fridge.id,
+            meal.id,
+            FridgeMealIngredientCreate(weight=20, fridge_product_id=rice.id),
+        )
+        await session.delete(log)
+        await session.commit()
+
+        changes = await sync_service.get_changes(user.id, fridge.id, cursor)
+
+        assert changes.full is False
+        assert [p.id for p in changes.fridge_products] == [rice.id]
+        assert changes.fridge_products[0].calories_100g == 130
+        assert [m.name for m in changes.fridge_meals] == ["Porridge"]
+        assert sorted(i.weight for i in changes.fridge_meal_ingredients) == [20, 50]
+        assert changes.meal_logs == []
+        assert changes.deleted == {"meal_logs": [log.id]}
+
+    async def test_deletes_are_reported_as_tombstones(
+        self, sync_service, fridge_service, session, user, fridge
+    ):
+        rice = await fridge_service.create_fridge_product(
+            fridge.id, product_data("Rice")
+        )
+        oats = await fridge_service.create_fridge_product(
+            fridge.id, product_data("Oats")
+        )
+        meal = await fridge_service.create_fridge_meal_with_ingredients(
+            fridge.id,
+            FridgeMealWithIngredientsCreate(
+                name="Porridge",
+                ingredients=[
+                    FridgeMealIngredientCreate(weight=50, fridge_product_id=oats.id)
+                ],
+            ),
+        )
+        cursor = encode_sync_cursor(utc_now())
+
+        ingredients = await fridge_service.get_fridge_meal_ingredients(
+            fridge.id, meal.id
+        )
+        await fridge_service.delete_fridge_meal_ingredient(
+            fridge.id, meal.id, ingredients[0].id
+        )
+        fridge_id, user_id = fridge.id, user.id
+        rice_id, meal_id, ingredient_id = rice.id, meal.id, ingredients[0].id
+        # each request gets a fresh session in the app
+        session.expire_all()
+        await fridge_service.delete_fridge_product(fridge_id, rice_id)
+        await fridge_service.delete_fridge_meal(fridge_id, meal_id)
+
+        changes = await sync_service.get_changes(user_id, fridge_id, cursor)
+
+        assert changes.deleted == {
+            "fridge_meal_ingredients": [ingredient_id],
+            "fridge_products": [rice_id],
+            "fridge_meals": [meal_id],
+        }
+
+    async def test_other_users_changes_are_not_returned(
+        self, sync_service, session, user, other_user, fridge
+    ):
+        cursor = encode_sync_cursor(utc_now())
+        weight = Weight(user_id=other_user.id, date=date(2024, 1, 1), weight=70)
+        session.add(weight)
+        await session.commit()
+        await session.delete(weight)
+        await session.commit()
+
+        changes = await sync_service.get_changes(user.id, fridge.id, cursor)
+
+        assert changes.weights == []
+        assert changes.deleted == {}
+
+    async def test_expired_cursor_returns_full_snapshot(
+        self, sync_service, user, fridge
+    ):
+        cursor = encode_sync_cursor(datetime(2000, 1, 1, tzinfo=UTC))
+
+        changes = await sync_service.get_changes(user.id, fridge.id, cursor)
+
+        assert changes.full is True
+
+    async def test_next_cursor_overlaps_in_flight_writes(
+        self, sync_service, user, fridge
+    ):
+        overlap = timedelta(seconds=settings.SYNC_CURSOR_OVERLAP_SECONDS)
+        before = utc_now()
+
+        changes = await sync_service.get_changes(user.id, fridge.id)
+
+        since = decode_sync_cursor(changes.cursor)
+        assert before - overlap <= since <= utc_now() - overlap
+
+    async def test_invalid_cursor(self, sync_service, user, fridge):
+        with pytest.raises(BadRequestError):
+            await sync_service.get_changes(user.id, fridge.id, "not-a-cursor")
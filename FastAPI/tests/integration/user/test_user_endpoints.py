@@ -1,5 +1,12 @@
+import json
+from datetime import date
+
 import pytest
 
+from app.core.config import settings
+from app.meal.models import MealLog, MealType
+from app.measurements.models import Measurement, Weight
+
 
 @pytest.mark.integration
 class TestUserEndpoints:
@@ -86,3 +93,66 @@ class TestUserEndpoints:
         response = await client.put("/user/me/password", json=payload)
         print(response.json())
         assert response.status_code == 422
+
+    # --- GET /user/me/export ---
+
+    async def test_export_user_history_csv(self, client, session, user, other_user):
+        session.add_all(
+            [
+                MealLog(
+                    user_id=user.id,
+                    date=date(2022, 1, 2),
+                    type=MealType.LUNCH,
+                    weight=200,
+                    name="Soup",
+                    calories=120,
+                ),
+                Weight(user_id=user.id, date=date(2022, 1, 1), weight=80.5),
+                Weight(user_id=other_user.id, date=date(2022, 1, 1), weight=60),
+                Measurement(user_id=user.id, date=date(2022, 1, 1), waist=85),
+            ]
+        )
+        await session.commit()
+
+        response = await client.get("/user/me/export")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        assert 'filename="history.csv"' in response.headers["content-disposition"]
+        lines = response.text.splitlines()
+        assert lines[0].startswith("record,id,date,type,weight,name,calories")
+        assert lines[1].startswith("meal_log,")
+        assert ",2022-01-02,lunch,200.0,Soup,120.0," in lines[1]
+        assert lines[2].startswith("record,id,date,weight")
+        assert lines[3].startswith("weight,")
+        assert ",80.5," in lines[3]
+        assert lines[4].startswith("record,id,date,weight_id,neck")
+        assert lines[5].startswith("measurement,")
+        assert len(lines) == 6
+
+    async def test_export_user_history_jsonl_in_chunks(
+        self, client, session, user, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "HISTORY_EXPORT_CHUNK_SIZE", 2)
+        session.add_all(
+            Weight(user_id=user.id, date=date(2022, 1, day), weight=80 - day)
+            for day in (3, 1, 5, 2, 4)
+        )
+        await session.commit()
+
+        response = await client.get("/user/me/export", params={"format": "jsonl"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert {record["record"] for record in records} == {"weight"}
+        assert [record["date"] for record in records] == [
+            f"2022-01-0{day}" for day in range(1, 6)
+        ]
+        assert "user_id" not in records[0]
+
+    async def test_export_user_history_empty(self, client):
+        response = await client.get("/user/me/export", params={"format": "jsonl"})
+
+        assert response.status_code == 200
+        assert response.text == ""
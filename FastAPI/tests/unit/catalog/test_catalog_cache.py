@@ -0,0 +1,88 @@
+import pytest
+
+from app.catalog.cache import CatalogCache
+from app.catalog.schemas import CatalogProductRead
+from app.fridge.models import FoodCategory
+
+
+def make_product(
+    product_id: int, name: str, category: FoodCategory = FoodCategory.GRAINS
+) -> CatalogProductRead:
+    return CatalogProductRead(
+        id=product_id,
+        name=name,
+        calories_100g=100,
+        proteins_100g=10,
+        fats_100g=5,
+        carbs_100g=20,
+        category=category,
+    )
+
+
+@pytest.mark.unit
+class TestCatalogCache:
+    def test_replace_and_get(self):
+        cache = CatalogCache()
+        assert cache.loaded is False
+
+        cache.replace([make_product(1, "Oats"), make_product(2, "Rice")])
+
+        assert cache.loaded is True
+        assert cache.get(1).name == "Oats"
+        assert cache.get(3) is None
+        assert cache.stats() == {"size": 2, "loads": 1}
+
+    def test_products_sorted_by_name_and_filtered(self):
+        cache = CatalogCache()
+        cache.replace(
+            [
+                make_product(1, "rice"),
+                make_product(2, "Apple", FoodCategory.FRUIT),
+                make_product(3, "Oats"),
+            ]
+        )
+
+        assert [p.name for p in cache.products()] == ["Apple", "Oats", "rice"]
+        assert [p.name for p in cache.products(FoodCategory.FRUIT)] == ["Apple"]
+
+    def test_search_ranks_prefix_then_word_then_substring(self):
+        cache = CatalogCache()
+        cache.replace(
+            [
+                make_product(1, "Goats cheese"),
+                make_product(2, "Rolled oats"),
+                make_product(3, "Oats"),
+                make_product(4, "Oat milk"),
+                make_product(5, "Rice"),
+            ]
+        )
+
+        results = cache.search("OAT", limit=10)
+
+        assert [p.name for p in results] == [
+            "Oats",
+            "Oat milk",
+            "Rolled oats",
+            "Goats cheese",
+        ]
+        assert [p.name for p in cache.search("oat", limit=2)] == ["Oats", "Oat milk"]
+
+    def test_update_replaces_entry(self):
+        cache = CatalogCache()
+        cache.replace([make_product(1, "Oats")])
+
+        cache.update([make_product(1, "Porridge oats"), make_product(2, "Rice")])
+
+        assert cache.get(1).name == "Porridge oats"
+        assert [p.name for p in cache.search("porridge", limit=5)] == ["Porridge oats"]
+        assert cache.stats()["size"] == 2
+
+    def test_clear_marks_cold(self):
+        cache = CatalogCache()
+        cache.replace([make_product(1, "Oats")])
+
+        cache.clear()
+
+        assert cache.loaded is False
+        assert cache.get(1) is None
+        assert cache.search("oats", limit=5) == []
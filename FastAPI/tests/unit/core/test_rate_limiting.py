@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi_limiter import (
+    FastAPILimiter,
+    default_identifier,
+    http_default_callback,
+)
+from httpx import ASGITransport, AsyncClient
+
+from app.core.rate_limiting import (
+    AttemptLimiter,
+    LocalRateLimiter,
+    LocalSlidingWindow,
+    LocalTokenBucket,
+)
+
+
+class BrokenRedis:
+    def pipeline(self, transaction=True):
+        raise ConnectionError("redis down")
+
+    async def delete(self, key):
+        raise ConnectionError("redis down")
+
+
+class SlowRedis(BrokenRedis):
+    def pipeline(self, transaction=True):
+        return SlowPipeline()
+
+
+class SlowPipeline:
+    async def __aenter__(self):
+        await asyncio.sleep(1)
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.mark.unit
+class TestLocalSlidingWindow:
+    def test_counts_within_window(self):
+        window = LocalSlidingWindow()
+
+        assert window.hit("key", 5, 60) == (1, 0)
+        assert window.hit("key", 5, 60) == (2, 0)
+        assert window.hit("other", 5, 60) == (1, 0)
+
+    def test_expired_attempts_slide_out(self):
+        window = LocalSlidingWindow()
+        window.hit("key", 1, 0)
+
+        assert window.hit("key", 1, 0) == (1, 0)
+
+    def test_blocked_attempts_are_not_recorded(self):
+        window = LocalSlidingWindow()
+        window.hit("key", 1, 60)
+
+        attempts, retry_after = window.hit("key", 1, 60)
+        window.hit("key", 1, 60)
+
+        assert attempts == 2
+        assert 0 < retry_after <= 60
+        assert window.hit("key", 1, 60)[0] == 2
+
+    def test_clear(self):
+        window = LocalSlidingWindow()
+        window.hit("key", 5, 60)
+        window.clear("key")
+
+        assert window.hit("key", 5, 60)[0] == 1
+
+
+@pytest.mark.unit
+class TestAttemptLimiter:
+    async def test_falls_back_to_local_counter_on_redis_error(self):
+        limiter = AttemptLimiter("test", max_attempts=1, window_seconds=60)
+
+        await limiter.hit("alice", BrokenRedis())
+        with pytest.raises(HTTPException):
+            await limiter.hit("alice", BrokenRedis())
+
+        await limiter.clear("alice", BrokenRedis())
+        await limiter.hit("alice", BrokenRedis())
+
+    async def test_falls_back_to_local_counter_on_slow_redis(self):
+        limiter = AttemptLimiter(
+            "test", max_attempts=1, window_seconds=60, redis_timeout=0.01
+        )
+
+        await limiter.hit("alice", SlowRedis())
+        with pytest.raises(HTTPException):
+            await limiter.hit("alice", SlowRedis())
+
+
+class CountingLimiter(LocalRateLimiter):
+    def __init__(self, *args, redis_pexpire=0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.redis_pexpire = redis_pexpire
+        self.redis_checks = 0
+
+    async def _check(self, key):
+        self.redis_checks += 1
+        return self.redis_pexpire
+
+
+@pytest.fixture
+def limited_client(monkeypatch):
+    monkeypatch.setattr(FastAPILimiter, "redis", object())
+    monkeypatch.setattr(FastAPILimiter, "prefix", "test")
+    monkeypatch.setattr(FastAPILimiter, "identifier", default_identifier)
+    monkeypatch.setattr(FastAPILimiter, "http_callback", http_default_callback)
+
+    def make(limiter):
+        app = FastAPI()
+
+        @app.get("/limited", dependencies=[Depends(limiter)])
+        async def limited():
+            return {}
+
+        return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+    return make
+
+
+@pytest.mark.unit
+class TestLocalRateLimiter:
+    def test_token_bucket_refills(self):
+        bucket = LocalTokenBucket(capacity=2, refill_per_second=1, now=0)
+
+        assert bucket.take(0) == 0
+        assert bucket.take(0) == 0
+        assert bucket.take(0) == 1000
+        assert bucket.take(1.5) == 0
+
+    async def test_syncs_only_on_first_hit_and_near_threshold(self, limited_client):
+        limiter = CountingLimiter(
+            times=10, seconds=60, sync_seconds=60, sync_ratio=0.45
+        )
+        async with limited_client(limiter) as client:
+            statuses = [(await client.get("/limited")).status_code for _ in range(15)]
+
+        assert statuses == [200] * 10 + [429] * 5
+        # first hit, then hits leaving 4 or fewer tokens
+        assert limiter.redis_checks == 1 + 5
+
+    async def test_redis_block_drains_local_bucket(self, limited_client):
+        limiter = CountingLimiter(times=10, seconds=60, redis_pexpire=30000)
+        async with limited_client(limiter) as client:
+            first = await client.get("/limited")
+            second = await client.get("/limited")
+
+        assert first.status_code == 429
+        assert second.status_code == 429
+        assert limiter.redis_checks == 1
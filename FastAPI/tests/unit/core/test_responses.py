@@ -0,0 +1,40 @@
+import datetime
+import json
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from app.core.responses import FastJSONResponse, model_list_response
+
+
+class Row:
+    def __init__(self, id, day):
+        self.id = id
+        self.day = day
+        self.secret = "hidden"
+
+
+class RowRead(BaseModel):
+    id: int
+    day: datetime.date
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+@pytest.mark.unit
+class TestResponses:
+    def test_fast_json_response_renders_like_json_response(self):
+        content = {"name": "żurek", "values": [1, 2.5, None], "ok": True}
+
+        assert json.loads(FastJSONResponse(content).body) == content
+
+    def test_model_list_response_dumps_attributes(self):
+        rows = [Row(1, datetime.date(2024, 1, 1)), Row(2, datetime.date(2024, 1, 2))]
+
+        response = model_list_response(RowRead, rows)
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == [
+            {"id": 1, "day": "2024-01-01"},
+            {"id": 2, "day": "2024-01-02"},
+        ]
@@ -1,17 +1,25 @@
+import asyncio
+import threading
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
 
 import pytest
 from jose import jwt
 
+from app.core import security
 from app.core.config import settings
-from app.core.exceptions import UnauthorizedError
+from app.core.exceptions import TooManyRequestsError, UnauthorizedError
 from app.core.security import (
+    PasswordHashingExecutor,
+    TokenPayloadCache,
     create_access_token,
     create_refresh_token,
     get_hashed_password,
     get_token_payload,
+    hash_password,
     verify_password,
+    verify_password_async,
 )
 
 
@@ -63,3 +71,62 @@ class TestSecurity:
 
         with pytest.raises(UnauthorizedError, match="Invalid or expired token"):
             get_token_payload(expired_token)
+
+    async def test_hash_password_async_roundtrip(self):
+        hashed_password = await hash_password("password1")
+
+        assert await verify_password_async("password1", hashed_password)
+        assert not await verify_password_async("password2", hashed_password)
+
+    async def test_password_hashing_executor_rejects_when_saturated(self):
+        executor = PasswordHashingExecutor(max_workers=1, max_pending=0)
+        release = threading.Event()
+        task = asyncio.create_task(executor.run(release.wait))
+        await asyncio.sleep(0)
+
+        with pytest.raises(TooManyRequestsError):
+            await executor.run(lambda: None)
+
+        release.set()
+        assert await task is True
+        assert executor.in_flight == 0
+        executor.shutdown()
+
+    def test_token_payload_cache_hit(self):
+        cache = TokenPayloadCache(max_size=10)
+        token = create_access_token("testuser", 123)
+        payload = get_token_payload(token)
+
+        cache.set(token, payload)
+        cached = cache.get(token)
+        cached["id"] = 999
+
+        assert cache.get(token) == payload
+        assert cache.stats() == {"size": 1, "hits": 2, "misses": 0}
+
+    def test_token_payload_cache_honours_exp(self):
+        cache = TokenPayloadCache(max_size=10)
+        cache.set("token", {"sub": "test", "exp": time.time() - 1})
+
+        assert cache.get("token") is None
+        assert cache.stats()["size"] == 0
+
+    def test_token_payload_cache_evicts_oldest(self):
+        cache = TokenPayloadCache(max_size=2)
+        expires = time.time() + 60
+        for token in ("a", "b", "c"):
+            cache.set(token, {"exp": expires})
+
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+
+    def test_get_token_payload_skips_decode_for_cached_token(self, monkeypatch):
+        token = create_access_token("testuser", 123)
+        get_token_payload(token)
+        calls = []
+        monkeypatch.setattr(security, "decode_token", lambda t: calls.append(t) or {})
+
+        payload = get_token_payload(token)
+
+        assert payload["id"] == 123
+        assert calls == []
@@ -0,0 +1,58 @@
+from datetime import date
+
+import pytest
+
+from app.measurements.cache import MISSING, LatestWeightCache
+from app.measurements.schemas import WeightRead
+
+
+def make_weight(weight_id: int, weight: float = 80) -> WeightRead:
+    return WeightRead(id=weight_id, date=date(2022, 1, weight_id), weight=weight)
+
+
+@pytest.mark.unit
+class TestLatestWeightCache:
+    def test_get_miss_then_hit(self):
+        cache = LatestWeightCache(max_size=10, ttl_seconds=60)
+
+        assert cache.get(1) is MISSING
+        cache.set(1, make_weight(1), cache.invalidations)
+
+        assert cache.get(1).weight == 80
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    def test_caches_users_without_weight(self):
+        cache = LatestWeightCache(max_size=10, ttl_seconds=60)
+
+        cache.set(1, None, cache.invalidations)
+
+        assert cache.get(1) is None
+
+    def test_set_skipped_after_concurrent_invalidation(self):
+        cache = LatestWeightCache(max_size=10, ttl_seconds=60)
+        seen = cache.invalidations
+
+        cache.invalidate(1)
+        cache.set(1, make_weight(1), seen)
+
+        assert cache.get(1) is MISSING
+
+    def test_expired_entry_is_a_miss(self):
+        cache = LatestWeightCache(max_size=10, ttl_seconds=-1)
+
+        cache.set(1, make_weight(1), cache.invalidations)
+
+        assert cache.get(1) is MISSING
+        assert cache.stats()["size"] == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = LatestWeightCache(max_size=2, ttl_seconds=60)
+        for user_id in (1, 2):
+            cache.set(user_id, make_weight(user_id), cache.invalidations)
+        cache.get(1)
+
+        cache.set(3, make_weight(3), cache.invalidations)
+
+        assert cache.get(2) is MISSING
+        assert cache.get(1) is not MISSING
+        assert cache.get(3) is not MISSING
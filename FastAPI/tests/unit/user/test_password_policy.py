@@ -0,0 +1,59 @@
+import pytest
+
+from app.core.exceptions import UnprocessableEntityError
+from app.core.security import PasswordHashingExecutor
+from app.user.password_policy import MAX_SCORED_LENGTH, PasswordPolicyService
+
+
+@pytest.fixture
+def policy():
+    executor = PasswordHashingExecutor(max_workers=1, max_pending=1)
+    yield PasswordPolicyService(executor, max_size=2, ttl_seconds=60)
+    executor.shutdown()
+
+
+@pytest.mark.unit
+class TestPasswordPolicyService:
+    async def test_check_strong_password(self, policy):
+        await policy.check("HF&6VJF7fas98*8")
+
+        assert policy.stats()["misses"] == 1
+
+    async def test_check_weak_password(self, policy):
+        with pytest.raises(UnprocessableEntityError, match="too weak"):
+            await policy.check("12345678")
+
+    async def test_repeated_check_is_memoized(self, policy):
+        for _ in range(3):
+            with pytest.raises(UnprocessableEntityError):
+                await policy.check("12345678")
+
+        stats = policy.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert stats["max_ms"] > 0
+
+    async def test_expired_result_is_scored_again(self, policy):
+        policy.ttl_seconds = -1
+
+        await policy.check("HF&6VJF7fas98*8")
+        await policy.check("HF&6VJF7fas98*8")
+
+        assert policy.stats()["misses"] == 2
+
+    async def test_oldest_result_evicted(self, policy):
+        for password in ("HF&6VJF7fas98*8", "Zq!9wLr#2mPx$7", "Tn@4vBk^8sYe&1"):
+            await policy.check(password)
+
+        await policy.check("HF&6VJF7fas98*8")
+
+        assert policy.stats()["size"] == 2
+        assert policy.stats()["misses"] == 4
+
+    async def test_long_input_is_capped(self, policy):
+        prefix = "HF&6VJF7fas98*8" * 5
+
+        await policy.check(prefix[:MAX_SCORED_LENGTH] + "a" * 10_000)
+        await policy.check(prefix[:MAX_SCORED_LENGTH] + "b" * 10_000)
+
+        assert policy.stats()["misses"] == 1
@@ -0,0 +1,69 @@
+import pytest
+
+from app.models import Fridge, User
+from app.user.cache import UserCache
+
+
+def make_user(user_id: int, username: str = "testuser") -> User:
+    return User(
+        id=user_id,
+        username=username,
+        email=f"{username}@example.com",
+        hashed_password="hashed",
+    )
+
+
+@pytest.mark.unit
+class TestUserCache:
+    def test_get_miss_then_hit(self):
+        cache = UserCache(max_size=10, ttl_seconds=60)
+
+        assert cache.get(1) is None
+        cache.set(make_user(1))
+        result = cache.get(1)
+
+        assert result.id == 1
+        assert result.username == "testuser"
+        assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    def test_get_returns_new_instance(self):
+        cache = UserCache(max_size=10, ttl_seconds=60)
+        cache.set(make_user(1))
+
+        assert cache.get(1) is not cache.get(1)
+
+    def test_expired_entry_is_miss(self):
+        cache = UserCache(max_size=10, ttl_seconds=0)
+        cache.set(make_user(1))
+
+        assert cache.get(1) is None
+        assert cache.stats()["size"] == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = UserCache(max_size=2, ttl_seconds=60)
+        cache.set(make_user(1, "user1"))
+        cache.set(make_user(2, "user2"))
+        cache.get(1)
+        cache.set(make_user(3, "user3"))
+
+        assert cache.get(2) is None
+        assert cache.get(1) is not None
+        assert cache.get(3) is not None
+
+    def test_invalidate(self):
+        cache = UserCache(max_size=10, ttl_seconds=60)
+        cache.set(make_user(1))
+        cache.invalidate(1)
+
+        assert cache.get(1) is None
+
+    def test_keeps_fridge_identity(self):
+        cache = UserCache(max_size=10, ttl_seconds=60)
+        user = make_user(1)
+        user.fridge = Fridge(id=5, user_id=1)
+        cache.set(user)
+
+        result = cache.get(1)
+
+        assert result.fridge.id == 5
+        assert result.fridge.user_id == 1
@@ -0,0 +1,40 @@
+import pytest
+
+from app.core.exceptions import BadRequestError
+from app.utils.streaming import iter_lines
+
+
+async def chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+async def collect(*parts: bytes, max_line_length: int = 100) -> list[str]:
+    return [line async for line in iter_lines(chunks(*parts), max_line_length)]
+
+
+@pytest.mark.unit
+class TestIterLines:
+    async def test_splits_lines_across_chunks(self):
+        assert await collect(b"a,b\r\nc", b",d\n", b"e") == ["a,b", "c,d", "e"]
+
+    async def test_decodes_multibyte_characters_split_between_chunks(self):
+        encoded = "żurek\n".encode()
+
+        assert await collect(encoded[:1], encoded[1:]) == ["żurek"]
+
+    async def test_strips_byte_order_mark(self):
+        assert await collect(b"\xef\xbb\xbfname\n") == ["name"]
+
+    async def test_rejects_invalid_utf8(self):
+        latin1 = "name\nżurek\n".encode("cp1250")
+
+        with pytest.raises(BadRequestError, match="not valid UTF-8"):
+            await collect(latin1)
+
+    async def test_rejects_overlong_line(self):
+        with pytest.raises(BadRequestError, match="Line 2 is longer than 8"):
+            await collect(b"short\n", b"x" * 5, b"x" * 5, max_line_length=8)
+
+    async def test_line_at_limit_is_accepted(self):
+        assert await collect(b"x" * 8, b"\n", max_line_length=8) == ["x" * 8]
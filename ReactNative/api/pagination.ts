@@ -0,0 +1,21 @@
+import { api } from "@/api/axiosInstance";
+
+export interface Page<T> {
+  items: T[];
+  next_cursor: string | null;
+}
+
+const PAGE_SIZE = 500;
+
+export async function fetchAllPages<T>(url: string): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const params: Record<string, string | number> = { limit: PAGE_SIZE };
+    if (cursor) params.cursor = cursor;
+    const response = await api.get<Page<T>>(url, { params });
+    items.push(...response.data.items);
+    cursor = response.data.next_cursor;
+  } while (cursor);
+  return items;
+}
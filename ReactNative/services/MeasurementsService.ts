@@ -1,4 +1,5 @@
 import {api} from "@/api/axiosInstance";
+import {fetchAllPages} from "@/api/pagination";
 import {Weight, WeightCreate} from "@/services/weightService";
 
 export interface Measurement {
@@ -32,8 +33,7 @@ const MeasurementsService = {
   },
 
   async getUserMeasurements() {
-    const response = await api.get("/measurements");
-    return response.data;
+    return fetchAllPages<Measurement>("/measurements");
   },
 
   async getLatestMeasurement() {
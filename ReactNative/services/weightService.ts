@@ -1,4 +1,5 @@
 import { api } from "@/api/axiosInstance";
+import { fetchAllPages } from "@/api/pagination";
 
 export interface Weight {
   id: number,
@@ -17,8 +18,7 @@ const weightService = {
   },
 
   async getUserWeights() {
-    const response = await api.get("/weights");
-    return response.data;
+    return fetchAllPages<Weight>("/weights");
   },
 
   async deleteWeight(id: number) {